@@ -1,3 +1,5 @@
+import os
+
 #API Configuration
 
 #Default headers for external API requests
@@ -5,3 +7,25 @@
 API_HEADERS = {
     "User-Agent": "BookOn/1.0 (Educational project; https://github.com/zxopink/bookon)"
 }
+
+#Open Library servers, overridable to point at a local stand-in (see benchmarks/fake_openlibrary.py)
+OPENLIBRARY_URL = os.getenv("OPENLIBRARY_URL", "https://openlibrary.org").rstrip("/")
+OPENLIBRARY_COVERS_URL = os.getenv("OPENLIBRARY_COVERS_URL", "https://covers.openlibrary.org").rstrip("/")
+
+
+#Cache Configuration (seconds)
+
+#Found books, authors and search results
+CACHE_TTL_SECONDS = 3600
+#Works/authors that Open Library says do not exist, and empty search results
+NOT_FOUND_CACHE_TTL_SECONDS = 300
+#Upstream failures (timeouts, 5xx), kept just long enough to not hammer Open Library
+UPSTREAM_ERROR_CACHE_TTL_SECONDS = 5
+
+
+#Cover Cache Configuration
+
+#Where proxied cover images are stored on disk
+COVER_CACHE_DIR = os.getenv("COVER_CACHE_DIR", os.path.join(os.path.dirname(__file__), "cover_cache"))
+#Least recently used covers are evicted past this size (256MB by default)
+COVER_CACHE_MAX_BYTES = int(os.getenv("COVER_CACHE_MAX_BYTES", 256 * 1024 * 1024))
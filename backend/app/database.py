@@ -1,8 +1,12 @@
 import psycopg
 from psycopg.sql import SQL
 from psycopg.rows import dict_row
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 import os
-from typing import Optional, Any, List, Dict, Tuple
+import threading
+import uuid
+from typing import Optional, Any, List, Dict, Tuple, Iterator
 from contextlib import contextmanager
 
 # Get database connection string from environment
@@ -13,9 +17,64 @@ if not DATABASE_URL:
 if DATABASE_URL.startswith("postgresql+psycopg://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql+psycopg://", "postgresql://")
 
-print(f"[DEBUG] Using DATABASE_URL: {DATABASE_URL}")
+#Never print the password, and only when asked to (every worker imports this module)
+if os.getenv("BOOKON_DEBUG"):
+    print(f"[DEBUG] Using DATABASE_URL: {make_conninfo(DATABASE_URL, password='***')}")
+
+
+#Connection pool, so connections (and the statements prepared on them) are reused between requests
+#Opened lazily per process: gunicorn forks workers from the master and connections can't cross a fork
+#The WEB_CONCURRENCY workers share a budget of DB_MAX_CONNECTIONS (under Postgres' default
+#max_connections of 100), each worker also holds one LISTEN connection (see read_list_feed_service)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 80))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", DB_MAX_CONNECTIONS // WEB_CONCURRENCY - 1))
+DB_POOL_MIN_SIZE = min(int(os.getenv("DB_POOL_MIN_SIZE", 1)), DB_POOL_MAX_SIZE)
+#Seconds to wait for a pooled connection before raising PoolTimeout, short so a database outage
+#fails requests quickly instead of holding them (and the event loop of async routes)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 5))
+
+#Fail at start-up rather than running out of connections under load
+if DB_POOL_MAX_SIZE < 1 or (DB_POOL_MAX_SIZE + 1) * WEB_CONCURRENCY > DB_MAX_CONNECTIONS:
+    raise ValueError(f"{WEB_CONCURRENCY} workers with pools of {DB_POOL_MAX_SIZE} connections (plus 1 listener each) "
+                     f"don't fit in DB_MAX_CONNECTIONS={DB_MAX_CONNECTIONS}, "
+                     f"lower WEB_CONCURRENCY or DB_POOL_MAX_SIZE, or raise DB_MAX_CONNECTIONS")
+
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ConnectionPool(DATABASE_URL, min_size=DB_POOL_MIN_SIZE, max_size=DB_POOL_MAX_SIZE,
+                                   timeout=DB_POOL_TIMEOUT, open=True)
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = None
+
+
+#Commits when the block succeeds, rolls back otherwise
+#timeout overrides DB_POOL_TIMEOUT, for reads that are only worth a short wait
 @contextmanager
-def get_connection():
+def get_connection(timeout: Optional[float] = None):
+    with _get_pool().connection(timeout=timeout) as conn:
+        yield conn
+
+
+#A connection of its own, closed at the end of the block
+#For session state that must not leak back into the pool (e.g. session advisory locks)
+@contextmanager
+def get_direct_connection():
     conn = psycopg.connect(DATABASE_URL)
     try:
         yield conn
@@ -27,39 +86,56 @@ def get_connection():
         conn.close()
 
 
-def execute_query(query: SQL, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
-    with get_connection() as conn:
+#prepare=True makes Postgres parse and plan the statement once per connection instead of on every call,
+#use it for fixed hot queries (psycopg also prepares any query automatically after a few executions)
+def execute_query(query: SQL, params: Optional[Tuple] = None, prepare: Optional[bool] = None,
+                  timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    with get_connection(timeout) as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(query, params or ())  
+            cur.execute(query, params or (), prepare=prepare)
             return cur.fetchall()
 
 
-def execute_one(query: SQL, params: Optional[Tuple] = None) -> Optional[Dict[str, Any]]:
-    with get_connection() as conn:
+def execute_one(query: SQL, params: Optional[Tuple] = None, prepare: Optional[bool] = None,
+                timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    with get_connection(timeout) as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(query, params or ())  
+            cur.execute(query, params or (), prepare=prepare)
             return cur.fetchone()
 
 
-def execute_command(query: SQL, params: Optional[Tuple] = None) -> int:
+def execute_command(query: SQL, params: Optional[Tuple] = None, prepare: Optional[bool] = None) -> int:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(query, params or ())  
+            cur.execute(query, params or (), prepare=prepare)
             return cur.rowcount
 
 
+#Streams a large result set with a server-side cursor, fetching batch_size rows per round-trip
+#instead of loading every row in memory at once. The cursor name is unique so streams never clash
+def iterate_query(query: SQL, params: Optional[Tuple] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    with get_connection() as conn:
+        with conn.cursor(name=f"bookon_stream_{uuid.uuid4().hex}", row_factory=dict_row) as cur:
+            cur.itersize = batch_size
+            cur.execute(query, params or ())
+            yield from cur
+
+
+#executemany pipelines the statements on its own: one round-trip for the batch
 def execute_many(query: SQL, params_list: List[Tuple]) -> int:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.executemany(query, params_list)  
+            cur.executemany(query, params_list)
             return cur.rowcount
 
 
-def execute_transaction(queries: List[Tuple[SQL, Optional[Tuple]]]) -> bool:    
+#Pipeline mode: all the statements are sent without waiting for each result, one round-trip for the batch
+def execute_transaction(queries: List[Tuple[SQL, Optional[Tuple]]]) -> bool:
     with get_connection() as conn:
-        with conn.cursor() as cur:
-            for query, params in queries:
-                cur.execute(query, params or ())  
+        with conn.pipeline():
+            with conn.cursor() as cur:
+                for query, params in queries:
+                    cur.execute(query, params or ())
     return True
 
 
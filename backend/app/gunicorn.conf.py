@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+import time
+
+#Production server: gunicorn managing uvicorn workers
+#Usage (from backend/app): gunicorn -c gunicorn.conf.py main:app
+#Every setting can be overridden with the environment variables below
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+#Each worker needs its pool (at least one connection) and its listener connection, so the default
+#is capped to what fits in DB_MAX_CONNECTIONS; an explicit WEB_CONCURRENCY that doesn't fit fails at start-up (see database.py)
+_connections_per_worker = int(os.getenv("DB_POOL_MAX_SIZE", 1)) + 1
+_max_workers = max(1, int(os.getenv("DB_MAX_CONNECTIONS", 80)) // _connections_per_worker)
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, _max_workers)))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+#Import the app once in the master, workers are forked from it (faster start, shared memory pages)
+preload_app = True
+
+#Give in-flight requests time to finish on shutdown/reload
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("WORKER_TIMEOUT", 60))
+keepalive = int(os.getenv("KEEPALIVE", 5))
+
+#Recycle workers after some requests (with jitter so they don't all restart together), caps memory growth
+max_requests = int(os.getenv("MAX_REQUESTS", 5000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 500))
+
+accesslog = os.getenv("ACCESS_LOG", None)
+errorlog = "-"
+
+#Workers size their database pools from it (see database.py)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+#Workers must not migrate, it's done once below before any of them starts (inherited by the forked workers)
+os.environ["BOOKON_SKIP_MIGRATIONS"] = "1"
+
+_started_at = time.perf_counter()
+
+
+def on_starting(server):
+    #Runs once in the master, before the workers are forked
+    from migrations import prepare_database
+    from database import close_pool
+    prepare_database()
+    #Workers open their own connection pools, none may be inherited from the master
+    close_pool()
+
+
+def when_ready(server):
+    server.log.info(f"Cold start: master ready in {(time.perf_counter() - _started_at) * 1000:.0f}ms")
@@ -1,22 +1,34 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
 from fastapi.staticfiles import StaticFiles
 
 from routes.book_routes import router as book_router
 from routes.read_list_routes import router as read_list_router
-from services.read_list_service import init_read_list_table
+from routes.cover_routes import router as cover_router
+from services.read_list_feed_service import run_change_listener, run_change_pruner
+from migrations import prepare_database
+from database import close_pool
 
 
 #on app startup and shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    #Startup: Initialize database tables
-    init_read_list_table()
+    #Startup: Migrate the database, unless the production server already did it once for all workers
+    if not os.getenv("BOOKON_SKIP_MIGRATIONS"):
+        prepare_database()
+    #Push reading list changes to connected clients
+    change_listener = asyncio.create_task(run_change_listener())
+    #Keep the change log bounded while the server runs
+    change_pruner = asyncio.create_task(run_change_pruner())
     yield
     #Shutdown: cleanup if needed
+    change_listener.cancel()
+    change_pruner.cancel()
+    close_pool()
 
 
 app = FastAPI(title="BookOn API", version="1.0.0", lifespan=lifespan)
@@ -28,11 +40,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Reading-List-Version"],
 )
 
 #Include routers
 app.include_router(book_router)
 app.include_router(read_list_router)
+app.include_router(cover_router)
+
+
+#Declared before the static mount, which would otherwise swallow it
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
 
 
 #Serve frontend files
@@ -41,8 +61,3 @@ app.mount(
     StaticFiles(directory="static", html=True),
     name="static"
 )
-
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
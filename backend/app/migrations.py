@@ -0,0 +1,127 @@
+import time
+from typing import List, Tuple
+from psycopg.sql import SQL
+from database import get_direct_connection
+
+#Versioned database migrations, applied once before the workers start (see gunicorn.conf.py)
+#Every migration runs in its own transaction together with its schema_migrations row
+#Never edit an applied migration, add a new one at the end of the list instead
+#Can be run on its own: python migrations.py
+
+MIGRATIONS: List[Tuple[int, str, str]] = [
+    (1, "create read_list", """
+        CREATE TABLE IF NOT EXISTS read_list (
+            id SERIAL PRIMARY KEY,
+            book_external_id VARCHAR(100) NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            description TEXT,
+            cover_i INTEGER,
+            status INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+    """),
+    (2, "create books catalog", """
+        CREATE TABLE IF NOT EXISTS books (
+            external_id VARCHAR(100) PRIMARY KEY,
+            title TEXT NOT NULL,
+            authors TEXT[] NOT NULL DEFAULT '{}',
+            first_publish_year TEXT,
+            cover_i INTEGER,
+            description TEXT,
+            number_of_pages INTEGER,
+            publishers TEXT[] NOT NULL DEFAULT '{}',
+            isbn_13 TEXT[] NOT NULL DEFAULT '{}',
+            isbn_10 TEXT[] NOT NULL DEFAULT '{}',
+            has_details BOOLEAN NOT NULL DEFAULT FALSE,
+            search_text TEXT NOT NULL DEFAULT '',
+            popularity INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS books_search_text_trgm_idx ON books USING GIN (search_text gin_trgm_ops);
+    """),
+    #The advisory lock makes versions commit in order, so "changes since X" never skips a late commit
+    (3, "create read_list_changes feed", """
+        CREATE TABLE IF NOT EXISTS read_list_changes (
+            version BIGSERIAL PRIMARY KEY,
+            entry_id INTEGER NOT NULL,
+            op VARCHAR(10) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE OR REPLACE FUNCTION read_list_log_change() RETURNS trigger AS $$
+        DECLARE
+            change_version BIGINT;
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('read_list_changes'));
+            INSERT INTO read_list_changes (entry_id, op)
+            VALUES (CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END, lower(TG_OP))
+            RETURNING version INTO change_version;
+            PERFORM pg_notify('read_list_changes', change_version::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS read_list_changes_trigger ON read_list;
+        CREATE TRIGGER read_list_changes_trigger
+            AFTER INSERT OR UPDATE OR DELETE ON read_list
+            FOR EACH ROW EXECUTE FUNCTION read_list_log_change();
+    """),
+    #The list version, read from the sequence since the table is emptied by pruning
+    #The shared lock waits for a write holding the change log lock (see read_list_log_change),
+    #so a version taken from the sequence but not committed yet is never handed out
+    (4, "create read_list_version function", """
+        CREATE OR REPLACE FUNCTION read_list_version() RETURNS BIGINT AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock_shared(hashtext('read_list_changes'));
+            RETURN (SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM read_list_changes_version_seq);
+        END;
+        $$ LANGUAGE plpgsql;
+    """),
+]
+
+
+#Returns the versions that were applied by this call
+def run_migrations() -> List[int]:
+    applied_now = []
+    with get_direct_connection() as conn:
+        #Only one process migrates at a time, the others wait and then find nothing left to do
+        #Session lock, released when the connection is closed
+        conn.execute(SQL("SELECT pg_advisory_lock(hashtext('schema_migrations'))"))
+        conn.execute(SQL("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        applied = {row[0] for row in conn.execute(SQL("SELECT version FROM schema_migrations")).fetchall()}
+        conn.commit()
+
+        for version, name, sql in MIGRATIONS:
+            if version in applied:
+                continue
+            print(f"Applying migration {version}: {name}")
+            with conn.transaction():
+                conn.execute(SQL(sql))
+                conn.execute(SQL("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)"), (version, name))
+            applied_now.append(version)
+    return applied_now
+
+
+#Everything the database needs before serving: migrations and housekeeping
+def prepare_database():
+    from services.read_list_service import prune_read_list_changes
+
+    start = time.perf_counter()
+    applied = run_migrations()
+    pruned = prune_read_list_changes()
+    print(f"Database ready in {(time.perf_counter() - start) * 1000:.0f}ms "
+          f"({len(applied)} migrations applied, {pruned} old reading list changes pruned)")
+
+
+if __name__ == "__main__":
+    prepare_database()
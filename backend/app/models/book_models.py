@@ -23,3 +23,6 @@ class SearchBooksResponse(BaseModel):
     page: int
     limit: int
     total_pages: int
+
+class SuggestBooksResponse(BaseModel):
+    suggestions: List[BookBase]
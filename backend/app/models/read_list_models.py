@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -42,3 +42,16 @@ class ReadListCreate(BaseModel):
 
 class ReadListUpdate(BaseModel):
     status: str = Field(..., pattern="^(PLANNED|READING|DONE)$")
+
+
+class ReadListChange(BaseModel):
+    version: int
+    op: str = Field(..., pattern="^(insert|update|delete)$")
+    id: int
+    entry: Optional[ReadList] = None
+
+
+class ReadListChanges(BaseModel):
+    version: int
+    reset: bool = Field(False, description="History was pruned, refetch the whole list")
+    changes: List[ReadListChange]
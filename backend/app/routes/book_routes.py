@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Query, HTTPException
 from typing import List
-from models.book_models import BookDetail, SearchBooksResponse, BookBase
-from services.books_service import search_books, get_popular_books, get_book_by_id
+from models.book_models import BookDetail, SearchBooksResponse, SuggestBooksResponse, BookBase
+from services.books_service import search_books, get_popular_books, get_book_by_id, get_suggestions, UpstreamError
 
 router = APIRouter(prefix="/api", tags=["books"])
 
@@ -13,10 +13,22 @@ async def search_books_route(
     page: int = Query(1, ge=1, description="Number of books to skip")
 ):
     #querying limit and offset directly to avoid user's overflowing page number
-    result = search_books(q, page=page, limit=limit)
+    try:
+        result = search_books(q, page=page, limit=limit)
+    except UpstreamError:
+        raise HTTPException(status_code=502, detail="Failed to search books on Open Library")
     return result
 
 
+@router.get("/suggest", response_model=SuggestBooksResponse)
+async def suggest_books_route(
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    limit: int = Query(8, ge=1, le=20, description="Number of suggestions to return")
+):
+    #Answered from the local catalog only, use /search/books for full results
+    return get_suggestions(q.strip().lower(), limit=limit)
+
+
 @router.get("/popular/books")
 async def get_popular_books_route(
     limit: int = Query(12, ge=1, le=50, description="Number of books to return"),
@@ -30,7 +42,10 @@ async def get_popular_books_route(
 
 @router.get("/books/{book_id}", response_model=BookDetail)
 async def get_book_route(book_id: str):
-    book = get_book_by_id(book_id)
+    try:
+        book = get_book_by_id(book_id)
+    except UpstreamError:
+        raise HTTPException(status_code=502, detail="Failed to fetch book from Open Library")
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     return book
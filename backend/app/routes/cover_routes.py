@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, Response
+from services.cover_service import get_cover, CoverFetchError, COVER_SIZES
+
+router = APIRouter(prefix="/api", tags=["covers"])
+
+#A cover id always maps to the same image, so browsers may keep it for a year
+COVER_CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+
+#Sync route on purpose: FastAPI runs it in the threadpool so the disk/upstream I/O doesn't block the loop
+@router.get("/covers/{cover_i:int}-{size}.jpg")
+def get_cover_route(cover_i: int, size: str):
+    if size not in COVER_SIZES:
+        raise HTTPException(status_code=404, detail="Cover not found")
+    try:
+        cover = get_cover(cover_i, size)
+    except CoverFetchError:
+        raise HTTPException(status_code=502, detail="Failed to fetch cover from Open Library")
+    if cover is None:
+        raise HTTPException(status_code=404, detail="Cover not found")
+    if "content" in cover:
+        return Response(content=cover["content"], media_type="image/jpeg", headers=COVER_CACHE_HEADERS)
+    #Served from the file (sendfile when the server supports it), its stat is passed so it's not taken again
+    return FileResponse(cover["path"], stat_result=cover["stat"], media_type="image/jpeg", headers=COVER_CACHE_HEADERS)
@@ -1,16 +1,23 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
-from models.read_list_models import ReadList, ReadListCreate, ReadListUpdate, ReadStatus
+from models.read_list_models import ReadList, ReadListCreate, ReadListUpdate, ReadStatus, ReadListChanges
 from services import read_list_service
+from services.books_service import seed_catalog_book
+from services.read_list_feed_service import stream_changes
 
 
 router = APIRouter(prefix="/api/reading-list", tags=["Reading List"])
 
 
+#Version header: pass it as since to /changes or /events to only get what changed after this read
 @router.get("/", response_model=List[ReadList])
-async def get_reading_list():
+async def get_reading_list(response: Response):
     try:
+        #Read the version first, a change landing in between is then sent again rather than missed
+        version = read_list_service.get_read_list_version()
         entries = read_list_service.get_read_list()
+        response.headers["X-Reading-List-Version"] = str(version)
         return entries
     except Exception as e:
         raise HTTPException(
@@ -19,6 +26,33 @@ async def get_reading_list():
         )
 
 
+@router.get("/changes", response_model=ReadListChanges)
+async def get_reading_list_changes(since: int = Query(..., ge=0, description="Last version the client has seen")):
+    try:
+        return read_list_service.get_read_list_changes_since(since)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch reading list changes: {str(e)}"
+        )
+
+
+#Server-Sent Events, browsers resend the last event id on reconnect so no change is lost
+@router.get("/events")
+async def reading_list_events(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0, description="Last version the client has seen"),
+    last_event_id: Optional[str] = Header(None)
+):
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    return StreamingResponse(
+        stream_changes(since, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{id}", response_model=ReadList)
 async def get_reading_list_entry(id: int):
     try:
@@ -39,7 +73,7 @@ async def get_reading_list_entry(id: int):
 
 
 @router.post("/", response_model=ReadList, status_code=status.HTTP_201_CREATED)
-async def add_to_reading_list(book: ReadListCreate):
+async def add_to_reading_list(book: ReadListCreate, background_tasks: BackgroundTasks):
     try:
         entry = read_list_service.add_to_read_list(
             book_external_id=book.external_id,
@@ -49,6 +83,8 @@ async def add_to_reading_list(book: ReadListCreate):
             cover_i=book.cover_i,
             status=0  # PLANNED
         )
+        #After the response, may call Open Library
+        background_tasks.add_task(seed_catalog_book, book.external_id)
         return entry
     except Exception as e:
         raise HTTPException(
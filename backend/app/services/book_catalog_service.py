@@ -0,0 +1,126 @@
+from typing import List, Dict, Any, Optional
+from psycopg.sql import SQL
+from database import execute_query, execute_one, execute_command, execute_many
+
+#Local copy of Open Library book metadata (books table, see migrations.py)
+#Filled from search/trending results (basic info) and book details, so repeated reads skip the upstream
+
+#Details older than this are fetched again from Open Library
+CATALOG_MAX_AGE_HOURS = 24
+#Seconds a book read waits for a database connection, the catalog is only a shortcut in front of Open Library
+CATALOG_READ_TIMEOUT_SECONDS = 1
+
+#Popularity added each time a book shows up in upstream results
+SEARCH_POPULARITY_WEIGHT = 1
+TRENDING_POPULARITY_WEIGHT = 5
+
+
+def _publish_year(book: Dict[str, Any]) -> Optional[str]:
+    year = book.get("first_publish_year")
+    return str(year) if year is not None else None
+
+
+#Lowercased title and authors, what typeahead prefixes are matched against
+def _search_text(book: Dict[str, Any]) -> str:
+    return " ".join([book.get("title", "")] + list(book.get("authors") or [])).lower()
+
+
+#Upsert basic info (search/trending results), never overwrites fetched details
+#Every appearance adds popularity_weight to the book's popularity
+def upsert_books(books: List[Dict[str, Any]], popularity_weight: int = SEARCH_POPULARITY_WEIGHT) -> int:
+    #Rows are locked in id order, so concurrent batches can't deadlock on each other
+    books = sorted((book for book in books if book.get("external_id")), key=lambda book: book["external_id"])
+    if not books:
+        return 0
+
+    query = SQL("""
+        INSERT INTO books (external_id, title, authors, first_publish_year, cover_i, search_text, popularity)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (external_id) DO UPDATE SET
+            title = CASE WHEN books.has_details THEN books.title ELSE EXCLUDED.title END,
+            authors = CASE WHEN books.has_details THEN books.authors ELSE EXCLUDED.authors END,
+            first_publish_year = COALESCE(books.first_publish_year, EXCLUDED.first_publish_year),
+            cover_i = COALESCE(books.cover_i, EXCLUDED.cover_i),
+            search_text = CASE WHEN books.has_details THEN books.search_text ELSE EXCLUDED.search_text END,
+            popularity = books.popularity + EXCLUDED.popularity
+    """)
+    params_list = [
+        (book["external_id"], book.get("title", "Unknown"), book.get("authors") or [], _publish_year(book),
+         book.get("cover_i"), _search_text(book), popularity_weight)
+        for book in books
+    ]
+    return execute_many(query, params_list)
+
+
+#Upsert a full book, as returned by get_book_by_id
+def upsert_book_details(book: Dict[str, Any]) -> int:
+    query = SQL("""
+        INSERT INTO books (external_id, title, authors, first_publish_year, cover_i, description,
+                           number_of_pages, publishers, isbn_13, isbn_10, search_text, has_details, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, TRUE, CURRENT_TIMESTAMP)
+        ON CONFLICT (external_id) DO UPDATE SET
+            title = EXCLUDED.title,
+            authors = EXCLUDED.authors,
+            first_publish_year = EXCLUDED.first_publish_year,
+            cover_i = EXCLUDED.cover_i,
+            description = EXCLUDED.description,
+            number_of_pages = EXCLUDED.number_of_pages,
+            publishers = EXCLUDED.publishers,
+            isbn_13 = EXCLUDED.isbn_13,
+            isbn_10 = EXCLUDED.isbn_10,
+            search_text = EXCLUDED.search_text,
+            has_details = TRUE,
+            updated_at = CURRENT_TIMESTAMP
+    """)
+    params = (
+        book["external_id"],
+        book.get("title", "Unknown"),
+        book.get("authors") or [],
+        _publish_year(book),
+        book.get("cover_i"),
+        book.get("description"),
+        book.get("number_of_pages"),
+        book.get("publishers") or [],
+        book.get("isbn_13") or [],
+        book.get("isbn_10") or [],
+        _search_text(book)
+    )
+    return execute_command(query, params)
+
+
+#Returns the book details if the catalog has fresh ones, None otherwise
+#allow_stale also returns details older than CATALOG_MAX_AGE_HOURS, for when Open Library can't be reached
+def get_catalog_book(book_id: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+    query = SQL("""
+        SELECT external_id, title, authors, first_publish_year, cover_i, description,
+               number_of_pages, publishers, isbn_13, isbn_10
+        FROM books
+        WHERE external_id = %s
+          AND has_details
+          AND (%s OR updated_at > CURRENT_TIMESTAMP - make_interval(hours => %s))
+    """)
+    return execute_one(query, (book_id, allow_stale, CATALOG_MAX_AGE_HOURS), timeout=CATALOG_READ_TIMEOUT_SECONDS)
+
+
+#Prefix typeahead over the catalog, reading list books first, then the most popular
+#Matches the start of any word in the title or authors, served by the trigram index
+def suggest_books(prefix: str, limit: int = 8) -> List[Dict[str, Any]]:
+    prefix = prefix.strip().lower()
+    if not prefix:
+        return []
+
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    query = SQL("""
+        SELECT b.external_id, b.title, b.authors, b.first_publish_year, b.cover_i
+        FROM books b
+        LEFT JOIN read_list r ON r.book_external_id = b.external_id
+        WHERE b.search_text LIKE %s OR b.search_text LIKE %s
+        ORDER BY (r.id IS NOT NULL) DESC,
+                 (b.search_text LIKE %s) DESC,
+                 b.popularity DESC,
+                 b.title
+        LIMIT %s
+    """)
+    starts_with = f"{escaped}%"
+    word_starts_with = f"% {escaped}%"
+    return execute_query(query, (starts_with, word_starts_with, starts_with, limit))
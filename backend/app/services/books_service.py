@@ -1,17 +1,44 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from psycopg.sql import SQL
 from models.book_models import BookDetail
 from database import execute_query, execute_one, execute_command, execute_script
 import requests
 from urllib.parse import quote
 from services.cache_service import cached_with_ttl
-from config import API_HEADERS
+from config import API_HEADERS, OPENLIBRARY_URL, CACHE_TTL_SECONDS, NOT_FOUND_CACHE_TTL_SECONDS, UPSTREAM_ERROR_CACHE_TTL_SECONDS
+from services.book_catalog_service import get_catalog_book, upsert_books, upsert_book_details, suggest_books, TRENDING_POPULARITY_WEIGHT, SEARCH_POPULARITY_WEIGHT
 from mockings.book_mocking import get_mock_data
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 #A service for fetching books, no SQL use here, we gotta play smart🧑🏼‍🏫
 #Also includes caching for performance
 
+#Raised when Open Library fails to answer (timeout, 5xx...),
+#as opposed to answering that the requested item does not exist
+class UpstreamError(Exception):
+    pass
+
+
+#The local catalog is only a shortcut, a database hiccup must never fail a request
+def _read_catalog(book_id: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+    try:
+        return get_catalog_book(book_id, allow_stale)
+    except Exception as e:
+        print(f"Error reading book {book_id} from catalog: {str(e)}")
+        return None
+
+def _save_to_catalog(books: List[Dict[str, Any]], popularity_weight: int = SEARCH_POPULARITY_WEIGHT):
+    try:
+        upsert_books(books, popularity_weight)
+    except Exception as e:
+        print(f"Error saving {len(books)} books to catalog: {str(e)}")
+
+def _save_details_to_catalog(book: Dict[str, Any]):
+    try:
+        upsert_book_details(book)
+    except Exception as e:
+        print(f"Error saving book {book['external_id']} to catalog: {str(e)}")
+
 def remove_id_prefix(book_external_id: str) -> str:
     prefixes = ["/works/", "/books/", "/authors/"]
     for prefix in prefixes:
@@ -32,54 +59,90 @@ def add_id_prefix(openlibrary_id: str) -> str:
 
     raise ValueError(f"Unknown Open Library ID: {openlibrary_id}")
 
-def fetch_single_author(author_key: str) -> str:
-    """Fetch a single author's name from Open Library API."""
+@cached_with_ttl(
+    ttl_seconds=CACHE_TTL_SECONDS,
+    negative_ttl_seconds=NOT_FOUND_CACHE_TTL_SECONDS,
+    error_ttl_seconds=UPSTREAM_ERROR_CACHE_TTL_SECONDS
+)
+def get_author_name(author_key: str) -> Optional[str]:
+    """Fetch an author's name, None if the author does not exist."""
+    author_url = f"{OPENLIBRARY_URL}{author_key}.json"
     try:
-        author_url = f"https://openlibrary.org{author_key}.json"
         author_response = requests.get(author_url, headers=API_HEADERS, timeout=5)
+        if author_response.status_code == 404:
+            return None
         author_response.raise_for_status()
         author_data = author_response.json()
         return author_data.get("name", "Unknown")
-    except Exception:
-        return "Unknown"
+    except Exception as e:
+        raise UpstreamError(f"Failed to fetch author {author_key}: {str(e)}")
+
+def fetch_single_author(author_key: str) -> Optional[str]:
+    """Fetch a single author's name from Open Library API, None if Open Library failed."""
+    try:
+        return get_author_name(author_key) or "Unknown"
+    except UpstreamError:
+        return None
 
-def get_authors_from_keys(author_keys: List[str]) -> List[str]:
-    """Fetch multiple authors concurrently using threading."""
+def get_authors_from_keys(author_keys: List[str]) -> Tuple[List[str], bool]:
+    """Fetch multiple authors concurrently using threading, and whether all of them were fetched."""
     if not author_keys:
-        return []
+        return [], True
     
     author_names = []
+    complete = True
     with ThreadPoolExecutor(max_workers=min(10, len(author_keys))) as executor:
         # Submit all author fetches concurrently
         future_to_key = {executor.submit(fetch_single_author, key): key for key in author_keys}
         
         # Collect results in order
         for future in as_completed(future_to_key):
-            try:
-                author_name = future.result()
-                author_names.append(author_name)
-            except Exception:
-                author_names.append("Unknown")
+            author_name = future.result()
+            if author_name is None:
+                complete = False
+                author_name = "Unknown"
+            author_names.append(author_name)
     
-    return author_names
+    return author_names, complete
 
+#None if the work has no editions, raises UpstreamError if Open Library fails
 def get_edition_info(book_id: str) -> Optional[Dict[str, Any]]:
-    url = f"https://openlibrary.org/works/{book_id}/editions.json"
+    url = f"{OPENLIBRARY_URL}/works/{book_id}/editions.json"
     try:
         response = requests.get(url, headers=API_HEADERS, timeout=10)
+        if response.status_code == 404:
+            return None
         response.raise_for_status()
         data = response.json()
         return data
     except Exception as e:
-        print(f"Error fetching edition info for {book_id}: {str(e)}")
-        return None
+        raise UpstreamError(f"Failed to fetch edition info for {book_id}: {str(e)}")
     
-@cached_with_ttl(ttl_seconds=3600)  # Cache for one hour
+#A book whose author or edition lookups failed is still shown, marked partial
+def _is_partial(book: Optional[Dict[str, Any]]) -> bool:
+    return bool(book and book.get("partial"))
+
+#Missing works are cached briefly, upstream failures raise UpstreamError and are only cached for seconds,
+#as are partial books (never written to the catalog) so the missing parts are fetched again soon
+#When Open Library fails, stale catalog details are served instead (marked partial) if there are any
+@cached_with_ttl(
+    ttl_seconds=CACHE_TTL_SECONDS,
+    negative_ttl_seconds=NOT_FOUND_CACHE_TTL_SECONDS,
+    error_ttl_seconds=UPSTREAM_ERROR_CACHE_TTL_SECONDS,
+    is_degraded=_is_partial
+)
 def get_book_by_id(book_id: str) -> Optional[Dict[str, Any]]:
-    url = f"https://openlibrary.org/works/{book_id}.json"
+    #Read-through: the local catalog first, Open Library only if it's missing or stale
+    catalog_book = _read_catalog(book_id)
+    if catalog_book:
+        return catalog_book
+
+    url = f"{OPENLIBRARY_URL}/works/{book_id}.json"
     print(f"Fetching book by ID with URL: {url}")
     try:
         response = requests.get(url, headers=API_HEADERS, timeout=10)
+        if response.status_code == 404:
+            return None
         response.raise_for_status()
         data = response.json()
         
@@ -99,14 +162,20 @@ def get_book_by_id(book_id: str) -> Optional[Dict[str, Any]]:
         #Fetch authors and edition info concurrently
         author_names = []
         edition_info = None
+        partial = False
         
         with ThreadPoolExecutor(max_workers=2) as executor:
             authors_future = executor.submit(get_authors_from_keys, author_keys) if author_keys else None
             edition_future = executor.submit(get_edition_info, book_id)
             
             if authors_future:
-                author_names = authors_future.result()
-            edition_info = edition_future.result()
+                author_names, authors_complete = authors_future.result()
+                partial = not authors_complete
+            try:
+                edition_info = edition_future.result()
+            except UpstreamError as e:
+                print(f"Showing {book_id} without edition info: {str(e)}")
+                partial = True
 
         latest_edition = None
         if edition_info:
@@ -140,27 +209,46 @@ def get_book_by_id(book_id: str) -> Optional[Dict[str, Any]]:
             "isbn_13": isbn_13,
             "isbn_10": isbn_10
         }
+        if partial:
+            book["partial"] = True
+        else:
+            _save_details_to_catalog(book)
         return book
     except Exception as e:
         print(f"Error fetching book by ID {book_id}: {str(e)}")
-        return None
+        stale_book = _read_catalog(book_id, allow_stale=True)
+        if stale_book:
+            stale_book["partial"] = True
+            return stale_book
+        raise UpstreamError(f"Failed to fetch book {book_id}: {str(e)}")
+
+
+#Puts a reading list book in the catalog (so it's joined and suggested) from Open Library's own metadata,
+#never from what the client sent. Best effort, a failure only means the book isn't in the catalog yet
+def seed_catalog_book(book_id: str):
+    try:
+        get_book_by_id(book_id)
+    except Exception as e:
+        print(f"Error seeding book {book_id} into catalog: {str(e)}")
 
-@cached_with_ttl(ttl_seconds=3600)  #Cache for one hour
+@cached_with_ttl(ttl_seconds=CACHE_TTL_SECONDS)  #Cache for one hour
 def get_popular_books(limit: int = 12, page: int = 1, duration: str = "monthly") -> Dict[str, Any]:
     if duration not in ("daily", "weekly", "monthly", "yearly", "forever"):
         raise ValueError("Invalid duration. Must be 'daily', 'weekly', 'monthly', or None.")
     
-    url = f"https://openlibrary.org/trending/{duration}.json?limit={limit}&page={page}"
+    url = f"{OPENLIBRARY_URL}/trending/{duration}.json?limit={limit}&page={page}"
     
     try:
         response = requests.get(url, headers=API_HEADERS, timeout=10)
         response.raise_for_status()
         data = response.json()
+        is_mock = False
         
     except Exception as e:
         #Modern problems require modern solutions
         print(f"Error fetching popular books: {str(e)}. Using mock data.")
         data = get_mock_data()
+        is_mock = True
 
     # Transform the response to match our book model
     books = []
@@ -173,6 +261,9 @@ def get_popular_books(limit: int = 12, page: int = 1, duration: str = "monthly")
             "cover_i": work.get("cover_i")
         }
         books.append(book)
+
+    if not is_mock:
+        _save_to_catalog(books, TRENDING_POPULARITY_WEIGHT)
     return {
         "books": books,
         "total": len(books),
@@ -182,10 +273,16 @@ def get_popular_books(limit: int = 12, page: int = 1, duration: str = "monthly")
 
 
 #Search books by title or author from Open Library API
-@cached_with_ttl(ttl_seconds=3600)  # Cache one hour
+#Empty results are cached briefly, upstream failures only for seconds
+@cached_with_ttl(
+    ttl_seconds=CACHE_TTL_SECONDS,
+    negative_ttl_seconds=NOT_FOUND_CACHE_TTL_SECONDS,
+    error_ttl_seconds=UPSTREAM_ERROR_CACHE_TTL_SECONDS,
+    is_negative=lambda result: not result["books"]
+)
 def search_books(search_term: str, page: int = 1, limit: int = 20) -> Dict[str, Any]:
     quoted_query = quote(search_term)
-    url = f"https://openlibrary.org/search.json?q={quoted_query}&limit={limit}&page={page}"
+    url = f"{OPENLIBRARY_URL}/search.json?q={quoted_query}&limit={limit}&page={page}"
     print(f"Searching books with URL: {url}")   
     
     try:
@@ -205,6 +302,7 @@ def search_books(search_term: str, page: int = 1, limit: int = 20) -> Dict[str,
             }
             books.append(book)
         
+        _save_to_catalog(books)
         return {
             "books": books,
             "total": data.get("numFound", 0),
@@ -213,4 +311,11 @@ def search_books(search_term: str, page: int = 1, limit: int = 20) -> Dict[str,
             "total_pages": (data.get("numFound", 0) + limit - 1) // limit
         }
     except Exception as e:
-        raise Exception(f"Failed to search books: {str(e)}")
\ No newline at end of file
+        raise UpstreamError(f"Failed to search books: {str(e)}")
+
+
+#Typeahead suggestions from the local catalog only, Open Library is left for full searches
+#Cached shortly since the same prefixes are typed over and over
+@cached_with_ttl(ttl_seconds=60)
+def get_suggestions(prefix: str, limit: int = 8) -> Dict[str, Any]:
+    return {"suggestions": suggest_books(prefix, limit)}
@@ -1,30 +1,75 @@
+import copy
 from functools import wraps
 from datetime import datetime, timedelta
-from typing import Callable, Any, Dict, Tuple
+from typing import Callable, Any, Dict, Tuple, Optional
 
 #In-memory cache with TTL
-_cache: Dict[Tuple, Tuple[Any, datetime]] = {}
+#Each entry is (result, expires_at, is_error)
+_cache: Dict[Tuple, Tuple[Any, datetime, bool]] = {}
+
+
+def _is_none(result: Any) -> bool:
+    return result is None
+
+
+def _never(result: Any) -> bool:
+    return False
+
+
+#ttl_seconds: how long a good result is kept
+#negative_ttl_seconds: how long a "not found" result is kept (None by default, see is_negative)
+#error_ttl_seconds: how long a raised exception is kept and re-raised (0 = never cached)
+#is_degraded: results only partly served by the upstream, kept for error_ttl_seconds like an error
+def cached_with_ttl(
+    ttl_seconds: int = 3600,
+    negative_ttl_seconds: Optional[int] = None,
+    error_ttl_seconds: int = 0,
+    is_negative: Callable[[Any], bool] = _is_none,
+    is_degraded: Callable[[Any], bool] = _never
+):
+    if negative_ttl_seconds is None:
+        negative_ttl_seconds = ttl_seconds
 
-def cached_with_ttl(ttl_seconds: int = 3600):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             cache_key = (func.__name__, args, tuple(sorted(kwargs.items())))
-            
-            if cache_key in _cache:
-                cached_result, cached_time = _cache[cache_key]
-                if datetime.now() - cached_time < timedelta(seconds=ttl_seconds):
+
+            #get/pop only, called from several threads at once
+            entry = _cache.get(cache_key)
+            if entry is not None:
+                cached_result, expires_at, is_error = entry
+                if datetime.now() < expires_at:
+                    if is_error:
+                        #A fresh copy per hit, re-raising the stored object would grow its traceback on every hit
+                        raise copy.copy(cached_result)
                     return cached_result
                 else:
                     # Remove expired entry
-                    del _cache[cache_key]
-            
+                    _cache.pop(cache_key, None)
+
             # Call function and cache result
-            result = func(*args, **kwargs)
-            _cache[cache_key] = (result, datetime.now())
-            
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                #Upstream errors are only kept for a few seconds so a flaky
+                #upstream is not hammered, but a good result is never hidden for long
+                if error_ttl_seconds > 0:
+                    #Stored without its traceback, which would keep the failed call's frames alive
+                    _cache[cache_key] = (copy.copy(e), datetime.now() + timedelta(seconds=error_ttl_seconds), True)
+                raise
+
+            if is_negative(result):
+                ttl = negative_ttl_seconds
+            elif is_degraded(result):
+                ttl = error_ttl_seconds
+            else:
+                ttl = ttl_seconds
+            if ttl > 0:
+                _cache[cache_key] = (result, datetime.now() + timedelta(seconds=ttl), False)
+
             return result
-        
+
         return wrapper
     return decorator
 
@@ -32,10 +77,53 @@ def cached_with_ttl(ttl_seconds: int = 3600):
 def clear_cache():
     global _cache
     _cache.clear()
+    _versioned_cache.clear()
 
 
 def clear_cache_for_function(func_name: str):
     global _cache
-    keys_to_delete = [key for key in _cache.keys() if key[0] == func_name]
+    keys_to_delete = [key for key in list(_cache.keys()) if key[0] == func_name]
     for key in keys_to_delete:
-        del _cache[key]
+        _cache.pop(key, None)
+
+
+#In-memory cache tied to a data version instead of a TTL
+#An entry is only served while both the version it was read at and the local write generation are unchanged:
+# - the version comes from outside (e.g. Postgres notifications), None means unknown and disables caching
+# - the generation is bumped by this process on every write, so its own writes are never followed by stale reads
+#Each entry is (result, version, generation)
+_versioned_cache: Dict[Tuple, Tuple[Any, int, int]] = {}
+_versions: Dict[str, Optional[int]] = {}
+_generations: Dict[str, int] = {}
+
+
+def set_cache_version(namespace: str, version: Optional[int]):
+    _versions[namespace] = version
+
+
+def bump_cache_generation(namespace: str):
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+
+
+def cached_with_version(namespace: str):
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            #Read both before calling, so a write landing during the call invalidates what we store
+            version = _versions.get(namespace)
+            generation = _generations.get(namespace, 0)
+            if version is None:
+                return func(*args, **kwargs)
+
+            cache_key = (namespace, func.__name__, args, tuple(sorted(kwargs.items())))
+            if cache_key in _versioned_cache:
+                cached_result, cached_version, cached_generation = _versioned_cache[cache_key]
+                if cached_version == version and cached_generation == generation:
+                    return cached_result
+
+            result = func(*args, **kwargs)
+            _versioned_cache[cache_key] = (result, version, generation)
+            return result
+
+        return wrapper
+    return decorator
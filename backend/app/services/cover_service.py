@@ -0,0 +1,169 @@
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+import requests
+from config import API_HEADERS, OPENLIBRARY_COVERS_URL, COVER_CACHE_DIR, COVER_CACHE_MAX_BYTES
+
+#A service for proxying Open Library covers through a size bounded disk cache
+#Covers never change for a given id, so once a cover is on disk it's served forever (until evicted)
+
+COVER_SIZES = ("S", "M", "L")
+
+
+#Raised when the covers server fails to answer
+class CoverFetchError(Exception):
+    pass
+
+
+#The cache directory is shared by every worker process, so it is the only source of truth:
+#sizes are summed from disk and the LRU order is the files' modification time (refreshed on use)
+
+#Re-scan the directory for eviction once this process stored this many bytes since the last scan,
+#so with N workers the cache overshoots COVER_CACHE_MAX_BYTES by at most N% between scans
+_EVICTION_CHECK_BYTES = max(1, COVER_CACHE_MAX_BYTES // 100)
+#Don't rewrite a cover's modification time more often than this on hits
+_TOUCH_INTERVAL_SECONDS = 60
+
+#Starts full so the first store after start-up checks the directory
+_bytes_since_check = _EVICTION_CHECK_BYTES
+_eviction_lock = threading.Lock()
+
+#Covers currently being fetched from upstream, so concurrent misses share one request
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _cover_file_name(cover_i: int, size: str) -> str:
+    return f"{cover_i}-{size}.jpg"
+
+
+#The cover file's stat, None if it can't be served from disk (never stored, evicted by any worker, unreadable cache)
+#A hit makes the cover the most recently used, so eviction won't pick it while it's being served
+def _stat_cached(path: str) -> Optional[os.stat_result]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if time.time() - stat.st_mtime > _TOUCH_INTERVAL_SECONDS:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    return stat
+
+
+#False if the cover could not be written (disk full, permissions...), it is then only served from memory
+def _store(file_name: str, content: bytes) -> bool:
+    global _bytes_since_check
+    path = os.path.join(COVER_CACHE_DIR, file_name)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(COVER_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error storing cover {file_name}: {str(e)}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+    with _eviction_lock:
+        _bytes_since_check += len(content)
+        if _bytes_since_check < _EVICTION_CHECK_BYTES:
+            return True
+        _bytes_since_check = 0
+        try:
+            _evict(keep=file_name)
+        except OSError as e:
+            print(f"Error evicting covers: {str(e)}")
+    return True
+
+
+#Removes least recently used covers until the directory fits, never the one just stored
+def _evict(keep: str):
+    entries = []
+    total_bytes = 0
+    for entry in os.scandir(COVER_CACHE_DIR):
+        if not entry.name.endswith(".jpg"):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, entry.name, stat.st_size))
+        total_bytes += stat.st_size
+    if total_bytes <= COVER_CACHE_MAX_BYTES:
+        return
+
+    entries.sort()
+    for _, name, size in entries:
+        if total_bytes <= COVER_CACHE_MAX_BYTES:
+            break
+        if name == keep:
+            continue
+        try:
+            os.remove(os.path.join(COVER_CACHE_DIR, name))
+        except FileNotFoundError:
+            #Already evicted by another worker
+            pass
+        total_bytes -= size
+
+
+def _fetch_cover(cover_i: int, size: str) -> Optional[bytes]:
+    #default=false makes Open Library answer 404 instead of a blank image for unknown ids
+    url = f"{OPENLIBRARY_COVERS_URL}/b/id/{cover_i}-{size}.jpg?default=false"
+    try:
+        response = requests.get(url, headers=API_HEADERS, timeout=10)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        raise CoverFetchError(f"Failed to fetch cover {cover_i}-{size}: {str(e)}")
+
+
+#Returns the cover, None if Open Library has no such cover:
+# - {"path", "stat"} when it's on disk, served as a file
+# - {"content"} when it could not be stored, served from memory
+def get_cover(cover_i: int, size: str) -> Optional[Dict[str, Any]]:
+    if size not in COVER_SIZES:
+        raise ValueError(f"Invalid cover size: {size}")
+
+    file_name = _cover_file_name(cover_i, size)
+    path = os.path.join(COVER_CACHE_DIR, file_name)
+    stat = _stat_cached(path)
+    if stat is not None:
+        return {"path": path, "stat": stat}
+
+    with _inflight_lock:
+        future = _inflight.get(file_name)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[file_name] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        content = _fetch_cover(cover_i, size)
+        result = None
+        if content is not None:
+            result = {"content": content}
+            if _store(file_name, content):
+                stat = _stat_cached(path)
+                if stat is not None:
+                    result = {"path": path, "stat": stat}
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[file_name]
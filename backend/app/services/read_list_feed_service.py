@@ -0,0 +1,126 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional, Set
+import psycopg
+from fastapi.encoders import jsonable_encoder
+from database import DATABASE_URL
+from services.read_list_service import READ_LIST_CHANGES_CHANNEL, READ_LIST_CACHE, get_read_list_changes_since, get_read_list_version, prune_read_list_changes
+from services.cache_service import set_cache_version
+
+#Pushes reading list changes to connected clients (SSE)
+#Every worker LISTENs on the change channel, so a write handled by any worker reaches every client
+
+#Seconds between keep-alive comments, so proxies don't close idle streams
+KEEP_ALIVE_SECONDS = 15
+#Seconds to wait before reconnecting the listener after a database error
+LISTENER_RETRY_SECONDS = 5
+#Seconds between prunings of the change log, so it stays bounded on servers that run for weeks
+PRUNE_INTERVAL_SECONDS = 3600
+
+#Changes buffered per client, a client that falls further behind is sent a reset instead
+SUBSCRIBER_QUEUE_SIZE = 100
+
+_subscribers: Set[asyncio.Queue] = set()
+
+
+def subscribe() -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers.add(queue)
+    return queue
+
+
+def unsubscribe(queue: asyncio.Queue):
+    _subscribers.discard(queue)
+
+
+def _broadcast(change: Dict[str, Any]):
+    for queue in _subscribers:
+        try:
+            queue.put_nowait(change)
+        except asyncio.QueueFull:
+            #The client stalled, drop what it missed and make it refetch the whole list
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"version": change["version"], "op": "reset", "id": None, "entry": None})
+
+
+#Runs for the whole app lifetime, turns NOTIFYs into change events for the subscribers
+#Also keeps the reading list read cache version current, caching is off while not listening (we'd miss writes)
+async def run_change_listener():
+    last_version = None
+    while True:
+        try:
+            if last_version is None:
+                last_version = await asyncio.to_thread(get_read_list_version)
+            async with await psycopg.AsyncConnection.connect(DATABASE_URL, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {READ_LIST_CHANGES_CHANNEL}")
+                #Catch up on anything committed while we were not listening
+                last_version = await _publish_changes_since(last_version)
+                set_cache_version(READ_LIST_CACHE, last_version)
+                async for notify in conn.notifies():
+                    if int(notify.payload) > last_version:
+                        #Invalidate first, the catch-up query below takes a round-trip
+                        set_cache_version(READ_LIST_CACHE, int(notify.payload))
+                        last_version = await _publish_changes_since(last_version)
+                        set_cache_version(READ_LIST_CACHE, last_version)
+        except asyncio.CancelledError:
+            set_cache_version(READ_LIST_CACHE, None)
+            raise
+        except Exception as e:
+            set_cache_version(READ_LIST_CACHE, None)
+            print(f"Reading list change listener failed: {str(e)}. Retrying in {LISTENER_RETRY_SECONDS}s")
+            await asyncio.sleep(LISTENER_RETRY_SECONDS)
+
+
+#Runs for the whole app lifetime, drops changes older than READ_LIST_CHANGES_RETENTION_DAYS every PRUNE_INTERVAL_SECONDS
+#Every worker runs it, pruning an already pruned log is a no-op
+async def run_change_pruner():
+    while True:
+        await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
+        try:
+            pruned = await asyncio.to_thread(prune_read_list_changes)
+            if pruned:
+                print(f"Pruned {pruned} old reading list changes")
+        except Exception as e:
+            print(f"Pruning reading list changes failed: {str(e)}. Retrying in {PRUNE_INTERVAL_SECONDS}s")
+
+
+async def _publish_changes_since(version: int) -> int:
+    delta = await asyncio.to_thread(get_read_list_changes_since, version)
+    if delta["reset"]:
+        _broadcast({"version": delta["version"], "op": "reset", "id": None, "entry": None})
+    for change in delta["changes"]:
+        _broadcast(change)
+    return delta["version"]
+
+
+def _format_event(change: Dict[str, Any]) -> str:
+    return f"id: {change['version']}\nevent: {change['op']}\ndata: {json.dumps(jsonable_encoder(change))}\n\n"
+
+
+#SSE stream: the changes since since_version (if given), then live changes as they happen
+async def stream_changes(since_version: Optional[int], is_disconnected):
+    queue = subscribe()
+    last_sent = since_version if since_version is not None else -1
+    try:
+        if since_version is not None:
+            delta = await asyncio.to_thread(get_read_list_changes_since, since_version)
+            if delta["reset"]:
+                yield _format_event({"version": delta["version"], "op": "reset", "id": None, "entry": None})
+            for change in delta["changes"]:
+                yield _format_event(change)
+            last_sent = delta["version"]
+
+        while not await is_disconnected():
+            try:
+                change = await asyncio.wait_for(queue.get(), timeout=KEEP_ALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            #Already sent as part of the initial delta
+            if change["op"] != "reset" and change["version"] <= last_sent:
+                continue
+            last_sent = change["version"]
+            yield _format_event(change)
+    finally:
+        unsubscribe(queue)
@@ -1,6 +1,23 @@
 from typing import List, Dict, Any, Optional
 from psycopg.sql import SQL
-from database import execute_query, execute_one, execute_command, execute_script
+from database import execute_query, execute_one, execute_command
+from services.cache_service import cached_with_version, bump_cache_generation
+
+#Reads are cached until the list version changes (see read_list_feed_service) or this process writes
+READ_LIST_CACHE = "read_list"
+
+#Reading list rows joined with the local book catalog, so title/author/cover stay fresh
+#The read_list columns are only used when the catalog doesn't know the book yet
+_READ_LIST_SELECT = """
+    SELECT r.id, r.book_external_id,
+           COALESCE(b.title, r.title) AS title,
+           COALESCE(NULLIF(array_to_string(b.authors, '; '), ''), r.author) AS author,
+           COALESCE(b.description, r.description) AS description,
+           COALESCE(b.cover_i, r.cover_i) AS cover_i,
+           r.status, r.created_at, r.updated_at
+    FROM read_list r
+    LEFT JOIN books b ON b.external_id = r.book_external_id
+"""
 
 status_types = ["PLANNED", "READING", "DONE"]
 def _int_to_status_string(status_int: int) -> str:
@@ -16,61 +33,125 @@ def _status_string_to_int(status_str: str) -> int:
         raise ValueError(f"Invalid status string: {status_str}")
 
 
-def init_read_list_table():
-    print("[DEBUG] Initializing read_list table...")
-    create_table_sql = SQL("""
-        CREATE TABLE IF NOT EXISTS read_list (
-            id SERIAL PRIMARY KEY,
-            book_external_id VARCHAR(100) NOT NULL UNIQUE,
-            title TEXT NOT NULL,
-            author TEXT NOT NULL,
-            description TEXT,
-            cover_i INTEGER,
-            status INTEGER NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-    """)
-    execute_script(create_table_sql)
-
-
+#Change log of the read_list table, filled by a trigger so every write is recorded (see migrations.py)
+#Each change gets an increasing version and is announced with NOTIFY so every worker can push it to clients
+READ_LIST_CHANGES_CHANNEL = "read_list_changes"
+READ_LIST_CHANGES_RETENTION_DAYS = 7
+
+def prune_read_list_changes() -> int:
+    return execute_command(
+        SQL("DELETE FROM read_list_changes WHERE created_at < CURRENT_TIMESTAMP - make_interval(days => %s)"),
+        (READ_LIST_CHANGES_RETENTION_DAYS,)
+    )
+
+
+#The last committed change version, from the change log's sequence so it never goes back when old changes are pruned
+def _latest_version() -> int:
+    result = execute_one(SQL("SELECT read_list_version() AS version"), prepare=True)
+    return result["version"] if result else 0
+
+
+@cached_with_version(READ_LIST_CACHE)
+def get_read_list_version() -> int:
+    return _latest_version()
+
+
+#Changes since a version, at most one per entry (its latest), oldest first
+#reset is True when the history since that version was pruned, the client must refetch the whole list
+def get_read_list_changes_since(since_version: int) -> Dict[str, Any]:
+    latest = _latest_version()
+    if since_version > latest:
+        #The client is ahead of us (e.g. the database was recreated)
+        return {"version": latest, "reset": True, "changes": []}
+    if since_version == latest:
+        return {"version": latest, "reset": False, "changes": []}
+
+    bounds = execute_one(SQL("SELECT MIN(version) AS oldest FROM read_list_changes"), prepare=True)
+    #Everything was pruned, the next change would be latest + 1
+    oldest = bounds["oldest"] if bounds["oldest"] is not None else latest + 1
+    if since_version < oldest - 1:
+        return {"version": latest, "reset": True, "changes": []}
+
+    changes = execute_query(SQL("""
+        SELECT * FROM (
+            SELECT DISTINCT ON (entry_id) version, entry_id, op
+            FROM read_list_changes
+            WHERE version > %s AND version <= %s
+            ORDER BY entry_id, version DESC
+        ) latest_changes
+        ORDER BY version
+    """), (since_version, latest), prepare=True)
+
+    entry_ids = [change["entry_id"] for change in changes if change["op"] != "delete"]
+    entries = {}
+    if entry_ids:
+        for entry in execute_query(SQL(_READ_LIST_SELECT + "WHERE r.id = ANY(%s)"), (entry_ids,), prepare=True):
+            entry['status'] = _int_to_status_string(entry['status'])
+            entries[entry["id"]] = entry
+
+    result_changes = []
+    for change in changes:
+        entry = entries.get(change["entry_id"])
+        #Deleted after this change was logged, a later delete change will follow
+        op = change["op"] if change["op"] == "delete" or entry else "delete"
+        result_changes.append({
+            "version": change["version"],
+            "op": op,
+            "id": change["entry_id"],
+            "entry": entry if op != "delete" else None
+        })
+    return {"version": latest, "reset": False, "changes": result_changes}
+
+
+#Fixed hot queries are prepared (prepare=True), parsed and planned once per pooled connection
+@cached_with_version(READ_LIST_CACHE)
 def get_read_list() -> List[Dict[str, Any]]:
-    query = SQL("SELECT * FROM read_list ORDER BY updated_at DESC")
-    results = execute_query(query)
+    query = SQL(_READ_LIST_SELECT + "ORDER BY r.updated_at DESC")
+    results = execute_query(query, prepare=True)
     for result in results:
         result['status'] = _int_to_status_string(result['status'])
     return results
 
-#Unused
-def get_read_list_entry(book_external_id: str) -> Optional[Dict[str, Any]]:
-    query = SQL("SELECT * FROM read_list WHERE book_external_id = %s")
-    result = execute_one(query, (book_external_id,))
+#Uncached, for checks that must see other workers' writes
+def _select_read_list_entry(book_external_id: str) -> Optional[Dict[str, Any]]:
+    query = SQL(_READ_LIST_SELECT + "WHERE r.book_external_id = %s")
+    result = execute_one(query, (book_external_id,), prepare=True)
     if result:
         result['status'] = _int_to_status_string(result['status'])
     return result
 
 
+#Unused
+@cached_with_version(READ_LIST_CACHE)
+def get_read_list_entry(book_external_id: str) -> Optional[Dict[str, Any]]:
+    return _select_read_list_entry(book_external_id)
+
+
+@cached_with_version(READ_LIST_CACHE)
 def get_read_list_entry_by_id(entry_id: int) -> Optional[Dict[str, Any]]:
-    query = SQL("SELECT * FROM read_list WHERE id = %s")
-    result = execute_one(query, (entry_id,))
+    query = SQL(_READ_LIST_SELECT + "WHERE r.id = %s")
+    result = execute_one(query, (entry_id,), prepare=True)
     if result:
         result['status'] = _int_to_status_string(result['status'])
     return result
 
 
+#Returns the existing entry if the book is already in the list
 def add_to_read_list(book_external_id: str, title: str, description: Optional[str], author: str, cover_i: Optional[int], status: int) -> Dict[str, Any]:
-    existing = get_read_list_entry(book_external_id)
-    if existing:
-        return existing
-    
+    #No cached existence check: another worker may have added the book before its change reached us
     query = SQL("""
         INSERT INTO read_list (book_external_id, title, description, author, cover_i, status)
         VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (book_external_id) DO NOTHING
         RETURNING *
     """)
-    result = execute_one(query, (book_external_id, title, description, author, cover_i, status))
+    result = execute_one(query, (book_external_id, title, description, author, cover_i, status), prepare=True)
     if result is None:
-        raise Exception("Failed to add book to read list")
+        existing = _select_read_list_entry(book_external_id)
+        if existing is None:
+            raise Exception("Failed to add book to read list")
+        return existing
+    bump_cache_generation(READ_LIST_CACHE)
     result['status'] = _int_to_status_string(result['status'])
     return result
 
@@ -95,7 +176,9 @@ def update_read_list_entry(book_external_id: str, status: Optional[int] = None)
         WHERE book_external_id = %s
         RETURNING *
     """)
-    return execute_one(query, tuple(params))
+    result = execute_one(query, tuple(params))
+    bump_cache_generation(READ_LIST_CACHE)
+    return result
 
 
 def update_read_list_entry_by_id(entry_id: int, status: str) -> Optional[Dict[str, Any]]:
@@ -108,7 +191,8 @@ def update_read_list_entry_by_id(entry_id: int, status: str) -> Optional[Dict[st
         WHERE id = %s
         RETURNING *
     """)
-    result = execute_one(query, (int_status, entry_id))
+    result = execute_one(query, (int_status, entry_id), prepare=True)
+    bump_cache_generation(READ_LIST_CACHE)
     if result:
         result['status'] = _int_to_status_string(result['status'])
     return result
@@ -116,9 +200,13 @@ def update_read_list_entry_by_id(entry_id: int, status: str) -> Optional[Dict[st
 #Unused
 def remove_from_read_list(book_external_id: str) -> int:
     query = SQL("DELETE FROM read_list WHERE book_external_id = %s")
-    return execute_command(query, (book_external_id,))
+    rows_deleted = execute_command(query, (book_external_id,), prepare=True)
+    bump_cache_generation(READ_LIST_CACHE)
+    return rows_deleted
 
 
 def remove_from_read_list_by_id(entry_id: int) -> int:
     query = SQL("DELETE FROM read_list WHERE id = %s")
-    return execute_command(query, (entry_id,))
+    rows_deleted = execute_command(query, (entry_id,), prepare=True)
+    bump_cache_generation(READ_LIST_CACHE)
+    return rows_deleted
@@ -17,4 +17,4 @@ Please change the parent <Route path="${D}"> to <Route path="${D==="/"?"*":`${D}
             ${w}px !important;
             top: ${b}px !important;
           }
-        `),()=>{M.contains(N)&&M.removeChild(N)}},[i]),E.jsx(N2,{isPresent:i,childRef:d,sizeRef:f,children:S.cloneElement(n,{ref:m})})}const w2=({children:n,initial:i,isPresent:s,onExitComplete:o,custom:c,presenceAffectsLayout:d,mode:f,anchorX:p,root:m})=>{const y=yf(j2),g=S.useId();let b=!0,T=S.useMemo(()=>(b=!1,{id:g,initial:i,isPresent:s,custom:c,onExitComplete:C=>{y.set(C,!0);for(const w of y.values())if(!w)return;o&&o()},register:C=>(y.set(C,!1),()=>y.delete(C))}),[s,y,o]);return d&&b&&(T={...T}),S.useMemo(()=>{y.forEach((C,w)=>y.set(w,!1))},[s]),S.useEffect(()=>{!s&&!y.size&&o&&o()},[s]),f==="popLayout"&&(n=E.jsx(z2,{isPresent:s,anchorX:p,root:m,children:n})),E.jsx(Ho.Provider,{value:T,children:n})};function j2(){return new Map}function Q0(n=!0){const i=S.useContext(Ho);if(i===null)return[!0,null];const{isPresent:s,onExitComplete:o,register:c}=i,d=S.useId();S.useEffect(()=>{if(n)return c(d)},[n]);const f=S.useCallback(()=>n&&o&&o(d),[d,o,n]);return!s&&o?[!1,f]:[!0]}const bo=n=>n.key||"";function zy(n){const i=[];return S.Children.forEach(n,s=>{S.isValidElement(s)&&i.push(s)}),i}const ko=({children:n,custom:i,initial:s=!0,onExitComplete:o,presenceAffectsLayout:c=!0,mode:d="sync",propagate:f=!1,anchorX:p="left",root:m})=>{const[y,g]=Q0(f),b=S.useMemo(()=>zy(n),[n]),T=f&&!y?[]:b.map(bo),C=S.useRef(!0),w=S.useRef(b),N=yf(()=>new Map),[M,R]=S.useState(b),[D,O]=S.useState(b);t0(()=>{C.current=!1,w.current=b;for(let Q=0;Q<D.length;Q++){const U=bo(D[Q]);T.includes(U)?N.delete(U):N.get(U)!==!0&&N.set(U,!1)}},[D,T.length,T.join("-")]);const q=[];if(b!==M){let Q=[...b];for(let U=0;U<D.length;U++){const Z=D[U],tt=bo(Z);T.includes(tt)||(Q.splice(U,0,Z),q.push(Z))}return d==="wait"&&q.length&&(Q=q),O(zy(Q)),R(b),null}const{forceRender:Y}=S.useContext(pf);return E.jsx(E.Fragment,{children:D.map(Q=>{const U=bo(Q),Z=f&&!y?!1:b===D||T.includes(U),tt=()=>{if(N.has(U))N.set(U,!0);else return;let lt=!0;N.forEach(St=>{St||(lt=!1)}),lt&&(Y?.(),O(w.current),f&&g?.(),o&&o())};return E.jsx(w2,{isPresent:Z,initial:!C.current||s?void 0:!1,custom:i,presenceAffectsLayout:c,mode:d,root:m,onExitComplete:Z?void 0:tt,anchorX:p,children:Q},U)})})},Z0=S.createContext({strict:!1}),wy={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},Ci={};for(const n in wy)Ci[n]={isEnabled:i=>wy[n].some(s=>!!i[s])};function L2(n){for(const i in n)Ci[i]={...Ci[i],...n[i]}}const B2=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function No(n){return n.startsWith("while")||n.startsWith("drag")&&n!=="draggable"||n.startsWith("layout")||n.startsWith("onTap")||n.startsWith("onPan")||n.startsWith("onLayout")||B2.has(n)}let P0=n=>!No(n);function V2(n){typeof n=="function"&&(P0=i=>i.startsWith("on")?!No(i):n(i))}try{V2(require("@emotion/is-prop-valid").default)}catch{}function U2(n,i,s){const o={};for(const c in n)c==="values"&&typeof n.values=="object"||(P0(c)||s===!0&&No(c)||!i&&!No(c)||n.draggable&&c.startsWith("onDrag"))&&(o[c]=n[c]);return o}const Yo=S.createContext({});function qo(n){return n!==null&&typeof n=="object"&&typeof n.start=="function"}function kl(n){return typeof n=="string"||Array.isArray(n)}const Hf=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],kf=["initial",...Hf];function Go(n){return qo(n.animate)||kf.some(i=>kl(n[i]))}function J0(n){return!!(Go(n)||n.variants)}function H2(n,i){if(Go(n)){const{initial:s,animate:o}=n;return{initial:s===!1||kl(s)?s:void 0,animate:kl(o)?o:void 0}}return n.inherit!==!1?i:{}}function k2(n){const{initial:i,animate:s}=H2(n,S.useContext(Yo));return S.useMemo(()=>({initial:i,animate:s}),[jy(i),jy(s)])}function jy(n){return Array.isArray(n)?n.join(" "):n}function Ly(n,i){return i.max===i.min?0:n/(i.max-i.min)*100}const Ml={correct:(n,i)=>{if(!i.target)return n;if(typeof n=="string")if(at.test(n))n=parseFloat(n);else return n;const s=Ly(n,i.target.x),o=Ly(n,i.target.y);return`${s}% ${o}%`}},Y2={correct:(n,{treeScale:i,projectionDelta:s})=>{const o=n,c=aa.parse(n);if(c.length>5)return o;const d=aa.createTransformer(n),f=typeof c[0]!="number"?1:0,p=s.x.scale*i.x,m=s.y.scale*i.y;c[0+f]/=p,c[1+f]/=m;const y=Ut(p,m,.5);return typeof c[2+f]=="number"&&(c[2+f]/=y),typeof c[3+f]=="number"&&(c[3+f]/=y),d(c)}},$c={borderRadius:{...Ml,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:Ml,borderTopRightRadius:Ml,borderBottomLeftRadius:Ml,borderBottomRightRadius:Ml,boxShadow:Y2};function F0(n,{layout:i,layoutId:s}){return zi.has(n)||n.startsWith("origin")||(i||s!==void 0)&&(!!$c[n]||n==="opacity")}const q2={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},G2=Ni.length;function X2(n,i,s){let o="",c=!0;for(let d=0;d<G2;d++){const f=Ni[d],p=n[f];if(p===void 0)continue;let m=!0;if(typeof p=="number"?m=p===(f.startsWith("scale")?1:0):m=parseFloat(p)===0,!m||s){const y=k0(p,Lf[f]);if(!m){c=!1;const g=q2[f]||f;o+=`${g}(${y}) `}s&&(i[f]=y)}}return o=o.trim(),s?o=s(i,c?"":o):c&&(o="none"),o}function Yf(n,i,s){const{style:o,vars:c,transformOrigin:d}=n;let f=!1,p=!1;for(const m in i){const y=i[m];if(zi.has(m)){f=!0;continue}else if(g0(m)){c[m]=y;continue}else{const g=k0(y,Lf[m]);m.startsWith("origin")?(p=!0,d[m]=g):o[m]=g}}if(i.transform||(f||s?o.transform=X2(i,n.transform,s):o.transform&&(o.transform="none")),p){const{originX:m="50%",originY:y="50%",originZ:g=0}=d;o.transformOrigin=`${m} ${y} ${g}`}}const qf=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function $0(n,i,s){for(const o in i)!re(i[o])&&!F0(o,s)&&(n[o]=i[o])}function K2({transformTemplate:n},i){return S.useMemo(()=>{const s=qf();return Yf(s,i,n),Object.assign({},s.vars,s.style)},[i])}function Q2(n,i){const s=n.style||{},o={};return $0(o,s,n),Object.assign(o,K2(n,i)),o}function Z2(n,i){const s={},o=Q2(n,i);return n.drag&&n.dragListener!==!1&&(s.draggable=!1,o.userSelect=o.WebkitUserSelect=o.WebkitTouchCallout="none",o.touchAction=n.drag===!0?"none":`pan-${n.drag==="x"?"y":"x"}`),n.tabIndex===void 0&&(n.onTap||n.onTapStart||n.whileTap)&&(s.tabIndex=0),s.style=o,s}const P2={offset:"stroke-dashoffset",array:"stroke-dasharray"},J2={offset:"strokeDashoffset",array:"strokeDasharray"};function F2(n,i,s=1,o=0,c=!0){n.pathLength=1;const d=c?P2:J2;n[d.offset]=at.transform(-o);const f=at.transform(i),p=at.transform(s);n[d.array]=`${f} ${p}`}function W0(n,{attrX:i,attrY:s,attrScale:o,pathLength:c,pathSpacing:d=1,pathOffset:f=0,...p},m,y,g){if(Yf(n,p,y),m){n.style.viewBox&&(n.attrs.viewBox=n.style.viewBox);return}n.attrs=n.style,n.style={};const{attrs:b,style:T}=n;b.transform&&(T.transform=b.transform,delete b.transform),(T.transform||b.transformOrigin)&&(T.transformOrigin=b.transformOrigin??"50% 50%",delete b.transformOrigin),T.transform&&(T.transformBox=g?.transformBox??"fill-box",delete b.transformBox),i!==void 0&&(b.x=i),s!==void 0&&(b.y=s),o!==void 0&&(b.scale=o),c!==void 0&&F2(b,c,d,f,!1)}const I0=()=>({...qf(),attrs:{}}),tv=n=>typeof n=="string"&&n.toLowerCase()==="svg";function $2(n,i,s,o){const c=S.useMemo(()=>{const d=I0();return W0(d,i,tv(o),n.transformTemplate,n.style),{...d.attrs,style:{...d.style}}},[i]);if(n.style){const d={};$0(d,n.style,n),c.style={...d,...c.style}}return c}const W2=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Gf(n){return typeof n!="string"||n.includes("-")?!1:!!(W2.indexOf(n)>-1||/[A-Z]/u.test(n))}function I2(n,i,s,{latestValues:o},c,d=!1){const p=(Gf(n)?$2:Z2)(i,o,c,n),m=U2(i,typeof n=="string",d),y=n!==S.Fragment?{...m,...p,ref:s}:{},{children:g}=i,b=S.useMemo(()=>re(g)?g.get():g,[g]);return S.createElement(n,{...y,children:b})}function By(n){const i=[{},{}];return n?.values.forEach((s,o)=>{i[0][o]=s.get(),i[1][o]=s.getVelocity()}),i}function Xf(n,i,s,o){if(typeof i=="function"){const[c,d]=By(o);i=i(s!==void 0?s:n.custom,c,d)}if(typeof i=="string"&&(i=n.variants&&n.variants[i]),typeof i=="function"){const[c,d]=By(o);i=i(s!==void 0?s:n.custom,c,d)}return i}function Ao(n){return re(n)?n.get():n}function t_({scrapeMotionValuesFromProps:n,createRenderState:i},s,o,c){return{latestValues:e_(s,o,c,n),renderState:i()}}function e_(n,i,s,o){const c={},d=o(n,{});for(const T in d)c[T]=Ao(d[T]);let{initial:f,animate:p}=n;const m=Go(n),y=J0(n);i&&y&&!m&&n.inherit!==!1&&(f===void 0&&(f=i.initial),p===void 0&&(p=i.animate));let g=s?s.initial===!1:!1;g=g||f===!1;const b=g?p:f;if(b&&typeof b!="boolean"&&!qo(b)){const T=Array.isArray(b)?b:[b];for(let C=0;C<T.length;C++){const w=Xf(n,T[C]);if(w){const{transitionEnd:N,transition:M,...R}=w;for(const D in R){let O=R[D];if(Array.isArray(O)){const q=g?O.length-1:0;O=O[q]}O!==null&&(c[D]=O)}for(const D in N)c[D]=N[D]}}}return c}const ev=n=>(i,s)=>{const o=S.useContext(Yo),c=S.useContext(Ho),d=()=>t_(n,i,o,c);return s?d():yf(d)};function Kf(n,i,s){const{style:o}=n,c={};for(const d in o)(re(o[d])||i.style&&re(i.style[d])||F0(d,n)||s?.getValue(d)?.liveStyle!==void 0)&&(c[d]=o[d]);return c}const n_=ev({scrapeMotionValuesFromProps:Kf,createRenderState:qf});function nv(n,i,s){const o=Kf(n,i,s);for(const c in n)if(re(n[c])||re(i[c])){const d=Ni.indexOf(c)!==-1?"attr"+c.charAt(0).toUpperCase()+c.substring(1):c;o[d]=n[c]}return o}const a_=ev({scrapeMotionValuesFromProps:nv,createRenderState:I0}),i_=Symbol.for("motionComponentSymbol");function Ti(n){return n&&typeof n=="object"&&Object.prototype.hasOwnProperty.call(n,"current")}function l_(n,i,s){return S.useCallback(o=>{o&&n.onMount&&n.onMount(o),i&&(o?i.mount(o):i.unmount()),s&&(typeof s=="function"?s(o):Ti(s)&&(s.current=o))},[i])}const Qf=n=>n.replace(/([a-z])([A-Z])/gu,"$1-$2").toLowerCase(),s_="framerAppearId",av="data-"+Qf(s_),iv=S.createContext({});function o_(n,i,s,o,c){const{visualElement:d}=S.useContext(Yo),f=S.useContext(Z0),p=S.useContext(Ho),m=S.useContext(Uf).reducedMotion,y=S.useRef(null);o=o||f.renderer,!y.current&&o&&(y.current=o(n,{visualState:i,parent:d,props:s,presenceContext:p,blockInitialAnimation:p?p.initial===!1:!1,reducedMotionConfig:m}));const g=y.current,b=S.useContext(iv);g&&!g.projection&&c&&(g.type==="html"||g.type==="svg")&&r_(y.current,s,c,b);const T=S.useRef(!1);S.useInsertionEffect(()=>{g&&T.current&&g.update(s,p)});const C=s[av],w=S.useRef(!!C&&!window.MotionHandoffIsComplete?.(C)&&window.MotionHasOptimisedAnimation?.(C));return t0(()=>{g&&(T.current=!0,window.MotionIsMounted=!0,g.updateFeatures(),g.scheduleRenderMicrotask(),w.current&&g.animationState&&g.animationState.animateChanges())}),S.useEffect(()=>{g&&(!w.current&&g.animationState&&g.animationState.animateChanges(),w.current&&(queueMicrotask(()=>{window.MotionHandoffMarkAsComplete?.(C)}),w.current=!1),g.enteringChildren=void 0)}),g}function r_(n,i,s,o){const{layoutId:c,layout:d,drag:f,dragConstraints:p,layoutScroll:m,layoutRoot:y,layoutCrossfade:g}=i;n.projection=new s(n.latestValues,i["data-framer-portal-id"]?void 0:lv(n.parent)),n.projection.setOptions({layoutId:c,layout:d,alwaysMeasureLayout:!!f||p&&Ti(p),visualElement:n,animationType:typeof d=="string"?d:"both",initialPromotionConfig:o,crossfade:g,layoutScroll:m,layoutRoot:y})}function lv(n){if(n)return n.options.allowProjection!==!1?n.projection:lv(n.parent)}function Ec(n,{forwardMotionProps:i=!1}={},s,o){s&&L2(s);const c=Gf(n)?a_:n_;function d(p,m){let y;const g={...S.useContext(Uf),...p,layoutId:u_(p)},{isStatic:b}=g,T=k2(p),C=c(p,b);if(!b&&gf){c_();const w=f_(g);y=w.MeasureLayout,T.visualElement=o_(n,C,g,o,w.ProjectionNode)}return E.jsxs(Yo.Provider,{value:T,children:[y&&T.visualElement?E.jsx(y,{visualElement:T.visualElement,...g}):null,I2(n,p,l_(C,T.visualElement,m),C,b,i)]})}d.displayName=`motion.${typeof n=="string"?n:`create(${n.displayName??n.name??""})`}`;const f=S.forwardRef(d);return f[i_]=n,f}function u_({layoutId:n}){const i=S.useContext(pf).id;return i&&n!==void 0?i+"-"+n:n}function c_(n,i){S.useContext(Z0).strict}function f_(n){const{drag:i,layout:s}=Ci;if(!i&&!s)return{};const o={...i,...s};return{MeasureLayout:i?.isEnabled(n)||s?.isEnabled(n)?o.MeasureLayout:void 0,ProjectionNode:o.ProjectionNode}}function d_(n,i){if(typeof Proxy>"u")return Ec;const s=new Map,o=(d,f)=>Ec(d,f,n,i),c=(d,f)=>o(d,f);return new Proxy(c,{get:(d,f)=>f==="create"?o:(s.has(f)||s.set(f,Ec(f,void 0,n,i)),s.get(f))})}function sv({top:n,left:i,right:s,bottom:o}){return{x:{min:i,max:s},y:{min:n,max:o}}}function h_({x:n,y:i}){return{top:i.min,right:n.max,bottom:i.max,left:n.min}}function m_(n,i){if(!i)return n;const s=i({x:n.left,y:n.top}),o=i({x:n.right,y:n.bottom});return{top:s.y,left:s.x,bottom:o.y,right:o.x}}function _c(n){return n===void 0||n===1}function Wc({scale:n,scaleX:i,scaleY:s}){return!_c(n)||!_c(i)||!_c(s)}function Ca(n){return Wc(n)||ov(n)||n.z||n.rotate||n.rotateX||n.rotateY||n.skewX||n.skewY}function ov(n){return Vy(n.x)||Vy(n.y)}function Vy(n){return n&&n!=="0%"}function zo(n,i,s){const o=n-s,c=i*o;return s+c}function Uy(n,i,s,o,c){return c!==void 0&&(n=zo(n,c,o)),zo(n,s,o)+i}function Ic(n,i=0,s=1,o,c){n.min=Uy(n.min,i,s,o,c),n.max=Uy(n.max,i,s,o,c)}function rv(n,{x:i,y:s}){Ic(n.x,i.translate,i.scale,i.originPoint),Ic(n.y,s.translate,s.scale,s.originPoint)}const Hy=.999999999999,ky=1.0000000000001;function p_(n,i,s,o=!1){const c=s.length;if(!c)return;i.x=i.y=1;let d,f;for(let p=0;p<c;p++){d=s[p],f=d.projectionDelta;const{visualElement:m}=d.options;m&&m.props.style&&m.props.style.display==="contents"||(o&&d.options.layoutScroll&&d.scroll&&d!==d.root&&xi(n,{x:-d.scroll.offset.x,y:-d.scroll.offset.y}),f&&(i.x*=f.x.scale,i.y*=f.y.scale,rv(n,f)),o&&Ca(d.latestValues)&&xi(n,d.latestValues))}i.x<ky&&i.x>Hy&&(i.x=1),i.y<ky&&i.y>Hy&&(i.y=1)}function Si(n,i){n.min=n.min+i,n.max=n.max+i}function Yy(n,i,s,o,c=.5){const d=Ut(n.min,n.max,c);Ic(n,i,s,d,o)}function xi(n,i){Yy(n.x,i.x,i.scaleX,i.scale,i.originX),Yy(n.y,i.y,i.scaleY,i.scale,i.originY)}function uv(n,i){return sv(m_(n.getBoundingClientRect(),i))}function y_(n,i,s){const o=uv(n,s),{scroll:c}=i;return c&&(Si(o.x,c.offset.x),Si(o.y,c.offset.y)),o}const qy=()=>({translate:0,scale:1,origin:0,originPoint:0}),Ei=()=>({x:qy(),y:qy()}),Gy=()=>({min:0,max:0}),Wt=()=>({x:Gy(),y:Gy()}),tf={current:null},cv={current:!1};function g_(){if(cv.current=!0,!!gf)if(window.matchMedia){const n=window.matchMedia("(prefers-reduced-motion)"),i=()=>tf.current=n.matches;n.addEventListener("change",i),i()}else tf.current=!1}const v_=new WeakMap;function b_(n,i,s){for(const o in i){const c=i[o],d=s[o];if(re(c))n.addValue(o,c);else if(re(d))n.addValue(o,Ai(c,{owner:n}));else if(d!==c)if(n.hasValue(o)){const f=n.getValue(o);f.liveStyle===!0?f.jump(c):f.hasAnimated||f.set(c)}else{const f=n.getStaticValue(o);n.addValue(o,Ai(f!==void 0?f:c,{owner:n}))}}for(const o in s)i[o]===void 0&&n.removeValue(o);return i}const Xy=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"];class T_{scrapeMotionValuesFromProps(i,s,o){return{}}constructor({parent:i,props:s,presenceContext:o,reducedMotionConfig:c,blockInitialAnimation:d,visualState:f},p={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=wf,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{const T=Te.now();this.renderScheduledAt<T&&(this.renderScheduledAt=T,Vt.render(this.render,!1,!0))};const{latestValues:m,renderState:y}=f;this.latestValues=m,this.baseTarget={...m},this.initialValues=s.initial?{...m}:{},this.renderState=y,this.parent=i,this.props=s,this.presenceContext=o,this.depth=i?i.depth+1:0,this.reducedMotionConfig=c,this.options=p,this.blockInitialAnimation=!!d,this.isControllingVariants=Go(s),this.isVariantNode=J0(s),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(i&&i.current);const{willChange:g,...b}=this.scrapeMotionValuesFromProps(s,{},this);for(const T in b){const C=b[T];m[T]!==void 0&&re(C)&&C.set(m[T])}}mount(i){this.current=i,v_.set(i,this),this.projection&&!this.projection.instance&&this.projection.mount(i),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((s,o)=>this.bindToMotionValue(o,s)),cv.current||g_(),this.shouldReduceMotion=this.reducedMotionConfig==="never"?!1:this.reducedMotionConfig==="always"?!0:tf.current,this.parent?.addChild(this),this.update(this.props,this.presenceContext)}unmount(){this.projection&&this.projection.unmount(),na(this.notifyUpdate),na(this.render),this.valueSubscriptions.forEach(i=>i()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent?.removeChild(this);for(const i in this.events)this.events[i].clear();for(const i in this.features){const s=this.features[i];s&&(s.unmount(),s.isMounted=!1)}this.current=null}addChild(i){this.children.add(i),this.enteringChildren??(this.enteringChildren=new Set),this.enteringChildren.add(i)}removeChild(i){this.children.delete(i),this.enteringChildren&&this.enteringChildren.delete(i)}bindToMotionValue(i,s){this.valueSubscriptions.has(i)&&this.valueSubscriptions.get(i)();const o=zi.has(i);o&&this.onBindTransform&&this.onBindTransform();const c=s.on("change",f=>{this.latestValues[i]=f,this.props.onUpdate&&Vt.preRender(this.notifyUpdate),o&&this.projection&&(this.projection.isTransformDirty=!0),this.scheduleRender()});let d;window.MotionCheckAppearSync&&(d=window.MotionCheckAppearSync(this,i,s)),this.valueSubscriptions.set(i,()=>{c(),d&&d(),s.owner&&s.stop()})}sortNodePosition(i){return!this.current||!this.sortInstanceNodePosition||this.type!==i.type?0:this.sortInstanceNodePosition(this.current,i.current)}updateFeatures(){let i="animation";for(i in Ci){const s=Ci[i];if(!s)continue;const{isEnabled:o,Feature:c}=s;if(!this.features[i]&&c&&o(this.props)&&(this.features[i]=new c(this)),this.features[i]){const d=this.features[i];d.isMounted?d.update():(d.mount(),d.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):Wt()}getStaticValue(i){return this.latestValues[i]}setStaticValue(i,s){this.latestValues[i]=s}update(i,s){(i.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=i,this.prevPresenceContext=this.presenceContext,this.presenceContext=s;for(let o=0;o<Xy.length;o++){const c=Xy[o];this.propEventSubscriptions[c]&&(this.propEventSubscriptions[c](),delete this.propEventSubscriptions[c]);const d="on"+c,f=i[d];f&&(this.propEventSubscriptions[c]=this.on(c,f))}this.prevMotionValues=b_(this,this.scrapeMotionValuesFromProps(i,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(i){return this.props.variants?this.props.variants[i]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(i){const s=this.getClosestVariantNode();if(s)return s.variantChildren&&s.variantChildren.add(i),()=>s.variantChildren.delete(i)}addValue(i,s){const o=this.values.get(i);s!==o&&(o&&this.removeValue(i),this.bindToMotionValue(i,s),this.values.set(i,s),this.latestValues[i]=s.get())}removeValue(i){this.values.delete(i);const s=this.valueSubscriptions.get(i);s&&(s(),this.valueSubscriptions.delete(i)),delete this.latestValues[i],this.removeValueFromRenderState(i,this.renderState)}hasValue(i){return this.values.has(i)}getValue(i,s){if(this.props.values&&this.props.values[i])return this.props.values[i];let o=this.values.get(i);return o===void 0&&s!==void 0&&(o=Ai(s===null?void 0:s,{owner:this}),this.addValue(i,o)),o}readValue(i,s){let o=this.latestValues[i]!==void 0||!this.current?this.latestValues[i]:this.getBaseTargetFromProps(this.props,i)??this.readValueFromInstance(this.current,i,this.options);return o!=null&&(typeof o=="string"&&(e0(o)||a0(o))?o=parseFloat(o):!D2(o)&&aa.test(s)&&(o=H0(i,s)),this.setBaseTarget(i,re(o)?o.get():o)),re(o)?o.get():o}setBaseTarget(i,s){this.baseTarget[i]=s}getBaseTarget(i){const{initial:s}=this.props;let o;if(typeof s=="string"||typeof s=="object"){const d=Xf(this.props,s,this.presenceContext?.custom);d&&(o=d[i])}if(s&&o!==void 0)return o;const c=this.getBaseTargetFromProps(this.props,i);return c!==void 0&&!re(c)?c:this.initialValues[i]!==void 0&&o===void 0?void 0:this.baseTarget[i]}on(i,s){return this.events[i]||(this.events[i]=new xf),this.events[i].add(s)}notify(i,...s){this.events[i]&&this.events[i].notify(...s)}scheduleRenderMicrotask(){Bf.render(this.render)}}class fv extends T_{constructor(){super(...arguments),this.KeyframeResolver=y2}sortInstanceNodePosition(i,s){return i.compareDocumentPosition(s)&2?1:-1}getBaseTargetFromProps(i,s){return i.style?i.style[s]:void 0}removeValueFromRenderState(i,{vars:s,style:o}){delete s[i],delete o[i]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:i}=this.props;re(i)&&(this.childSubscription=i.on("change",s=>{this.current&&(this.current.textContent=`${s}`)}))}}function dv(n,{style:i,vars:s},o,c){const d=n.style;let f;for(f in i)d[f]=i[f];c?.applyProjectionStyles(d,o);for(f in s)d.setProperty(f,s[f])}function S_(n){return window.getComputedStyle(n)}class x_ extends fv{constructor(){super(...arguments),this.type="html",this.renderInstance=dv}readValueFromInstance(i,s){if(zi.has(s))return this.projection?.isProjecting?Xc(s):LE(i,s);{const o=S_(i),c=(g0(s)?o.getPropertyValue(s):o[s])||0;return typeof c=="string"?c.trim():c}}measureInstanceViewportBox(i,{transformPagePoint:s}){return uv(i,s)}build(i,s,o){Yf(i,s,o.transformTemplate)}scrapeMotionValuesFromProps(i,s,o){return Kf(i,s,o)}}const hv=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function E_(n,i,s,o){dv(n,i,void 0,o);for(const c in i.attrs)n.setAttribute(hv.has(c)?c:Qf(c),i.attrs[c])}class __ extends fv{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1,this.measureInstanceViewportBox=Wt}getBaseTargetFromProps(i,s){return i[s]}readValueFromInstance(i,s){if(zi.has(s)){const o=U0(s);return o&&o.default||0}return s=hv.has(s)?s:Qf(s),i.getAttribute(s)}scrapeMotionValuesFromProps(i,s,o){return nv(i,s,o)}build(i,s,o){W0(i,s,this.isSVGTag,o.transformTemplate,o.style)}renderInstance(i,s,o,c){E_(i,s,o,c)}mount(i){this.isSVGTag=tv(i.tagName),super.mount(i)}}const A_=(n,i)=>Gf(n)?new __(i):new x_(i,{allowProjection:n!==S.Fragment});function _i(n,i,s){const o=n.getProps();return Xf(o,i,s!==void 0?s:o.custom,n)}const ef=n=>Array.isArray(n);function C_(n,i,s){n.hasValue(i)?n.getValue(i).set(s):n.addValue(i,Ai(s))}function R_(n){return ef(n)?n[n.length-1]||0:n}function D_(n,i){const s=_i(n,i);let{transitionEnd:o={},transition:c={},...d}=s||{};d={...d,...o};for(const f in d){const p=R_(d[f]);C_(n,f,p)}}function M_(n){return!!(re(n)&&n.add)}function nf(n,i){const s=n.getValue("willChange");if(M_(s))return s.add(i);if(!s&&Mn.WillChange){const o=new Mn.WillChange("auto");n.addValue("willChange",o),o.add(i)}}function mv(n){return n.props[av]}const O_=n=>n!==null;function N_(n,{repeat:i,repeatType:s="loop"},o){const c=n.filter(O_),d=i&&s!=="loop"&&i%2===1?0:c.length-1;return c[d]}const z_={type:"spring",stiffness:500,damping:25,restSpeed:10},w_=n=>({type:"spring",stiffness:550,damping:n===0?2*Math.sqrt(550):30,restSpeed:10}),j_={type:"keyframes",duration:.8},L_={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},B_=(n,{keyframes:i})=>i.length>2?j_:zi.has(n)?n.startsWith("scale")?w_(i[1]):z_:L_;function V_({when:n,delay:i,delayChildren:s,staggerChildren:o,staggerDirection:c,repeat:d,repeatType:f,repeatDelay:p,from:m,elapsed:y,...g}){return!!Object.keys(g).length}const Zf=(n,i,s,o={},c,d)=>f=>{const p=jf(o,n)||{},m=p.delay||o.delay||0;let{elapsed:y=0}=o;y=y-an(m);const g={keyframes:Array.isArray(s)?s:[null,s],ease:"easeOut",velocity:i.getVelocity(),...p,delay:-y,onUpdate:T=>{i.set(T),p.onUpdate&&p.onUpdate(T)},onComplete:()=>{f(),p.onComplete&&p.onComplete()},name:n,motionValue:i,element:d?void 0:c};V_(p)||Object.assign(g,B_(n,g)),g.duration&&(g.duration=an(g.duration)),g.repeatDelay&&(g.repeatDelay=an(g.repeatDelay)),g.from!==void 0&&(g.keyframes[0]=g.from);let b=!1;if((g.type===!1||g.duration===0&&!g.repeatDelay)&&(Jc(g),g.delay===0&&(b=!0)),(Mn.instantAnimations||Mn.skipAnimations)&&(b=!0,Jc(g),g.delay=0),g.allowFlatten=!p.type&&!p.ease,b&&!d&&i.get()!==void 0){const T=N_(g.keyframes,p);if(T!==void 0){Vt.update(()=>{g.onUpdate(T),g.onComplete()});return}}return p.isSync?new zf(g):new i2(g)};function U_({protectedKeys:n,needsAnimating:i},s){const o=n.hasOwnProperty(s)&&i[s]!==!0;return i[s]=!1,o}function pv(n,i,{delay:s=0,transitionOverride:o,type:c}={}){let{transition:d=n.getDefaultTransition(),transitionEnd:f,...p}=i;o&&(d=o);const m=[],y=c&&n.animationState&&n.animationState.getState()[c];for(const g in p){const b=n.getValue(g,n.latestValues[g]??null),T=p[g];if(T===void 0||y&&U_(y,g))continue;const C={delay:s,...jf(d||{},g)},w=b.get();if(w!==void 0&&!b.isAnimating&&!Array.isArray(T)&&T===w&&!C.velocity)continue;let N=!1;if(window.MotionHandoffAnimation){const R=mv(n);if(R){const D=window.MotionHandoffAnimation(R,g,Vt);D!==null&&(C.startTime=D,N=!0)}}nf(n,g),b.start(Zf(g,b,T,n.shouldReduceMotion&&L0.has(g)?{type:!1}:C,n,N));const M=b.animation;M&&m.push(M)}return f&&Promise.all(m).then(()=>{Vt.update(()=>{f&&D_(n,f)})}),m}function yv(n,i,s,o=0,c=1){const d=Array.from(n).sort((y,g)=>y.sortNodePosition(g)).indexOf(i),f=n.size,p=(f-1)*o;return typeof s=="function"?s(d,f):c===1?d*o:p-d*o}function af(n,i,s={}){const o=_i(n,i,s.type==="exit"?n.presenceContext?.custom:void 0);let{transition:c=n.getDefaultTransition()||{}}=o||{};s.transitionOverride&&(c=s.transitionOverride);const d=o?()=>Promise.all(pv(n,o,s)):()=>Promise.resolve(),f=n.variantChildren&&n.variantChildren.size?(m=0)=>{const{delayChildren:y=0,staggerChildren:g,staggerDirection:b}=c;return H_(n,i,m,y,g,b,s)}:()=>Promise.resolve(),{when:p}=c;if(p){const[m,y]=p==="beforeChildren"?[d,f]:[f,d];return m().then(()=>y())}else return Promise.all([d(),f(s.delay)])}function H_(n,i,s=0,o=0,c=0,d=1,f){const p=[];for(const m of n.variantChildren)m.notify("AnimationStart",i),p.push(af(m,i,{...f,delay:s+(typeof o=="function"?0:o)+yv(n.variantChildren,m,o,c,d)}).then(()=>m.notify("AnimationComplete",i)));return Promise.all(p)}function k_(n,i,s={}){n.notify("AnimationStart",i);let o;if(Array.isArray(i)){const c=i.map(d=>af(n,d,s));o=Promise.all(c)}else if(typeof i=="string")o=af(n,i,s);else{const c=typeof i=="function"?_i(n,i,s.custom):i;o=Promise.all(pv(n,c,s))}return o.then(()=>{n.notify("AnimationComplete",i)})}function gv(n,i){if(!Array.isArray(i))return!1;const s=i.length;if(s!==n.length)return!1;for(let o=0;o<s;o++)if(i[o]!==n[o])return!1;return!0}const Y_=kf.length;function vv(n){if(!n)return;if(!n.isControllingVariants){const s=n.parent?vv(n.parent)||{}:{};return n.props.initial!==void 0&&(s.initial=n.props.initial),s}const i={};for(let s=0;s<Y_;s++){const o=kf[s],c=n.props[o];(kl(c)||c===!1)&&(i[o]=c)}return i}const q_=[...Hf].reverse(),G_=Hf.length;function X_(n){return i=>Promise.all(i.map(({animation:s,options:o})=>k_(n,s,o)))}function K_(n){let i=X_(n),s=Ky(),o=!0;const c=m=>(y,g)=>{const b=_i(n,g,m==="exit"?n.presenceContext?.custom:void 0);if(b){const{transition:T,transitionEnd:C,...w}=b;y={...y,...w,...C}}return y};function d(m){i=m(n)}function f(m){const{props:y}=n,g=vv(n.parent)||{},b=[],T=new Set;let C={},w=1/0;for(let M=0;M<G_;M++){const R=q_[M],D=s[R],O=y[R]!==void 0?y[R]:g[R],q=kl(O),Y=R===m?D.isActive:null;Y===!1&&(w=M);let Q=O===g[R]&&O!==y[R]&&q;if(Q&&o&&n.manuallyAnimateOnMount&&(Q=!1),D.protectedKeys={...C},!D.isActive&&Y===null||!O&&!D.prevProp||qo(O)||typeof O=="boolean")continue;const U=Q_(D.prevProp,O);let Z=U||R===m&&D.isActive&&!Q&&q||M>w&&q,tt=!1;const lt=Array.isArray(O)?O:[O];let St=lt.reduce(c(R),{});Y===!1&&(St={});const{prevResolvedValues:Mt={}}=D,gt={...Mt,...St},jt=P=>{Z=!0,T.has(P)&&(tt=!0,T.delete(P)),D.needsAnimating[P]=!0;const F=n.getValue(P);F&&(F.liveStyle=!1)};for(const P in gt){const F=St[P],ct=Mt[P];if(C.hasOwnProperty(P))continue;let mt=!1;ef(F)&&ef(ct)?mt=!gv(F,ct):mt=F!==ct,mt?F!=null?jt(P):T.add(P):F!==void 0&&T.has(P)?jt(P):D.protectedKeys[P]=!0}D.prevProp=O,D.prevResolvedValues=St,D.isActive&&(C={...C,...St}),o&&n.blockInitialAnimation&&(Z=!1);const Lt=Q&&U;Z&&(!Lt||tt)&&b.push(...lt.map(P=>{const F={type:R};if(typeof P=="string"&&o&&!Lt&&n.manuallyAnimateOnMount&&n.parent){const{parent:ct}=n,mt=_i(ct,P);if(ct.enteringChildren&&mt){const{delayChildren:A}=mt.transition||{};F.delay=yv(ct.enteringChildren,n,A)}}return{animation:P,options:F}}))}if(T.size){const M={};if(typeof y.initial!="boolean"){const R=_i(n,Array.isArray(y.initial)?y.initial[0]:y.initial);R&&R.transition&&(M.transition=R.transition)}T.forEach(R=>{const D=n.getBaseTarget(R),O=n.getValue(R);O&&(O.liveStyle=!0),M[R]=D??null}),b.push({animation:M})}let N=!!b.length;return o&&(y.initial===!1||y.initial===y.animate)&&!n.manuallyAnimateOnMount&&(N=!1),o=!1,N?i(b):Promise.resolve()}function p(m,y){if(s[m].isActive===y)return Promise.resolve();n.variantChildren?.forEach(b=>b.animationState?.setActive(m,y)),s[m].isActive=y;const g=f(m);for(const b in s)s[b].protectedKeys={};return g}return{animateChanges:f,setActive:p,setAnimateFunction:d,getState:()=>s,reset:()=>{s=Ky()}}}function Q_(n,i){return typeof i=="string"?i!==n:Array.isArray(i)?!gv(i,n):!1}function _a(n=!1){return{isActive:n,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function Ky(){return{animate:_a(!0),whileInView:_a(),whileHover:_a(),whileTap:_a(),whileDrag:_a(),whileFocus:_a(),exit:_a()}}class ia{constructor(i){this.isMounted=!1,this.node=i}update(){}}class Z_ extends ia{constructor(i){super(i),i.animationState||(i.animationState=K_(i))}updateAnimationControlsSubscription(){const{animate:i}=this.node.getProps();qo(i)&&(this.unmountControls=i.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:i}=this.node.getProps(),{animate:s}=this.node.prevProps||{};i!==s&&this.updateAnimationControlsSubscription()}unmount(){this.node.animationState.reset(),this.unmountControls?.()}}let P_=0;class J_ extends ia{constructor(){super(...arguments),this.id=P_++}update(){if(!this.node.presenceContext)return;const{isPresent:i,onExitComplete:s}=this.node.presenceContext,{isPresent:o}=this.node.prevPresenceContext||{};if(!this.node.animationState||i===o)return;const c=this.node.animationState.setActive("exit",!i);s&&!i&&c.then(()=>{s(this.id)})}mount(){const{register:i,onExitComplete:s}=this.node.presenceContext||{};s&&s(this.id),i&&(this.unmount=i(this.id))}unmount(){}}const F_={animation:{Feature:Z_},exit:{Feature:J_}};function Yl(n,i,s,o={passive:!0}){return n.addEventListener(i,s,o),()=>n.removeEventListener(i,s)}function Fl(n){return{point:{x:n.pageX,y:n.pageY}}}const $_=n=>i=>Vf(i)&&n(i,Fl(i));function wl(n,i,s,o){return Yl(n,i,$_(s),o)}const bv=1e-4,W_=1-bv,I_=1+bv,Tv=.01,tA=0-Tv,eA=0+Tv;function de(n){return n.max-n.min}function nA(n,i,s){return Math.abs(n-i)<=s}function Qy(n,i,s,o=.5){n.origin=o,n.originPoint=Ut(i.min,i.max,n.origin),n.scale=de(s)/de(i),n.translate=Ut(s.min,s.max,n.origin)-n.originPoint,(n.scale>=W_&&n.scale<=I_||isNaN(n.scale))&&(n.scale=1),(n.translate>=tA&&n.translate<=eA||isNaN(n.translate))&&(n.translate=0)}function jl(n,i,s,o){Qy(n.x,i.x,s.x,o?o.originX:void 0),Qy(n.y,i.y,s.y,o?o.originY:void 0)}function Zy(n,i,s){n.min=s.min+i.min,n.max=n.min+de(i)}function aA(n,i,s){Zy(n.x,i.x,s.x),Zy(n.y,i.y,s.y)}function Py(n,i,s){n.min=i.min-s.min,n.max=n.min+de(i)}function wo(n,i,s){Py(n.x,i.x,s.x),Py(n.y,i.y,s.y)}function Ye(n){return[n("x"),n("y")]}const Sv=({current:n})=>n?n.ownerDocument.defaultView:null,Jy=(n,i)=>Math.abs(n-i);function iA(n,i){const s=Jy(n.x,i.x),o=Jy(n.y,i.y);return Math.sqrt(s**2+o**2)}class xv{constructor(i,s,{transformPagePoint:o,contextWindow:c=window,dragSnapToOrigin:d=!1,distanceThreshold:f=3}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const T=Cc(this.lastMoveEventInfo,this.history),C=this.startEvent!==null,w=iA(T.offset,{x:0,y:0})>=this.distanceThreshold;if(!C&&!w)return;const{point:N}=T,{timestamp:M}=se;this.history.push({...N,timestamp:M});const{onStart:R,onMove:D}=this.handlers;C||(R&&R(this.lastMoveEvent,T),this.startEvent=this.lastMoveEvent),D&&D(this.lastMoveEvent,T)},this.handlePointerMove=(T,C)=>{this.lastMoveEvent=T,this.lastMoveEventInfo=Ac(C,this.transformPagePoint),Vt.update(this.updatePoint,!0)},this.handlePointerUp=(T,C)=>{this.end();const{onEnd:w,onSessionEnd:N,resumeAnimation:M}=this.handlers;if(this.dragSnapToOrigin&&M&&M(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const R=Cc(T.type==="pointercancel"?this.lastMoveEventInfo:Ac(C,this.transformPagePoint),this.history);this.startEvent&&w&&w(T,R),N&&N(T,R)},!Vf(i))return;this.dragSnapToOrigin=d,this.handlers=s,this.transformPagePoint=o,this.distanceThreshold=f,this.contextWindow=c||window;const p=Fl(i),m=Ac(p,this.transformPagePoint),{point:y}=m,{timestamp:g}=se;this.history=[{...y,timestamp:g}];const{onSessionStart:b}=s;b&&b(i,Cc(m,this.history)),this.removeListeners=Zl(wl(this.contextWindow,"pointermove",this.handlePointerMove),wl(this.contextWindow,"pointerup",this.handlePointerUp),wl(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(i){this.handlers=i}end(){this.removeListeners&&this.removeListeners(),na(this.updatePoint)}}function Ac(n,i){return i?{point:i(n.point)}:n}function Fy(n,i){return{x:n.x-i.x,y:n.y-i.y}}function Cc({point:n},i){return{point:n,delta:Fy(n,Ev(i)),offset:Fy(n,lA(i)),velocity:sA(i,.1)}}function lA(n){return n[0]}function Ev(n){return n[n.length-1]}function sA(n,i){if(n.length<2)return{x:0,y:0};let s=n.length-1,o=null;const c=Ev(n);for(;s>=0&&(o=n[s],!(c.timestamp-o.timestamp>an(i)));)s--;if(!o)return{x:0,y:0};const d=qe(c.timestamp-o.timestamp);if(d===0)return{x:0,y:0};const f={x:(c.x-o.x)/d,y:(c.y-o.y)/d};return f.x===1/0&&(f.x=0),f.y===1/0&&(f.y=0),f}function oA(n,{min:i,max:s},o){return i!==void 0&&n<i?n=o?Ut(i,n,o.min):Math.max(n,i):s!==void 0&&n>s&&(n=o?Ut(s,n,o.max):Math.min(n,s)),n}function $y(n,i,s){return{min:i!==void 0?n.min+i:void 0,max:s!==void 0?n.max+s-(n.max-n.min):void 0}}function rA(n,{top:i,left:s,bottom:o,right:c}){return{x:$y(n.x,s,c),y:$y(n.y,i,o)}}function Wy(n,i){let s=i.min-n.min,o=i.max-n.max;return i.max-i.min<n.max-n.min&&([s,o]=[o,s]),{min:s,max:o}}function uA(n,i){return{x:Wy(n.x,i.x),y:Wy(n.y,i.y)}}function cA(n,i){let s=.5;const o=de(n),c=de(i);return c>o?s=Vl(i.min,i.max-o,n.min):o>c&&(s=Vl(n.min,n.max-c,i.min)),Dn(0,1,s)}function fA(n,i){const s={};return i.min!==void 0&&(s.min=i.min-n.min),i.max!==void 0&&(s.max=i.max-n.min),s}const lf=.35;function dA(n=lf){return n===!1?n=0:n===!0&&(n=lf),{x:Iy(n,"left","right"),y:Iy(n,"top","bottom")}}function Iy(n,i,s){return{min:tg(n,i),max:tg(n,s)}}function tg(n,i){return typeof n=="number"?n:n[i]||0}const hA=new WeakMap;class mA{constructor(i){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=Wt(),this.latestPointerEvent=null,this.latestPanInfo=null,this.visualElement=i}start(i,{snapToCursor:s=!1,distanceThreshold:o}={}){const{presenceContext:c}=this.visualElement;if(c&&c.isPresent===!1)return;const d=b=>{const{dragSnapToOrigin:T}=this.getProps();T?this.pauseAnimation():this.stopAnimation(),s&&this.snapToCursor(Fl(b).point)},f=(b,T)=>{const{drag:C,dragPropagation:w,onDragStart:N}=this.getProps();if(C&&!w&&(this.openDragLock&&this.openDragLock(),this.openDragLock=T2(C),!this.openDragLock))return;this.latestPointerEvent=b,this.latestPanInfo=T,this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Ye(R=>{let D=this.getAxisMotionValue(R).get()||0;if(ln.test(D)){const{projection:O}=this.visualElement;if(O&&O.layout){const q=O.layout.layoutBox[R];q&&(D=de(q)*(parseFloat(D)/100))}}this.originPoint[R]=D}),N&&Vt.postRender(()=>N(b,T)),nf(this.visualElement,"transform");const{animationState:M}=this.visualElement;M&&M.setActive("whileDrag",!0)},p=(b,T)=>{this.latestPointerEvent=b,this.latestPanInfo=T;const{dragPropagation:C,dragDirectionLock:w,onDirectionLock:N,onDrag:M}=this.getProps();if(!C&&!this.openDragLock)return;const{offset:R}=T;if(w&&this.currentDirection===null){this.currentDirection=pA(R),this.currentDirection!==null&&N&&N(this.currentDirection);return}this.updateAxis("x",T.point,R),this.updateAxis("y",T.point,R),this.visualElement.render(),M&&M(b,T)},m=(b,T)=>{this.latestPointerEvent=b,this.latestPanInfo=T,this.stop(b,T),this.latestPointerEvent=null,this.latestPanInfo=null},y=()=>Ye(b=>this.getAnimationState(b)==="paused"&&this.getAxisMotionValue(b).animation?.play()),{dragSnapToOrigin:g}=this.getProps();this.panSession=new xv(i,{onSessionStart:d,onStart:f,onMove:p,onSessionEnd:m,resumeAnimation:y},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:g,distanceThreshold:o,contextWindow:Sv(this.visualElement)})}stop(i,s){const o=i||this.latestPointerEvent,c=s||this.latestPanInfo,d=this.isDragging;if(this.cancel(),!d||!c||!o)return;const{velocity:f}=c;this.startAnimation(f);const{onDragEnd:p}=this.getProps();p&&Vt.postRender(()=>p(o,c))}cancel(){this.isDragging=!1;const{projection:i,animationState:s}=this.visualElement;i&&(i.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:o}=this.getProps();!o&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),s&&s.setActive("whileDrag",!1)}updateAxis(i,s,o){const{drag:c}=this.getProps();if(!o||!To(i,c,this.currentDirection))return;const d=this.getAxisMotionValue(i);let f=this.originPoint[i]+o[i];this.constraints&&this.constraints[i]&&(f=oA(f,this.constraints[i],this.elastic[i])),d.set(f)}resolveConstraints(){const{dragConstraints:i,dragElastic:s}=this.getProps(),o=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):this.visualElement.projection?.layout,c=this.constraints;i&&Ti(i)?this.constraints||(this.constraints=this.resolveRefConstraints()):i&&o?this.constraints=rA(o.layoutBox,i):this.constraints=!1,this.elastic=dA(s),c!==this.constraints&&o&&this.constraints&&!this.hasMutatedConstraints&&Ye(d=>{this.constraints!==!1&&this.getAxisMotionValue(d)&&(this.constraints[d]=fA(o.layoutBox[d],this.constraints[d]))})}resolveRefConstraints(){const{dragConstraints:i,onMeasureDragConstraints:s}=this.getProps();if(!i||!Ti(i))return!1;const o=i.current,{projection:c}=this.visualElement;if(!c||!c.layout)return!1;const d=y_(o,c.root,this.visualElement.getTransformPagePoint());let f=uA(c.layout.layoutBox,d);if(s){const p=s(h_(f));this.hasMutatedConstraints=!!p,p&&(f=sv(p))}return f}startAnimation(i){const{drag:s,dragMomentum:o,dragElastic:c,dragTransition:d,dragSnapToOrigin:f,onDragTransitionEnd:p}=this.getProps(),m=this.constraints||{},y=Ye(g=>{if(!To(g,s,this.currentDirection))return;let b=m&&m[g]||{};f&&(b={min:0,max:0});const T=c?200:1e6,C=c?40:1e7,w={type:"inertia",velocity:o?i[g]:0,bounceStiffness:T,bounceDamping:C,timeConstant:750,restDelta:1,restSpeed:10,...d,...b};return this.startAxisValueAnimation(g,w)});return Promise.all(y).then(p)}startAxisValueAnimation(i,s){const o=this.getAxisMotionValue(i);return nf(this.visualElement,i),o.start(Zf(i,o,0,s,this.visualElement,!1))}stopAnimation(){Ye(i=>this.getAxisMotionValue(i).stop())}pauseAnimation(){Ye(i=>this.getAxisMotionValue(i).animation?.pause())}getAnimationState(i){return this.getAxisMotionValue(i).animation?.state}getAxisMotionValue(i){const s=`_drag${i.toUpperCase()}`,o=this.visualElement.getProps(),c=o[s];return c||this.visualElement.getValue(i,(o.initial?o.initial[i]:void 0)||0)}snapToCursor(i){Ye(s=>{const{drag:o}=this.getProps();if(!To(s,o,this.currentDirection))return;const{projection:c}=this.visualElement,d=this.getAxisMotionValue(s);if(c&&c.layout){const{min:f,max:p}=c.layout.layoutBox[s];d.set(i[s]-Ut(f,p,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:i,dragConstraints:s}=this.getProps(),{projection:o}=this.visualElement;if(!Ti(s)||!o||!this.constraints)return;this.stopAnimation();const c={x:0,y:0};Ye(f=>{const p=this.getAxisMotionValue(f);if(p&&this.constraints!==!1){const m=p.get();c[f]=cA({min:m,max:m},this.constraints[f])}});const{transformTemplate:d}=this.visualElement.getProps();this.visualElement.current.style.transform=d?d({},""):"none",o.root&&o.root.updateScroll(),o.updateLayout(),this.resolveConstraints(),Ye(f=>{if(!To(f,i,null))return;const p=this.getAxisMotionValue(f),{min:m,max:y}=this.constraints[f];p.set(Ut(m,y,c[f]))})}addListeners(){if(!this.visualElement.current)return;hA.set(this.visualElement,this);const i=this.visualElement.current,s=wl(i,"pointerdown",m=>{const{drag:y,dragListener:g=!0}=this.getProps();y&&g&&this.start(m)}),o=()=>{const{dragConstraints:m}=this.getProps();Ti(m)&&m.current&&(this.constraints=this.resolveRefConstraints())},{projection:c}=this.visualElement,d=c.addEventListener("measure",o);c&&!c.layout&&(c.root&&c.root.updateScroll(),c.updateLayout()),Vt.read(o);const f=Yl(window,"resize",()=>this.scalePositionWithinConstraints()),p=c.addEventListener("didUpdate",(({delta:m,hasLayoutChanged:y})=>{this.isDragging&&y&&(Ye(g=>{const b=this.getAxisMotionValue(g);b&&(this.originPoint[g]+=m[g].translate,b.set(b.get()+m[g].translate))}),this.visualElement.render())}));return()=>{f(),s(),d(),p&&p()}}getProps(){const i=this.visualElement.getProps(),{drag:s=!1,dragDirectionLock:o=!1,dragPropagation:c=!1,dragConstraints:d=!1,dragElastic:f=lf,dragMomentum:p=!0}=i;return{...i,drag:s,dragDirectionLock:o,dragPropagation:c,dragConstraints:d,dragElastic:f,dragMomentum:p}}}function To(n,i,s){return(i===!0||i===n)&&(s===null||s===n)}function pA(n,i=10){let s=null;return Math.abs(n.y)>i?s="y":Math.abs(n.x)>i&&(s="x"),s}class yA extends ia{constructor(i){super(i),this.removeGroupControls=Ge,this.removeListeners=Ge,this.controls=new mA(i)}mount(){const{dragControls:i}=this.node.getProps();i&&(this.removeGroupControls=i.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||Ge}unmount(){this.removeGroupControls(),this.removeListeners()}}const eg=n=>(i,s)=>{n&&Vt.postRender(()=>n(i,s))};class gA extends ia{constructor(){super(...arguments),this.removePointerDownListener=Ge}onPointerDown(i){this.session=new xv(i,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:Sv(this.node)})}createPanHandlers(){const{onPanSessionStart:i,onPanStart:s,onPan:o,onPanEnd:c}=this.node.getProps();return{onSessionStart:eg(i),onStart:eg(s),onMove:o,onEnd:(d,f)=>{delete this.session,c&&Vt.postRender(()=>c(d,f))}}}mount(){this.removePointerDownListener=wl(this.node.current,"pointerdown",i=>this.onPointerDown(i))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}const Co={hasAnimatedSinceResize:!0,hasEverUpdated:!1};let Rc=!1;class vA extends S.Component{componentDidMount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:o,layoutId:c}=this.props,{projection:d}=i;d&&(s.group&&s.group.add(d),o&&o.register&&c&&o.register(d),Rc&&d.root.didUpdate(),d.addEventListener("animationComplete",()=>{this.safeToRemove()}),d.setOptions({...d.options,onExitComplete:()=>this.safeToRemove()})),Co.hasEverUpdated=!0}getSnapshotBeforeUpdate(i){const{layoutDependency:s,visualElement:o,drag:c,isPresent:d}=this.props,{projection:f}=o;return f&&(f.isPresent=d,Rc=!0,c||i.layoutDependency!==s||s===void 0||i.isPresent!==d?f.willUpdate():this.safeToRemove(),i.isPresent!==d&&(d?f.promote():f.relegate()||Vt.postRender(()=>{const p=f.getStack();(!p||!p.members.length)&&this.safeToRemove()}))),null}componentDidUpdate(){const{projection:i}=this.props.visualElement;i&&(i.root.didUpdate(),Bf.postRender(()=>{!i.currentAnimation&&i.isLead()&&this.safeToRemove()}))}componentWillUnmount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:o}=this.props,{projection:c}=i;Rc=!0,c&&(c.scheduleCheckAfterUnmount(),s&&s.group&&s.group.remove(c),o&&o.deregister&&o.deregister(c))}safeToRemove(){const{safeToRemove:i}=this.props;i&&i()}render(){return null}}function _v(n){const[i,s]=Q0(),o=S.useContext(pf);return E.jsx(vA,{...n,layoutGroup:o,switchLayoutGroup:S.useContext(iv),isPresent:i,safeToRemove:s})}function bA(n,i,s){const o=re(n)?n:Ai(n);return o.start(Zf("",o,i,s)),o.animation}const TA=(n,i)=>n.depth-i.depth;class SA{constructor(){this.children=[],this.isDirty=!1}add(i){vf(this.children,i),this.isDirty=!0}remove(i){bf(this.children,i),this.isDirty=!0}forEach(i){this.isDirty&&this.children.sort(TA),this.isDirty=!1,this.children.forEach(i)}}function xA(n,i){const s=Te.now(),o=({timestamp:c})=>{const d=c-s;d>=i&&(na(o),n(d-i))};return Vt.setup(o,!0),()=>na(o)}const Av=["TopLeft","TopRight","BottomLeft","BottomRight"],EA=Av.length,ng=n=>typeof n=="string"?parseFloat(n):n,ag=n=>typeof n=="number"||at.test(n);function _A(n,i,s,o,c,d){c?(n.opacity=Ut(0,s.opacity??1,AA(o)),n.opacityExit=Ut(i.opacity??1,0,CA(o))):d&&(n.opacity=Ut(i.opacity??1,s.opacity??1,o));for(let f=0;f<EA;f++){const p=`border${Av[f]}Radius`;let m=ig(i,p),y=ig(s,p);if(m===void 0&&y===void 0)continue;m||(m=0),y||(y=0),m===0||y===0||ag(m)===ag(y)?(n[p]=Math.max(Ut(ng(m),ng(y),o),0),(ln.test(y)||ln.test(m))&&(n[p]+="%")):n[p]=y}(i.rotate||s.rotate)&&(n.rotate=Ut(i.rotate||0,s.rotate||0,o))}function ig(n,i){return n[i]!==void 0?n[i]:n.borderRadius}const AA=Cv(0,.5,f0),CA=Cv(.5,.95,Ge);function Cv(n,i,s){return o=>o<n?0:o>i?1:s(Vl(n,i,o))}function lg(n,i){n.min=i.min,n.max=i.max}function Pe(n,i){lg(n.x,i.x),lg(n.y,i.y)}function sg(n,i){n.translate=i.translate,n.scale=i.scale,n.originPoint=i.originPoint,n.origin=i.origin}function og(n,i,s,o,c){return n-=i,n=zo(n,1/s,o),c!==void 0&&(n=zo(n,1/c,o)),n}function RA(n,i=0,s=1,o=.5,c,d=n,f=n){if(ln.test(i)&&(i=parseFloat(i),i=Ut(f.min,f.max,i/100)-f.min),typeof i!="number")return;let p=Ut(d.min,d.max,o);n===d&&(p-=i),n.min=og(n.min,i,s,p,c),n.max=og(n.max,i,s,p,c)}function rg(n,i,[s,o,c],d,f){RA(n,i[s],i[o],i[c],i.scale,d,f)}const DA=["x","scaleX","originX"],MA=["y","scaleY","originY"];function ug(n,i,s,o){rg(n.x,i,DA,s?s.x:void 0,o?o.x:void 0),rg(n.y,i,MA,s?s.y:void 0,o?o.y:void 0)}function cg(n){return n.translate===0&&n.scale===1}function Rv(n){return cg(n.x)&&cg(n.y)}function fg(n,i){return n.min===i.min&&n.max===i.max}function OA(n,i){return fg(n.x,i.x)&&fg(n.y,i.y)}function dg(n,i){return Math.round(n.min)===Math.round(i.min)&&Math.round(n.max)===Math.round(i.max)}function Dv(n,i){return dg(n.x,i.x)&&dg(n.y,i.y)}function hg(n){return de(n.x)/de(n.y)}function mg(n,i){return n.translate===i.translate&&n.scale===i.scale&&n.originPoint===i.originPoint}class NA{constructor(){this.members=[]}add(i){vf(this.members,i),i.scheduleRender()}remove(i){if(bf(this.members,i),i===this.prevLead&&(this.prevLead=void 0),i===this.lead){const s=this.members[this.members.length-1];s&&this.promote(s)}}relegate(i){const s=this.members.findIndex(c=>i===c);if(s===0)return!1;let o;for(let c=s;c>=0;c--){const d=this.members[c];if(d.isPresent!==!1){o=d;break}}return o?(this.promote(o),!0):!1}promote(i,s){const o=this.lead;if(i!==o&&(this.prevLead=o,this.lead=i,i.show(),o)){o.instance&&o.scheduleRender(),i.scheduleRender(),i.resumeFrom=o,s&&(i.resumeFrom.preserveOpacity=!0),o.snapshot&&(i.snapshot=o.snapshot,i.snapshot.latestValues=o.animationValues||o.latestValues),i.root&&i.root.isUpdating&&(i.isLayoutDirty=!0);const{crossfade:c}=i.options;c===!1&&o.hide()}}exitAnimationComplete(){this.members.forEach(i=>{const{options:s,resumingFrom:o}=i;s.onExitComplete&&s.onExitComplete(),o&&o.options.onExitComplete&&o.options.onExitComplete()})}scheduleRender(){this.members.forEach(i=>{i.instance&&i.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function zA(n,i,s){let o="";const c=n.x.translate/i.x,d=n.y.translate/i.y,f=s?.z||0;if((c||d||f)&&(o=`translate3d(${c}px, ${d}px, ${f}px) `),(i.x!==1||i.y!==1)&&(o+=`scale(${1/i.x}, ${1/i.y}) `),s){const{transformPerspective:y,rotate:g,rotateX:b,rotateY:T,skewX:C,skewY:w}=s;y&&(o=`perspective(${y}px) ${o}`),g&&(o+=`rotate(${g}deg) `),b&&(o+=`rotateX(${b}deg) `),T&&(o+=`rotateY(${T}deg) `),C&&(o+=`skewX(${C}deg) `),w&&(o+=`skewY(${w}deg) `)}const p=n.x.scale*i.x,m=n.y.scale*i.y;return(p!==1||m!==1)&&(o+=`scale(${p}, ${m})`),o||"none"}const Dc=["","X","Y","Z"],wA=1e3;let jA=0;function Mc(n,i,s,o){const{latestValues:c}=i;c[n]&&(s[n]=c[n],i.setStaticValue(n,0),o&&(o[n]=0))}function Mv(n){if(n.hasCheckedOptimisedAppear=!0,n.root===n)return;const{visualElement:i}=n.options;if(!i)return;const s=mv(i);if(window.MotionHasOptimisedAnimation(s,"transform")){const{layout:c,layoutId:d}=n.options;window.MotionCancelOptimisedAnimation(s,"transform",Vt,!(c||d))}const{parent:o}=n;o&&!o.hasCheckedOptimisedAppear&&Mv(o)}function Ov({attachResizeListener:n,defaultParent:i,measureScroll:s,checkIsScrollRoot:o,resetTransform:c}){return class{constructor(f={},p=i?.()){this.id=jA++,this.animationId=0,this.animationCommitId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.layoutVersion=0,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,this.nodes.forEach(VA),this.nodes.forEach(YA),this.nodes.forEach(qA),this.nodes.forEach(UA)},this.resolvedRelativeTargetAt=0,this.linkedParentVersion=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=f,this.root=p?p.root||p:this,this.path=p?[...p.path,p]:[],this.parent=p,this.depth=p?p.depth+1:0;for(let m=0;m<this.path.length;m++)this.path[m].shouldResetTransform=!0;this.root===this&&(this.nodes=new SA)}addEventListener(f,p){return this.eventHandlers.has(f)||this.eventHandlers.set(f,new xf),this.eventHandlers.get(f).add(p)}notifyListeners(f,...p){const m=this.eventHandlers.get(f);m&&m.notify(...p)}hasListeners(f){return this.eventHandlers.has(f)}mount(f){if(this.instance)return;this.isSVG=K0(f)&&!C2(f),this.instance=f;const{layoutId:p,layout:m,visualElement:y}=this.options;if(y&&!y.current&&y.mount(f),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(m||p)&&(this.isLayoutDirty=!0),n){let g,b=0;const T=()=>this.root.updateBlockedByResize=!1;Vt.read(()=>{b=window.innerWidth}),n(f,()=>{const C=window.innerWidth;C!==b&&(b=C,this.root.updateBlockedByResize=!0,g&&g(),g=xA(T,250),Co.hasAnimatedSinceResize&&(Co.hasAnimatedSinceResize=!1,this.nodes.forEach(gg)))})}p&&this.root.registerSharedNode(p,this),this.options.animate!==!1&&y&&(p||m)&&this.addEventListener("didUpdate",({delta:g,hasLayoutChanged:b,hasRelativeLayoutChanged:T,layout:C})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}const w=this.options.transition||y.getDefaultTransition()||ZA,{onLayoutAnimationStart:N,onLayoutAnimationComplete:M}=y.getProps(),R=!this.targetLayout||!Dv(this.targetLayout,C),D=!b&&T;if(this.options.layoutRoot||this.resumeFrom||D||b&&(R||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0);const O={...jf(w,"layout"),onPlay:N,onComplete:M};(y.shouldReduceMotion||this.options.layoutRoot)&&(O.delay=0,O.type=!1),this.startAnimation(O),this.setAnimationOrigin(g,D)}else b||gg(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=C})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const f=this.getStack();f&&f.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),na(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(GA),this.animationId++)}getTransformTemplate(){const{visualElement:f}=this.options;return f&&f.getProps().transformTemplate}willUpdate(f=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&Mv(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let g=0;g<this.path.length;g++){const b=this.path[g];b.shouldResetTransform=!0,b.updateScroll("snapshot"),b.options.layoutRoot&&b.willUpdate(!1)}const{layoutId:p,layout:m}=this.options;if(p===void 0&&!m)return;const y=this.getTransformTemplate();this.prevTransformTemplateValue=y?y(this.latestValues,""):void 0,this.updateSnapshot(),f&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(pg);return}if(this.animationId<=this.animationCommitId){this.nodes.forEach(yg);return}this.animationCommitId=this.animationId,this.isUpdating?(this.isUpdating=!1,this.nodes.forEach(kA),this.nodes.forEach(LA),this.nodes.forEach(BA)):this.nodes.forEach(yg),this.clearAllSnapshots();const p=Te.now();se.delta=Dn(0,1e3/60,p-se.timestamp),se.timestamp=p,se.isProcessing=!0,gc.update.process(se),gc.preRender.process(se),gc.render.process(se),se.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,Bf.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(HA),this.sharedNodes.forEach(XA)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Vt.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Vt.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!de(this.snapshot.measuredBox.x)&&!de(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let m=0;m<this.path.length;m++)this.path[m].updateScroll();const f=this.layout;this.layout=this.measure(!1),this.layoutVersion++,this.layoutCorrected=Wt(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:p}=this.options;p&&p.notify("LayoutMeasure",this.layout.layoutBox,f?f.layoutBox:void 0)}updateScroll(f="measure"){let p=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===f&&(p=!1),p&&this.instance){const m=o(this.instance);this.scroll={animationId:this.root.animationId,phase:f,isRoot:m,offset:s(this.instance),wasRoot:this.scroll?this.scroll.isRoot:m}}}resetTransform(){if(!c)return;const f=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,p=this.projectionDelta&&!Rv(this.projectionDelta),m=this.getTransformTemplate(),y=m?m(this.latestValues,""):void 0,g=y!==this.prevTransformTemplateValue;f&&this.instance&&(p||Ca(this.latestValues)||g)&&(c(this.instance,y),this.shouldResetTransform=!1,this.scheduleRender())}measure(f=!0){const p=this.measurePageBox();let m=this.removeElementScroll(p);return f&&(m=this.removeTransform(m)),PA(m),{animationId:this.root.animationId,measuredBox:p,layoutBox:m,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:f}=this.options;if(!f)return Wt();const p=f.measureViewportBox();if(!(this.scroll?.wasRoot||this.path.some(JA))){const{scroll:y}=this.root;y&&(Si(p.x,y.offset.x),Si(p.y,y.offset.y))}return p}removeElementScroll(f){const p=Wt();if(Pe(p,f),this.scroll?.wasRoot)return p;for(let m=0;m<this.path.length;m++){const y=this.path[m],{scroll:g,options:b}=y;y!==this.root&&g&&b.layoutScroll&&(g.wasRoot&&Pe(p,f),Si(p.x,g.offset.x),Si(p.y,g.offset.y))}return p}applyTransform(f,p=!1){const m=Wt();Pe(m,f);for(let y=0;y<this.path.length;y++){const g=this.path[y];!p&&g.options.layoutScroll&&g.scroll&&g!==g.root&&xi(m,{x:-g.scroll.offset.x,y:-g.scroll.offset.y}),Ca(g.latestValues)&&xi(m,g.latestValues)}return Ca(this.latestValues)&&xi(m,this.latestValues),m}removeTransform(f){const p=Wt();Pe(p,f);for(let m=0;m<this.path.length;m++){const y=this.path[m];if(!y.instance||!Ca(y.latestValues))continue;Wc(y.latestValues)&&y.updateSnapshot();const g=Wt(),b=y.measurePageBox();Pe(g,b),ug(p,y.latestValues,y.snapshot?y.snapshot.layoutBox:void 0,g)}return Ca(this.latestValues)&&ug(p,this.latestValues),p}setTargetDelta(f){this.targetDelta=f,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(f){this.options={...this.options,...f,crossfade:f.crossfade!==void 0?f.crossfade:!0}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==se.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(f=!1){const p=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=p.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=p.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=p.isSharedProjectionDirty);const m=!!this.resumingFrom||this!==p;if(!(f||m&&this.isSharedProjectionDirty||this.isProjectionDirty||this.parent?.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;const{layout:g,layoutId:b}=this.options;if(!this.layout||!(g||b))return;this.resolvedRelativeTargetAt=se.timestamp;const T=this.getClosestProjectingParent();T&&this.linkedParentVersion!==T.layoutVersion&&!T.options.layoutRoot&&this.removeRelativeTarget(),!this.targetDelta&&!this.relativeTarget&&(T&&T.layout?this.createRelativeTarget(T,this.layout.layoutBox,T.layout.layoutBox):this.removeRelativeTarget()),!(!this.relativeTarget&&!this.targetDelta)&&(this.target||(this.target=Wt(),this.targetWithTransforms=Wt()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),aA(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Pe(this.target,this.layout.layoutBox),rv(this.target,this.targetDelta)):Pe(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget&&(this.attemptToResolveRelativeTarget=!1,T&&!!T.resumingFrom==!!this.resumingFrom&&!T.options.layoutScroll&&T.target&&this.animationProgress!==1?this.createRelativeTarget(T,this.target,T.target):this.relativeParent=this.relativeTarget=void 0))}getClosestProjectingParent(){if(!(!this.parent||Wc(this.parent.latestValues)||ov(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}createRelativeTarget(f,p,m){this.relativeParent=f,this.linkedParentVersion=f.layoutVersion,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Wt(),this.relativeTargetOrigin=Wt(),wo(this.relativeTargetOrigin,p,m),Pe(this.relativeTarget,this.relativeTargetOrigin)}removeRelativeTarget(){this.relativeParent=this.relativeTarget=void 0}calcProjection(){const f=this.getLead(),p=!!this.resumingFrom||this!==f;let m=!0;if((this.isProjectionDirty||this.parent?.isProjectionDirty)&&(m=!1),p&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(m=!1),this.resolvedRelativeTargetAt===se.timestamp&&(m=!1),m)return;const{layout:y,layoutId:g}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(y||g))return;Pe(this.layoutCorrected,this.layout.layoutBox);const b=this.treeScale.x,T=this.treeScale.y;p_(this.layoutCorrected,this.treeScale,this.path,p),f.layout&&!f.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(f.target=f.layout.layoutBox,f.targetWithTransforms=Wt());const{target:C}=f;if(!C){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(sg(this.prevProjectionDelta.x,this.projectionDelta.x),sg(this.prevProjectionDelta.y,this.projectionDelta.y)),jl(this.projectionDelta,this.layoutCorrected,C,this.latestValues),(this.treeScale.x!==b||this.treeScale.y!==T||!mg(this.projectionDelta.x,this.prevProjectionDelta.x)||!mg(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",C))}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(f=!0){if(this.options.visualElement?.scheduleRender(),f){const p=this.getStack();p&&p.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=Ei(),this.projectionDelta=Ei(),this.projectionDeltaWithTransform=Ei()}setAnimationOrigin(f,p=!1){const m=this.snapshot,y=m?m.latestValues:{},g={...this.latestValues},b=Ei();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!p;const T=Wt(),C=m?m.source:void 0,w=this.layout?this.layout.source:void 0,N=C!==w,M=this.getStack(),R=!M||M.members.length<=1,D=!!(N&&!R&&this.options.crossfade===!0&&!this.path.some(QA));this.animationProgress=0;let O;this.mixTargetDelta=q=>{const Y=q/1e3;vg(b.x,f.x,Y),vg(b.y,f.y,Y),this.setTargetDelta(b),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(wo(T,this.layout.layoutBox,this.relativeParent.layout.layoutBox),KA(this.relativeTarget,this.relativeTargetOrigin,T,Y),O&&OA(this.relativeTarget,O)&&(this.isProjectionDirty=!1),O||(O=Wt()),Pe(O,this.relativeTarget)),N&&(this.animationValues=g,_A(g,y,this.latestValues,Y,D,R)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=Y},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(f){this.notifyListeners("animationStart"),this.currentAnimation?.stop(),this.resumingFrom?.currentAnimation?.stop(),this.pendingAnimation&&(na(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Vt.update(()=>{Co.hasAnimatedSinceResize=!0,this.motionValue||(this.motionValue=Ai(0)),this.currentAnimation=bA(this.motionValue,[0,1e3],{...f,velocity:0,isSync:!0,onUpdate:p=>{this.mixTargetDelta(p),f.onUpdate&&f.onUpdate(p)},onStop:()=>{},onComplete:()=>{f.onComplete&&f.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const f=this.getStack();f&&f.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(wA),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const f=this.getLead();let{targetWithTransforms:p,target:m,layout:y,latestValues:g}=f;if(!(!p||!m||!y)){if(this!==f&&this.layout&&y&&Nv(this.options.animationType,this.layout.layoutBox,y.layoutBox)){m=this.target||Wt();const b=de(this.layout.layoutBox.x);m.x.min=f.target.x.min,m.x.max=m.x.min+b;const T=de(this.layout.layoutBox.y);m.y.min=f.target.y.min,m.y.max=m.y.min+T}Pe(p,m),xi(p,g),jl(this.projectionDeltaWithTransform,this.layoutCorrected,p,g)}}registerSharedNode(f,p){this.sharedNodes.has(f)||this.sharedNodes.set(f,new NA),this.sharedNodes.get(f).add(p);const y=p.options.initialPromotionConfig;p.promote({transition:y?y.transition:void 0,preserveFollowOpacity:y&&y.shouldPreserveFollowOpacity?y.shouldPreserveFollowOpacity(p):void 0})}isLead(){const f=this.getStack();return f?f.lead===this:!0}getLead(){const{layoutId:f}=this.options;return f?this.getStack()?.lead||this:this}getPrevLead(){const{layoutId:f}=this.options;return f?this.getStack()?.prevLead:void 0}getStack(){const{layoutId:f}=this.options;if(f)return this.root.sharedNodes.get(f)}promote({needsReset:f,transition:p,preserveFollowOpacity:m}={}){const y=this.getStack();y&&y.promote(this,m),f&&(this.projectionDelta=void 0,this.needsReset=!0),p&&this.setOptions({transition:p})}relegate(){const f=this.getStack();return f?f.relegate(this):!1}resetSkewAndRotation(){const{visualElement:f}=this.options;if(!f)return;let p=!1;const{latestValues:m}=f;if((m.z||m.rotate||m.rotateX||m.rotateY||m.rotateZ||m.skewX||m.skewY)&&(p=!0),!p)return;const y={};m.z&&Mc("z",f,y,this.animationValues);for(let g=0;g<Dc.length;g++)Mc(`rotate${Dc[g]}`,f,y,this.animationValues),Mc(`skew${Dc[g]}`,f,y,this.animationValues);f.render();for(const g in y)f.setStaticValue(g,y[g]),this.animationValues&&(this.animationValues[g]=y[g]);f.scheduleRender()}applyProjectionStyles(f,p){if(!this.instance||this.isSVG)return;if(!this.isVisible){f.visibility="hidden";return}const m=this.getTransformTemplate();if(this.needsReset){this.needsReset=!1,f.visibility="",f.opacity="",f.pointerEvents=Ao(p?.pointerEvents)||"",f.transform=m?m(this.latestValues,""):"none";return}const y=this.getLead();if(!this.projectionDelta||!this.layout||!y.target){this.options.layoutId&&(f.opacity=this.latestValues.opacity!==void 0?this.latestValues.opacity:1,f.pointerEvents=Ao(p?.pointerEvents)||""),this.hasProjected&&!Ca(this.latestValues)&&(f.transform=m?m({},""):"none",this.hasProjected=!1);return}f.visibility="";const g=y.animationValues||y.latestValues;this.applyTransformsToTarget();let b=zA(this.projectionDeltaWithTransform,this.treeScale,g);m&&(b=m(g,b)),f.transform=b;const{x:T,y:C}=this.projectionDelta;f.transformOrigin=`${T.origin*100}% ${C.origin*100}% 0`,y.animationValues?f.opacity=y===this?g.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:g.opacityExit:f.opacity=y===this?g.opacity!==void 0?g.opacity:"":g.opacityExit!==void 0?g.opacityExit:0;for(const w in $c){if(g[w]===void 0)continue;const{correct:N,applyTo:M,isCSSVariable:R}=$c[w],D=b==="none"?g[w]:N(g[w],y);if(M){const O=M.length;for(let q=0;q<O;q++)f[M[q]]=D}else R?this.options.visualElement.renderState.vars[w]=D:f[w]=D}this.options.layoutId&&(f.pointerEvents=y===this?Ao(p?.pointerEvents)||"":"none")}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(f=>f.currentAnimation?.stop()),this.root.nodes.forEach(pg),this.root.sharedNodes.clear()}}}function LA(n){n.updateLayout()}function BA(n){const i=n.resumeFrom?.snapshot||n.snapshot;if(n.isLead()&&n.layout&&i&&n.hasListeners("didUpdate")){const{layoutBox:s,measuredBox:o}=n.layout,{animationType:c}=n.options,d=i.source!==n.layout.source;c==="size"?Ye(g=>{const b=d?i.measuredBox[g]:i.layoutBox[g],T=de(b);b.min=s[g].min,b.max=b.min+T}):Nv(c,i.layoutBox,s)&&Ye(g=>{const b=d?i.measuredBox[g]:i.layoutBox[g],T=de(s[g]);b.max=b.min+T,n.relativeTarget&&!n.currentAnimation&&(n.isProjectionDirty=!0,n.relativeTarget[g].max=n.relativeTarget[g].min+T)});const f=Ei();jl(f,s,i.layoutBox);const p=Ei();d?jl(p,n.applyTransform(o,!0),i.measuredBox):jl(p,s,i.layoutBox);const m=!Rv(f);let y=!1;if(!n.resumeFrom){const g=n.getClosestProjectingParent();if(g&&!g.resumeFrom){const{snapshot:b,layout:T}=g;if(b&&T){const C=Wt();wo(C,i.layoutBox,b.layoutBox);const w=Wt();wo(w,s,T.layoutBox),Dv(C,w)||(y=!0),g.options.layoutRoot&&(n.relativeTarget=w,n.relativeTargetOrigin=C,n.relativeParent=g)}}}n.notifyListeners("didUpdate",{layout:s,snapshot:i,delta:p,layoutDelta:f,hasLayoutChanged:m,hasRelativeLayoutChanged:y})}else if(n.isLead()){const{onExitComplete:s}=n.options;s&&s()}n.options.transition=void 0}function VA(n){n.parent&&(n.isProjecting()||(n.isProjectionDirty=n.parent.isProjectionDirty),n.isSharedProjectionDirty||(n.isSharedProjectionDirty=!!(n.isProjectionDirty||n.parent.isProjectionDirty||n.parent.isSharedProjectionDirty)),n.isTransformDirty||(n.isTransformDirty=n.parent.isTransformDirty))}function UA(n){n.isProjectionDirty=n.isSharedProjectionDirty=n.isTransformDirty=!1}function HA(n){n.clearSnapshot()}function pg(n){n.clearMeasurements()}function yg(n){n.isLayoutDirty=!1}function kA(n){const{visualElement:i}=n.options;i&&i.getProps().onBeforeLayoutMeasure&&i.notify("BeforeLayoutMeasure"),n.resetTransform()}function gg(n){n.finishAnimation(),n.targetDelta=n.relativeTarget=n.target=void 0,n.isProjectionDirty=!0}function YA(n){n.resolveTargetDelta()}function qA(n){n.calcProjection()}function GA(n){n.resetSkewAndRotation()}function XA(n){n.removeLeadSnapshot()}function vg(n,i,s){n.translate=Ut(i.translate,0,s),n.scale=Ut(i.scale,1,s),n.origin=i.origin,n.originPoint=i.originPoint}function bg(n,i,s,o){n.min=Ut(i.min,s.min,o),n.max=Ut(i.max,s.max,o)}function KA(n,i,s,o){bg(n.x,i.x,s.x,o),bg(n.y,i.y,s.y,o)}function QA(n){return n.animationValues&&n.animationValues.opacityExit!==void 0}const ZA={duration:.45,ease:[.4,0,.1,1]},Tg=n=>typeof navigator<"u"&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(n),Sg=Tg("applewebkit/")&&!Tg("chrome/")?Math.round:Ge;function xg(n){n.min=Sg(n.min),n.max=Sg(n.max)}function PA(n){xg(n.x),xg(n.y)}function Nv(n,i,s){return n==="position"||n==="preserve-aspect"&&!nA(hg(i),hg(s),.2)}function JA(n){return n!==n.root&&n.scroll?.wasRoot}const FA=Ov({attachResizeListener:(n,i)=>Yl(n,"resize",i),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),Oc={current:void 0},zv=Ov({measureScroll:n=>({x:n.scrollLeft,y:n.scrollTop}),defaultParent:()=>{if(!Oc.current){const n=new FA({});n.mount(window),n.setOptions({layoutScroll:!0}),Oc.current=n}return Oc.current},resetTransform:(n,i)=>{n.style.transform=i!==void 0?i:"none"},checkIsScrollRoot:n=>window.getComputedStyle(n).position==="fixed"}),$A={pan:{Feature:gA},drag:{Feature:yA,ProjectionNode:zv,MeasureLayout:_v}};function Eg(n,i,s){const{props:o}=n;n.animationState&&o.whileHover&&n.animationState.setActive("whileHover",s==="Start");const c="onHover"+s,d=o[c];d&&Vt.postRender(()=>d(i,Fl(i)))}class WA extends ia{mount(){const{current:i}=this.node;i&&(this.unmount=S2(i,(s,o)=>(Eg(this.node,o,"Start"),c=>Eg(this.node,c,"End"))))}unmount(){}}class IA extends ia{constructor(){super(...arguments),this.isActive=!1}onFocus(){let i=!1;try{i=this.node.current.matches(":focus-visible")}catch{i=!0}!i||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Zl(Yl(this.node.current,"focus",()=>this.onFocus()),Yl(this.node.current,"blur",()=>this.onBlur()))}unmount(){}}function _g(n,i,s){const{props:o}=n;if(n.current instanceof HTMLButtonElement&&n.current.disabled)return;n.animationState&&o.whileTap&&n.animationState.setActive("whileTap",s==="Start");const c="onTap"+(s==="End"?"":s),d=o[c];d&&Vt.postRender(()=>d(i,Fl(i)))}class t3 extends ia{mount(){const{current:i}=this.node;i&&(this.unmount=A2(i,(s,o)=>(_g(this.node,o,"Start"),(c,{success:d})=>_g(this.node,c,d?"End":"Cancel")),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}}const sf=new WeakMap,Nc=new WeakMap,e3=n=>{const i=sf.get(n.target);i&&i(n)},n3=n=>{n.forEach(e3)};function a3({root:n,...i}){const s=n||document;Nc.has(s)||Nc.set(s,{});const o=Nc.get(s),c=JSON.stringify(i);return o[c]||(o[c]=new IntersectionObserver(n3,{root:n,...i})),o[c]}function i3(n,i,s){const o=a3(i);return sf.set(n,s),o.observe(n),()=>{sf.delete(n),o.unobserve(n)}}const l3={some:0,all:1};class s3 extends ia{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:i={}}=this.node.getProps(),{root:s,margin:o,amount:c="some",once:d}=i,f={root:s?s.current:void 0,rootMargin:o,threshold:typeof c=="number"?c:l3[c]},p=m=>{const{isIntersecting:y}=m;if(this.isInView===y||(this.isInView=y,d&&!y&&this.hasEnteredView))return;y&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",y);const{onViewportEnter:g,onViewportLeave:b}=this.node.getProps(),T=y?g:b;T&&T(m)};return i3(this.node.current,f,p)}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>"u")return;const{props:i,prevProps:s}=this.node;["amount","margin","root"].some(o3(i,s))&&this.startObserver()}unmount(){}}function o3({viewport:n={}},{viewport:i={}}={}){return s=>n[s]!==i[s]}const r3={inView:{Feature:s3},tap:{Feature:t3},focus:{Feature:IA},hover:{Feature:WA}},u3={layout:{ProjectionNode:zv,MeasureLayout:_v}},c3={...F_,...r3,...$A,...u3},_n=d_(c3,A_),nn={Planned:"PLANNED",Reading:"READING",Done:"DONE"};function wv({external_id:n,title:i,description:s,authors:o,cover_i:c,status:d}){const[f,p]=S.useState(""),[m,y]=S.useState(!1),[g,b]=S.useState(!1),[T,C]=S.useState(!1),w=S.useRef(null),N=uf(),{addBook:M,isBookInList:R,removeBook:D,updateBookStatus:O,getBookInList:q}=mf(),Y=R(n);Y&&!d&&(d=q(n).status);const Q=gt=>{if(!w.current)return;y(!0);const Lt=w.current.getBoundingClientRect(),H=gt.clientX-Lt.left,P=gt.clientY-Lt.top,F=Lt.width/2,ct=Lt.height/2,mt=(P-ct)/ct*-10,A=(H-F)/F*10;p(`perspective(1000px) rotateX(${mt}deg) rotateY(${A}deg) translateY(-8px) scale(1.02)`)},U=()=>{y(!1),p("")},Z=async gt=>{if(gt.stopPropagation(),!g)try{b(!0),Y?await D(n)?ut.info(`${i} removed from reading list`):ut.error("Failed to remove book from reading list"):await M({external_id:n,title:i,description:s,authors:o,cover_i:c,status:nn.Planned})?ut.success(`${i} added to reading list!`):ut.error("Failed to add book to reading list")}catch(jt){console.error("Error updating reading list:",jt),ut.error(`Failed to ${Y?"remove":"add"} book ${Y?"from":"to"} reading list`)}finally{b(!1)}},tt=async gt=>{try{if(await O(n,gt)){const Lt=gt==="PLANNED"?"Planned":gt==="READING"?"Reading":"Done";ut.success(`Status updated to ${Lt}`),C(!1)}else ut.error("Failed to update status")}catch(jt){console.error("Error updating status:",jt),ut.error("Failed to update status")}},lt=gt=>{gt.stopPropagation(),C(!T)},St=c?`https://covers.openlibrary.org/b/id/${c}-L.jpg`:"/placeholder-book.png",Mt=()=>{N(`/book/${n}`)};return Nt.useEffect(()=>{const gt=jt=>{w.current&&!w.current.contains(jt.target)&&C(!1)};return T&&document.addEventListener("mousedown",gt),()=>{document.removeEventListener("mousedown",gt)}},[T]),E.jsxs("div",{className:"book-card",ref:w,onMouseMove:Q,onMouseLeave:U,onClick:Mt,style:{transform:f,transition:m?"box-shadow 0.3s ease":"transform 0.4s ease, box-shadow 0.3s ease",cursor:"pointer"},children:[Y&&E.jsxs("div",{className:"book-card-status-ribbon",children:[d==="PLANNED"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned"]}),d==="READING"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-book"})," Reading"]}),d==="DONE"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-check-circle"})," Done"]})]}),E.jsx("button",{className:"book-card-star-btn",onClick:Z,disabled:g,children:E.jsx("i",{className:Y?"bi bi-star-fill":"bi bi-star"},Y?"filled":"empty")}),E.jsx("div",{className:"book-card-image",children:E.jsx("img",{src:St,alt:`${i} cover`})}),E.jsxs("div",{className:"book-card-content",children:[E.jsx("h3",{className:"book-card-title",children:i}),o&&o.length>0&&E.jsxs("p",{className:"book-card-authors",children:["by ",o.slice(0,3).join(", ")]})]}),Y&&E.jsxs("div",{className:"book-card-menu-container",children:[E.jsx("button",{className:"book-card-menu-btn",onClick:lt,children:E.jsx("i",{className:"bi bi-three-dots"})}),E.jsx(ko,{children:T&&E.jsxs(_n.div,{className:"status-menu",initial:{opacity:0,scale:.8,y:-10},animate:{opacity:1,scale:1,y:0},exit:{opacity:0,scale:.8,y:-10},transition:{duration:.2,ease:"easeOut"},children:[E.jsxs("button",{className:`status-option ${d===nn.Planned?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Planned)},children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned ",d===nn.Planned&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${d===nn.Reading?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Reading)},children:[E.jsx("i",{className:"bi bi-book"})," Reading ",d===nn.Reading&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${d===nn.Done?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Done)},children:[E.jsx("i",{className:"bi bi-check-circle"})," Done ",d===nn.Done&&E.jsx("i",{className:"bi bi-check-lg"})]})]})})]})]})}function Ri({style:n}){const i={...n};return E.jsx("div",{className:"loading-more",style:i,children:E.jsx("div",{className:"spinner"})})}function Ag({title:n,url:i,width:s=280,height:o,limit:c=12}){const[d,f]=S.useState([]),[p,m]=S.useState(!0),[y,g]=S.useState(!1),[b,T]=S.useState(null),[C,w]=S.useState(1),[N,M]=S.useState(!0),R=S.useRef(null),D=q=>{const Y=new URL(i,window.location.origin);return Y.searchParams.set("limit",c.toString()),Y.searchParams.set("page",q.toString()),Y.toString()},O=async(q,Y=!1)=>{try{Y?g(!0):m(!0);const Q=await fetch(D(q));if(!Q.ok)throw new Error("Failed to fetch books");const U=await Q.json(),Z=U.books||U;Z.length<c&&M(!1),f(Y?tt=>[...tt,...Z]:Z)}catch(Q){T(Q instanceof Error?Q.message:"An error occurred")}finally{m(!1),g(!1)}};return S.useEffect(()=>{O(1,!1)},[i]),S.useEffect(()=>{const q=R.current;if(!q)return;const Y=()=>{const{scrollLeft:Q,scrollWidth:U,clientWidth:Z}=q;if(Q+Z>=U-100&&!y&&!p&&N){const lt=C+1;w(lt),O(lt,!0)}};return q.addEventListener("scroll",Y),()=>q.removeEventListener("scroll",Y)},[y,p,N,C]),p?E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsx(Ri,{style:{width:`${s}px`,minWidth:`${s}px`}})]}):b?E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsxs("p",{className:"error-text",children:["Error: ",b]})]}):E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsx("div",{className:"horizontal-scroll",ref:R,children:E.jsxs("div",{className:"books-container",children:[d.map(q=>E.jsx("div",{className:"book-item",style:{flex:`0 0 ${s}px`,minWidth:`${s}px`,maxWidth:`${s}px`,height:o?`${o}px`:"auto"},children:E.jsx(wv,{...q})},q.external_id)),y&&E.jsx(Ri,{style:{width:`${s}px`,minWidth:`${s}px`}})]})})]})}function f3(){return E.jsxs("div",{className:"popular-page",children:[E.jsx(Ag,{title:"Popular Books This Week",url:"http://localhost:8000/api/popular/books?duration=weekly",width:280,height:320}),E.jsx(Ag,{title:"The Best of Sherlock Holmes🕵️",url:"http://localhost:8000/api/search/books?q=sherlock",width:280,height:480})]})}function d3({value:n,onChange:i,onSearch:s,placeholder:o="There is danger for him who taketh the tiger cub, and danger also for whoso snatches a delusion from a woman."}){const c=f=>{f.key==="Enter"&&s&&s(n)},d=()=>{s&&s(n)};return E.jsxs("div",{className:"search-box-wrapper",children:[E.jsx("i",{className:"bi bi-search search-icon"}),E.jsx("input",{type:"text",className:"search-box",placeholder:o,value:n,onChange:f=>i(f.target.value),onKeyDown:c}),E.jsx("button",{className:"search-button",onClick:d,"aria-label":"Search",children:E.jsx("i",{className:"bi bi-arrow-right"})})]})}function jv({results:n,onScrollEnd:i,isLoadingMore:s=!1,hasMore:o=!0,cardMinWidth:c="250px",cardMaxWidth:d="1fr",cardHeight:f="auto"}){const p=S.useRef(null);return S.useEffect(()=>{const m=new IntersectionObserver(g=>{g[0].isIntersecting&&!s&&o&&i&&i()},{threshold:.1}),y=p.current;return y&&m.observe(y),()=>{y&&m.unobserve(y)}},[i,s,o]),n.length===0&&s?E.jsx(_n.div,{className:"results-placeholder",initial:{opacity:0,y:20},animate:{opacity:1,y:0},transition:{duration:.4,delay:.2},children:E.jsx(Ri,{})}):n.length===0?E.jsx(_n.div,{className:"results-placeholder",initial:{opacity:0,y:20},animate:{opacity:1,y:0},transition:{duration:.4,delay:.2},children:E.jsx("p",{children:"No results found."})}):E.jsxs("div",{children:[E.jsx("div",{className:"results-grid",style:{gridTemplateColumns:`repeat(auto-fill, minmax(${c}, ${d}))`,...f!=="auto"&&{gridAutoRows:f}},children:E.jsx(ko,{mode:"popLayout",children:n.map((m,y)=>E.jsx(_n.div,{initial:{opacity:0,x:-50},animate:{opacity:1,x:0},exit:{opacity:0,scale:1.8,transition:{duration:.3}},transition:{duration:.5,delay:y*.1,ease:[.4,0,.2,1]},layout:!0,children:E.jsx(wv,{...m})},m.external_id))})}),E.jsx("div",{ref:p,className:"scroll-trigger"}),s&&o&&E.jsx("div",{className:"loading-more-container",children:E.jsx(Ri,{})})]})}function h3(){const[n,i]=S.useState(""),[s,o]=S.useState(!1),[c,d]=S.useState([]),[f,p]=S.useState(!1),[m,y]=S.useState(1),[g,b]=S.useState(!0),T=40,C=async(M,R=!1)=>{if(f||!R&&!g)return;p(!0);const D=R?1:m;R&&(o(!0),d([]));try{const O=await fetch(`http://localhost:8000/api/search/books?q=${encodeURIComponent(M)}&limit=${T}&page=${D}`);if(!O.ok)throw new Error(R?"Failed to fetch search results":"Failed to fetch more results");const q=await O.json(),Y=q.books?.map(U=>({external_id:U.external_id,title:U.title,authors:U.authors||[],description:U.first_sentence?.[0]||"",cover_i:U.cover_i?.toString()}))||[],Q=q.total||0;console.log("total found results:",Q),d(U=>R?Y:[...U,...Y]),b(Q>D*T),y(D+1)}catch(O){console.error("Search error:",O),ut.error(R?"Failed to search books. Please try again.":"Failed to load more results. Please try again."),R&&d([])}finally{p(!1)}},w=async M=>{M.trim()&&await C(M,!0)},N=async()=>{await C(n,!1)};return E.jsxs(_n.div,{className:`search-page ${s?"search-active":""}`,initial:{opacity:1},animate:{opacity:1},children:[E.jsxs(_n.div,{className:"search-container",layout:!0,transition:{layout:{duration:.6,ease:[.4,0,.2,1]}},children:[E.jsx(_n.h1,{className:"search-title",layout:!0,transition:{layout:{duration:.6,ease:[.4,0,.2,1]}},children:"Search Books"}),E.jsx(d3,{value:n,onChange:i,onSearch:w})]}),E.jsx(ko,{children:s&&E.jsx(_n.div,{className:"search-results-container",initial:{opacity:0},animate:{opacity:1},exit:{opacity:0},transition:{duration:.4},children:E.jsx("div",{className:"search-results",children:E.jsx(jv,{results:c,onScrollEnd:N,isLoadingMore:f,hasMore:g})})})})]})}function m3(){const{books:n,isLoading:i,error:s}=mf();return E.jsxs("div",{children:[E.jsx("h1",{children:"My Reading List"}),s&&E.jsx("p",{style:{color:"red"},children:s}),E.jsx(jv,{results:n,isLoadingMore:i,hasMore:!1})]})}function p3(){const{id:n}=IT(),i=uf();n||i("/");const[s,o]=S.useState(null),[c,d]=S.useState(!0),[f,p]=S.useState(null),[m,y]=S.useState(!1),{addBook:g,isBookInList:b,removeBook:T,getBookInList:C,updateBookStatus:w}=mf(),N=b(n),M=N?C(n):void 0;M&&!s&&o(M),S.useEffect(()=>{(async()=>{try{d(!0);const U=await fetch(`http://localhost:8000/api/books/${n}`);if(!U.ok)throw new Error("Book not found");const Z=await U.json();o(Z),p(null)}catch(U){p(U instanceof Error?U.message:"Failed to load book"),ut.error("Failed to load book details")}finally{d(!1)}})()},[n]),S.useEffect(()=>{const Q=U=>{U.target.closest(".status-dropdown-container")||y(!1)};return m&&document.addEventListener("mousedown",Q),()=>{document.removeEventListener("mousedown",Q)}},[m]);const R=()=>{s&&(g({external_id:s.external_id,title:s.title,authors:s.authors,cover_i:s.cover_i,description:s.description,status:"PLANNED"}),ut.success(`${s.title} added to reading list!`))},D=()=>{s&&(T(s.external_id),ut.info(`${s.title} removed from reading list`))},O=async Q=>{if(!s)return;if(await w(s.external_id,Q)){const Z=Q==="PLANNED"?"Planned":Q==="READING"?"Reading":"Done";ut.success(`Status updated to ${Z}`),y(!1)}else ut.error("Failed to update status")},q=()=>{y(!m)},Y=Q=>Q?`https://covers.openlibrary.org/b/id/${Q}-L.jpg`:"/placeholder-book.png";return c&&!N?E.jsx("div",{className:"book-page loading",children:E.jsx(Ri,{})}):f||!s?E.jsx("div",{className:"book-page error",children:E.jsxs("div",{className:"error-container",children:[E.jsx("h2",{children:"📚 Book Not Found"}),E.jsx("p",{children:f||"The book you are looking for does not exist."}),E.jsx("button",{onClick:()=>i("/"),className:"btn-primary",children:"Go Home"})]})}):E.jsxs("div",{className:"book-page",children:[E.jsxs("button",{onClick:()=>i(-1),className:"back-button",children:[E.jsx("i",{className:"bi bi-arrow-left"})," Back"]}),E.jsxs("div",{className:"book-details",children:[E.jsx("div",{className:"book-cover-section",children:E.jsx("img",{src:Y(s.cover_i),alt:s.title,className:"book-cover-large",onError:Q=>{Q.currentTarget.src="/placeholder-book.png"}})}),E.jsxs("div",{className:"book-info-section",children:[E.jsx("h1",{className:"book-title",children:s.title}),s.authors&&s.authors.length>0&&E.jsxs("div",{className:"book-authors",children:[E.jsx("i",{className:"bi bi-person"}),E.jsxs("span",{children:["by ",s.authors.join(", ")]})]}),!c&&s.first_publish_year&&E.jsxs("div",{className:"book-year",children:[E.jsx("i",{className:"bi bi-calendar"}),E.jsxs("span",{children:["First published in ",s.first_publish_year]})]}),E.jsx("div",{className:"book-actions",children:N?E.jsxs(E.Fragment,{children:[E.jsxs("button",{onClick:D,className:"btn-secondary",children:[E.jsx("i",{className:"bi bi-dash-circle"})," Remove from Reading List"]}),E.jsxs("div",{className:"status-dropdown-container",children:[E.jsxs("button",{onClick:q,className:"btn-status",children:[E.jsx("i",{className:`bi ${m?"bi-chevron-up":"bi-chevron-down"}`}),M?.status==="PLANNED"?"Planned":M?.status==="READING"?"Reading":M?.status==="DONE"?"Done":"Update Status"]}),E.jsx(ko,{children:m&&E.jsxs(_n.div,{className:"status-dropdown",initial:{opacity:0,scale:.8,y:-10},animate:{opacity:1,scale:1,y:0},exit:{opacity:0,scale:.8,y:-10},transition:{duration:.2,ease:"easeOut"},children:[E.jsxs("button",{className:`status-option ${M?.status==="PLANNED"?"active":""}`,onClick:()=>O("PLANNED"),children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned ",M?.status==="PLANNED"&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${M?.status==="READING"?"active":""}`,onClick:()=>O("READING"),children:[E.jsx("i",{className:"bi bi-book"})," Reading ",M?.status==="READING"&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${M?.status==="DONE"?"active":""}`,onClick:()=>O("DONE"),children:[E.jsx("i",{className:"bi bi-check-circle"})," Done ",M?.status==="DONE"&&E.jsx("i",{className:"bi bi-check-lg"})]})]})})]})]}):E.jsxs("button",{onClick:R,className:"btn-primary",children:[E.jsx("i",{className:"bi bi-plus-circle"})," Add to Reading List"]})}),s.description&&E.jsxs("div",{className:"book-description",children:[E.jsx("h2",{children:"Description"}),E.jsx("p",{children:s.description})]}),E.jsxs("div",{className:"book-metadata",children:[E.jsx("h2",{children:"Book Details"}),E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Book ID:"}),E.jsx("span",{className:"metadata-value",children:s.external_id})]}),c?E.jsx(Ri,{}):E.jsxs(E.Fragment,{children:[s.number_of_pages&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Pages:"}),E.jsx("span",{className:"metadata-value",children:s.number_of_pages})]}),s.publishers&&s.publishers.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Publisher(s):"}),E.jsx("span",{className:"metadata-value",children:s.publishers.join(", ")})]}),s.isbn_13&&s.isbn_13.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"ISBN-13:"}),E.jsx("span",{className:"metadata-value",children:s.isbn_13[0]})]}),s.isbn_10&&s.isbn_10.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"ISBN-10:"}),E.jsx("span",{className:"metadata-value",children:s.isbn_10[0]})]})]})]})]})]})]})}function y3(){return E.jsx(HS,{children:E.jsxs(zx,{children:[E.jsx(pS,{children:E.jsxs(Aa,{path:"/",element:E.jsx(Ox,{}),children:[E.jsx(Aa,{index:!0,element:E.jsx(Nx,{})}),E.jsx(Aa,{path:"popular",element:E.jsx(f3,{})}),E.jsx(Aa,{path:"search",element:E.jsx(h3,{})}),E.jsx(Aa,{path:"reading-list",element:E.jsx(m3,{})}),E.jsx(Aa,{path:"book/:id",element:E.jsx(p3,{})})]})}),E.jsx(Mx,{position:"top-right",autoClose:3e3,hideProgressBar:!1,newestOnTop:!1,closeOnClick:!0,rtl:!1,pauseOnFocusLoss:!0,draggable:!0,pauseOnHover:!0})]})})}mT.createRoot(document.getElementById("root")).render(E.jsx(S.StrictMode,{children:E.jsx(y3,{})}));
+        `),()=>{M.contains(N)&&M.removeChild(N)}},[i]),E.jsx(N2,{isPresent:i,childRef:d,sizeRef:f,children:S.cloneElement(n,{ref:m})})}const w2=({children:n,initial:i,isPresent:s,onExitComplete:o,custom:c,presenceAffectsLayout:d,mode:f,anchorX:p,root:m})=>{const y=yf(j2),g=S.useId();let b=!0,T=S.useMemo(()=>(b=!1,{id:g,initial:i,isPresent:s,custom:c,onExitComplete:C=>{y.set(C,!0);for(const w of y.values())if(!w)return;o&&o()},register:C=>(y.set(C,!1),()=>y.delete(C))}),[s,y,o]);return d&&b&&(T={...T}),S.useMemo(()=>{y.forEach((C,w)=>y.set(w,!1))},[s]),S.useEffect(()=>{!s&&!y.size&&o&&o()},[s]),f==="popLayout"&&(n=E.jsx(z2,{isPresent:s,anchorX:p,root:m,children:n})),E.jsx(Ho.Provider,{value:T,children:n})};function j2(){return new Map}function Q0(n=!0){const i=S.useContext(Ho);if(i===null)return[!0,null];const{isPresent:s,onExitComplete:o,register:c}=i,d=S.useId();S.useEffect(()=>{if(n)return c(d)},[n]);const f=S.useCallback(()=>n&&o&&o(d),[d,o,n]);return!s&&o?[!1,f]:[!0]}const bo=n=>n.key||"";function zy(n){const i=[];return S.Children.forEach(n,s=>{S.isValidElement(s)&&i.push(s)}),i}const ko=({children:n,custom:i,initial:s=!0,onExitComplete:o,presenceAffectsLayout:c=!0,mode:d="sync",propagate:f=!1,anchorX:p="left",root:m})=>{const[y,g]=Q0(f),b=S.useMemo(()=>zy(n),[n]),T=f&&!y?[]:b.map(bo),C=S.useRef(!0),w=S.useRef(b),N=yf(()=>new Map),[M,R]=S.useState(b),[D,O]=S.useState(b);t0(()=>{C.current=!1,w.current=b;for(let Q=0;Q<D.length;Q++){const U=bo(D[Q]);T.includes(U)?N.delete(U):N.get(U)!==!0&&N.set(U,!1)}},[D,T.length,T.join("-")]);const q=[];if(b!==M){let Q=[...b];for(let U=0;U<D.length;U++){const Z=D[U],tt=bo(Z);T.includes(tt)||(Q.splice(U,0,Z),q.push(Z))}return d==="wait"&&q.length&&(Q=q),O(zy(Q)),R(b),null}const{forceRender:Y}=S.useContext(pf);return E.jsx(E.Fragment,{children:D.map(Q=>{const U=bo(Q),Z=f&&!y?!1:b===D||T.includes(U),tt=()=>{if(N.has(U))N.set(U,!0);else return;let lt=!0;N.forEach(St=>{St||(lt=!1)}),lt&&(Y?.(),O(w.current),f&&g?.(),o&&o())};return E.jsx(w2,{isPresent:Z,initial:!C.current||s?void 0:!1,custom:i,presenceAffectsLayout:c,mode:d,root:m,onExitComplete:Z?void 0:tt,anchorX:p,children:Q},U)})})},Z0=S.createContext({strict:!1}),wy={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},Ci={};for(const n in wy)Ci[n]={isEnabled:i=>wy[n].some(s=>!!i[s])};function L2(n){for(const i in n)Ci[i]={...Ci[i],...n[i]}}const B2=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function No(n){return n.startsWith("while")||n.startsWith("drag")&&n!=="draggable"||n.startsWith("layout")||n.startsWith("onTap")||n.startsWith("onPan")||n.startsWith("onLayout")||B2.has(n)}let P0=n=>!No(n);function V2(n){typeof n=="function"&&(P0=i=>i.startsWith("on")?!No(i):n(i))}try{V2(require("@emotion/is-prop-valid").default)}catch{}function U2(n,i,s){const o={};for(const c in n)c==="values"&&typeof n.values=="object"||(P0(c)||s===!0&&No(c)||!i&&!No(c)||n.draggable&&c.startsWith("onDrag"))&&(o[c]=n[c]);return o}const Yo=S.createContext({});function qo(n){return n!==null&&typeof n=="object"&&typeof n.start=="function"}function kl(n){return typeof n=="string"||Array.isArray(n)}const Hf=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],kf=["initial",...Hf];function Go(n){return qo(n.animate)||kf.some(i=>kl(n[i]))}function J0(n){return!!(Go(n)||n.variants)}function H2(n,i){if(Go(n)){const{initial:s,animate:o}=n;return{initial:s===!1||kl(s)?s:void 0,animate:kl(o)?o:void 0}}return n.inherit!==!1?i:{}}function k2(n){const{initial:i,animate:s}=H2(n,S.useContext(Yo));return S.useMemo(()=>({initial:i,animate:s}),[jy(i),jy(s)])}function jy(n){return Array.isArray(n)?n.join(" "):n}function Ly(n,i){return i.max===i.min?0:n/(i.max-i.min)*100}const Ml={correct:(n,i)=>{if(!i.target)return n;if(typeof n=="string")if(at.test(n))n=parseFloat(n);else return n;const s=Ly(n,i.target.x),o=Ly(n,i.target.y);return`${s}% ${o}%`}},Y2={correct:(n,{treeScale:i,projectionDelta:s})=>{const o=n,c=aa.parse(n);if(c.length>5)return o;const d=aa.createTransformer(n),f=typeof c[0]!="number"?1:0,p=s.x.scale*i.x,m=s.y.scale*i.y;c[0+f]/=p,c[1+f]/=m;const y=Ut(p,m,.5);return typeof c[2+f]=="number"&&(c[2+f]/=y),typeof c[3+f]=="number"&&(c[3+f]/=y),d(c)}},$c={borderRadius:{...Ml,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:Ml,borderTopRightRadius:Ml,borderBottomLeftRadius:Ml,borderBottomRightRadius:Ml,boxShadow:Y2};function F0(n,{layout:i,layoutId:s}){return zi.has(n)||n.startsWith("origin")||(i||s!==void 0)&&(!!$c[n]||n==="opacity")}const q2={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},G2=Ni.length;function X2(n,i,s){let o="",c=!0;for(let d=0;d<G2;d++){const f=Ni[d],p=n[f];if(p===void 0)continue;let m=!0;if(typeof p=="number"?m=p===(f.startsWith("scale")?1:0):m=parseFloat(p)===0,!m||s){const y=k0(p,Lf[f]);if(!m){c=!1;const g=q2[f]||f;o+=`${g}(${y}) `}s&&(i[f]=y)}}return o=o.trim(),s?o=s(i,c?"":o):c&&(o="none"),o}function Yf(n,i,s){const{style:o,vars:c,transformOrigin:d}=n;let f=!1,p=!1;for(const m in i){const y=i[m];if(zi.has(m)){f=!0;continue}else if(g0(m)){c[m]=y;continue}else{const g=k0(y,Lf[m]);m.startsWith("origin")?(p=!0,d[m]=g):o[m]=g}}if(i.transform||(f||s?o.transform=X2(i,n.transform,s):o.transform&&(o.transform="none")),p){const{originX:m="50%",originY:y="50%",originZ:g=0}=d;o.transformOrigin=`${m} ${y} ${g}`}}const qf=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function $0(n,i,s){for(const o in i)!re(i[o])&&!F0(o,s)&&(n[o]=i[o])}function K2({transformTemplate:n},i){return S.useMemo(()=>{const s=qf();return Yf(s,i,n),Object.assign({},s.vars,s.style)},[i])}function Q2(n,i){const s=n.style||{},o={};return $0(o,s,n),Object.assign(o,K2(n,i)),o}function Z2(n,i){const s={},o=Q2(n,i);return n.drag&&n.dragListener!==!1&&(s.draggable=!1,o.userSelect=o.WebkitUserSelect=o.WebkitTouchCallout="none",o.touchAction=n.drag===!0?"none":`pan-${n.drag==="x"?"y":"x"}`),n.tabIndex===void 0&&(n.onTap||n.onTapStart||n.whileTap)&&(s.tabIndex=0),s.style=o,s}const P2={offset:"stroke-dashoffset",array:"stroke-dasharray"},J2={offset:"strokeDashoffset",array:"strokeDasharray"};function F2(n,i,s=1,o=0,c=!0){n.pathLength=1;const d=c?P2:J2;n[d.offset]=at.transform(-o);const f=at.transform(i),p=at.transform(s);n[d.array]=`${f} ${p}`}function W0(n,{attrX:i,attrY:s,attrScale:o,pathLength:c,pathSpacing:d=1,pathOffset:f=0,...p},m,y,g){if(Yf(n,p,y),m){n.style.viewBox&&(n.attrs.viewBox=n.style.viewBox);return}n.attrs=n.style,n.style={};const{attrs:b,style:T}=n;b.transform&&(T.transform=b.transform,delete b.transform),(T.transform||b.transformOrigin)&&(T.transformOrigin=b.transformOrigin??"50% 50%",delete b.transformOrigin),T.transform&&(T.transformBox=g?.transformBox??"fill-box",delete b.transformBox),i!==void 0&&(b.x=i),s!==void 0&&(b.y=s),o!==void 0&&(b.scale=o),c!==void 0&&F2(b,c,d,f,!1)}const I0=()=>({...qf(),attrs:{}}),tv=n=>typeof n=="string"&&n.toLowerCase()==="svg";function $2(n,i,s,o){const c=S.useMemo(()=>{const d=I0();return W0(d,i,tv(o),n.transformTemplate,n.style),{...d.attrs,style:{...d.style}}},[i]);if(n.style){const d={};$0(d,n.style,n),c.style={...d,...c.style}}return c}const W2=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Gf(n){return typeof n!="string"||n.includes("-")?!1:!!(W2.indexOf(n)>-1||/[A-Z]/u.test(n))}function I2(n,i,s,{latestValues:o},c,d=!1){const p=(Gf(n)?$2:Z2)(i,o,c,n),m=U2(i,typeof n=="string",d),y=n!==S.Fragment?{...m,...p,ref:s}:{},{children:g}=i,b=S.useMemo(()=>re(g)?g.get():g,[g]);return S.createElement(n,{...y,children:b})}function By(n){const i=[{},{}];return n?.values.forEach((s,o)=>{i[0][o]=s.get(),i[1][o]=s.getVelocity()}),i}function Xf(n,i,s,o){if(typeof i=="function"){const[c,d]=By(o);i=i(s!==void 0?s:n.custom,c,d)}if(typeof i=="string"&&(i=n.variants&&n.variants[i]),typeof i=="function"){const[c,d]=By(o);i=i(s!==void 0?s:n.custom,c,d)}return i}function Ao(n){return re(n)?n.get():n}function t_({scrapeMotionValuesFromProps:n,createRenderState:i},s,o,c){return{latestValues:e_(s,o,c,n),renderState:i()}}function e_(n,i,s,o){const c={},d=o(n,{});for(const T in d)c[T]=Ao(d[T]);let{initial:f,animate:p}=n;const m=Go(n),y=J0(n);i&&y&&!m&&n.inherit!==!1&&(f===void 0&&(f=i.initial),p===void 0&&(p=i.animate));let g=s?s.initial===!1:!1;g=g||f===!1;const b=g?p:f;if(b&&typeof b!="boolean"&&!qo(b)){const T=Array.isArray(b)?b:[b];for(let C=0;C<T.length;C++){const w=Xf(n,T[C]);if(w){const{transitionEnd:N,transition:M,...R}=w;for(const D in R){let O=R[D];if(Array.isArray(O)){const q=g?O.length-1:0;O=O[q]}O!==null&&(c[D]=O)}for(const D in N)c[D]=N[D]}}}return c}const ev=n=>(i,s)=>{const o=S.useContext(Yo),c=S.useContext(Ho),d=()=>t_(n,i,o,c);return s?d():yf(d)};function Kf(n,i,s){const{style:o}=n,c={};for(const d in o)(re(o[d])||i.style&&re(i.style[d])||F0(d,n)||s?.getValue(d)?.liveStyle!==void 0)&&(c[d]=o[d]);return c}const n_=ev({scrapeMotionValuesFromProps:Kf,createRenderState:qf});function nv(n,i,s){const o=Kf(n,i,s);for(const c in n)if(re(n[c])||re(i[c])){const d=Ni.indexOf(c)!==-1?"attr"+c.charAt(0).toUpperCase()+c.substring(1):c;o[d]=n[c]}return o}const a_=ev({scrapeMotionValuesFromProps:nv,createRenderState:I0}),i_=Symbol.for("motionComponentSymbol");function Ti(n){return n&&typeof n=="object"&&Object.prototype.hasOwnProperty.call(n,"current")}function l_(n,i,s){return S.useCallback(o=>{o&&n.onMount&&n.onMount(o),i&&(o?i.mount(o):i.unmount()),s&&(typeof s=="function"?s(o):Ti(s)&&(s.current=o))},[i])}const Qf=n=>n.replace(/([a-z])([A-Z])/gu,"$1-$2").toLowerCase(),s_="framerAppearId",av="data-"+Qf(s_),iv=S.createContext({});function o_(n,i,s,o,c){const{visualElement:d}=S.useContext(Yo),f=S.useContext(Z0),p=S.useContext(Ho),m=S.useContext(Uf).reducedMotion,y=S.useRef(null);o=o||f.renderer,!y.current&&o&&(y.current=o(n,{visualState:i,parent:d,props:s,presenceContext:p,blockInitialAnimation:p?p.initial===!1:!1,reducedMotionConfig:m}));const g=y.current,b=S.useContext(iv);g&&!g.projection&&c&&(g.type==="html"||g.type==="svg")&&r_(y.current,s,c,b);const T=S.useRef(!1);S.useInsertionEffect(()=>{g&&T.current&&g.update(s,p)});const C=s[av],w=S.useRef(!!C&&!window.MotionHandoffIsComplete?.(C)&&window.MotionHasOptimisedAnimation?.(C));return t0(()=>{g&&(T.current=!0,window.MotionIsMounted=!0,g.updateFeatures(),g.scheduleRenderMicrotask(),w.current&&g.animationState&&g.animationState.animateChanges())}),S.useEffect(()=>{g&&(!w.current&&g.animationState&&g.animationState.animateChanges(),w.current&&(queueMicrotask(()=>{window.MotionHandoffMarkAsComplete?.(C)}),w.current=!1),g.enteringChildren=void 0)}),g}function r_(n,i,s,o){const{layoutId:c,layout:d,drag:f,dragConstraints:p,layoutScroll:m,layoutRoot:y,layoutCrossfade:g}=i;n.projection=new s(n.latestValues,i["data-framer-portal-id"]?void 0:lv(n.parent)),n.projection.setOptions({layoutId:c,layout:d,alwaysMeasureLayout:!!f||p&&Ti(p),visualElement:n,animationType:typeof d=="string"?d:"both",initialPromotionConfig:o,crossfade:g,layoutScroll:m,layoutRoot:y})}function lv(n){if(n)return n.options.allowProjection!==!1?n.projection:lv(n.parent)}function Ec(n,{forwardMotionProps:i=!1}={},s,o){s&&L2(s);const c=Gf(n)?a_:n_;function d(p,m){let y;const g={...S.useContext(Uf),...p,layoutId:u_(p)},{isStatic:b}=g,T=k2(p),C=c(p,b);if(!b&&gf){c_();const w=f_(g);y=w.MeasureLayout,T.visualElement=o_(n,C,g,o,w.ProjectionNode)}return E.jsxs(Yo.Provider,{value:T,children:[y&&T.visualElement?E.jsx(y,{visualElement:T.visualElement,...g}):null,I2(n,p,l_(C,T.visualElement,m),C,b,i)]})}d.displayName=`motion.${typeof n=="string"?n:`create(${n.displayName??n.name??""})`}`;const f=S.forwardRef(d);return f[i_]=n,f}function u_({layoutId:n}){const i=S.useContext(pf).id;return i&&n!==void 0?i+"-"+n:n}function c_(n,i){S.useContext(Z0).strict}function f_(n){const{drag:i,layout:s}=Ci;if(!i&&!s)return{};const o={...i,...s};return{MeasureLayout:i?.isEnabled(n)||s?.isEnabled(n)?o.MeasureLayout:void 0,ProjectionNode:o.ProjectionNode}}function d_(n,i){if(typeof Proxy>"u")return Ec;const s=new Map,o=(d,f)=>Ec(d,f,n,i),c=(d,f)=>o(d,f);return new Proxy(c,{get:(d,f)=>f==="create"?o:(s.has(f)||s.set(f,Ec(f,void 0,n,i)),s.get(f))})}function sv({top:n,left:i,right:s,bottom:o}){return{x:{min:i,max:s},y:{min:n,max:o}}}function h_({x:n,y:i}){return{top:i.min,right:n.max,bottom:i.max,left:n.min}}function m_(n,i){if(!i)return n;const s=i({x:n.left,y:n.top}),o=i({x:n.right,y:n.bottom});return{top:s.y,left:s.x,bottom:o.y,right:o.x}}function _c(n){return n===void 0||n===1}function Wc({scale:n,scaleX:i,scaleY:s}){return!_c(n)||!_c(i)||!_c(s)}function Ca(n){return Wc(n)||ov(n)||n.z||n.rotate||n.rotateX||n.rotateY||n.skewX||n.skewY}function ov(n){return Vy(n.x)||Vy(n.y)}function Vy(n){return n&&n!=="0%"}function zo(n,i,s){const o=n-s,c=i*o;return s+c}function Uy(n,i,s,o,c){return c!==void 0&&(n=zo(n,c,o)),zo(n,s,o)+i}function Ic(n,i=0,s=1,o,c){n.min=Uy(n.min,i,s,o,c),n.max=Uy(n.max,i,s,o,c)}function rv(n,{x:i,y:s}){Ic(n.x,i.translate,i.scale,i.originPoint),Ic(n.y,s.translate,s.scale,s.originPoint)}const Hy=.999999999999,ky=1.0000000000001;function p_(n,i,s,o=!1){const c=s.length;if(!c)return;i.x=i.y=1;let d,f;for(let p=0;p<c;p++){d=s[p],f=d.projectionDelta;const{visualElement:m}=d.options;m&&m.props.style&&m.props.style.display==="contents"||(o&&d.options.layoutScroll&&d.scroll&&d!==d.root&&xi(n,{x:-d.scroll.offset.x,y:-d.scroll.offset.y}),f&&(i.x*=f.x.scale,i.y*=f.y.scale,rv(n,f)),o&&Ca(d.latestValues)&&xi(n,d.latestValues))}i.x<ky&&i.x>Hy&&(i.x=1),i.y<ky&&i.y>Hy&&(i.y=1)}function Si(n,i){n.min=n.min+i,n.max=n.max+i}function Yy(n,i,s,o,c=.5){const d=Ut(n.min,n.max,c);Ic(n,i,s,d,o)}function xi(n,i){Yy(n.x,i.x,i.scaleX,i.scale,i.originX),Yy(n.y,i.y,i.scaleY,i.scale,i.originY)}function uv(n,i){return sv(m_(n.getBoundingClientRect(),i))}function y_(n,i,s){const o=uv(n,s),{scroll:c}=i;return c&&(Si(o.x,c.offset.x),Si(o.y,c.offset.y)),o}const qy=()=>({translate:0,scale:1,origin:0,originPoint:0}),Ei=()=>({x:qy(),y:qy()}),Gy=()=>({min:0,max:0}),Wt=()=>({x:Gy(),y:Gy()}),tf={current:null},cv={current:!1};function g_(){if(cv.current=!0,!!gf)if(window.matchMedia){const n=window.matchMedia("(prefers-reduced-motion)"),i=()=>tf.current=n.matches;n.addEventListener("change",i),i()}else tf.current=!1}const v_=new WeakMap;function b_(n,i,s){for(const o in i){const c=i[o],d=s[o];if(re(c))n.addValue(o,c);else if(re(d))n.addValue(o,Ai(c,{owner:n}));else if(d!==c)if(n.hasValue(o)){const f=n.getValue(o);f.liveStyle===!0?f.jump(c):f.hasAnimated||f.set(c)}else{const f=n.getStaticValue(o);n.addValue(o,Ai(f!==void 0?f:c,{owner:n}))}}for(const o in s)i[o]===void 0&&n.removeValue(o);return i}const Xy=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"];class T_{scrapeMotionValuesFromProps(i,s,o){return{}}constructor({parent:i,props:s,presenceContext:o,reducedMotionConfig:c,blockInitialAnimation:d,visualState:f},p={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=wf,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{const T=Te.now();this.renderScheduledAt<T&&(this.renderScheduledAt=T,Vt.render(this.render,!1,!0))};const{latestValues:m,renderState:y}=f;this.latestValues=m,this.baseTarget={...m},this.initialValues=s.initial?{...m}:{},this.renderState=y,this.parent=i,this.props=s,this.presenceContext=o,this.depth=i?i.depth+1:0,this.reducedMotionConfig=c,this.options=p,this.blockInitialAnimation=!!d,this.isControllingVariants=Go(s),this.isVariantNode=J0(s),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(i&&i.current);const{willChange:g,...b}=this.scrapeMotionValuesFromProps(s,{},this);for(const T in b){const C=b[T];m[T]!==void 0&&re(C)&&C.set(m[T])}}mount(i){this.current=i,v_.set(i,this),this.projection&&!this.projection.instance&&this.projection.mount(i),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((s,o)=>this.bindToMotionValue(o,s)),cv.current||g_(),this.shouldReduceMotion=this.reducedMotionConfig==="never"?!1:this.reducedMotionConfig==="always"?!0:tf.current,this.parent?.addChild(this),this.update(this.props,this.presenceContext)}unmount(){this.projection&&this.projection.unmount(),na(this.notifyUpdate),na(this.render),this.valueSubscriptions.forEach(i=>i()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent?.removeChild(this);for(const i in this.events)this.events[i].clear();for(const i in this.features){const s=this.features[i];s&&(s.unmount(),s.isMounted=!1)}this.current=null}addChild(i){this.children.add(i),this.enteringChildren??(this.enteringChildren=new Set),this.enteringChildren.add(i)}removeChild(i){this.children.delete(i),this.enteringChildren&&this.enteringChildren.delete(i)}bindToMotionValue(i,s){this.valueSubscriptions.has(i)&&this.valueSubscriptions.get(i)();const o=zi.has(i);o&&this.onBindTransform&&this.onBindTransform();const c=s.on("change",f=>{this.latestValues[i]=f,this.props.onUpdate&&Vt.preRender(this.notifyUpdate),o&&this.projection&&(this.projection.isTransformDirty=!0),this.scheduleRender()});let d;window.MotionCheckAppearSync&&(d=window.MotionCheckAppearSync(this,i,s)),this.valueSubscriptions.set(i,()=>{c(),d&&d(),s.owner&&s.stop()})}sortNodePosition(i){return!this.current||!this.sortInstanceNodePosition||this.type!==i.type?0:this.sortInstanceNodePosition(this.current,i.current)}updateFeatures(){let i="animation";for(i in Ci){const s=Ci[i];if(!s)continue;const{isEnabled:o,Feature:c}=s;if(!this.features[i]&&c&&o(this.props)&&(this.features[i]=new c(this)),this.features[i]){const d=this.features[i];d.isMounted?d.update():(d.mount(),d.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):Wt()}getStaticValue(i){return this.latestValues[i]}setStaticValue(i,s){this.latestValues[i]=s}update(i,s){(i.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=i,this.prevPresenceContext=this.presenceContext,this.presenceContext=s;for(let o=0;o<Xy.length;o++){const c=Xy[o];this.propEventSubscriptions[c]&&(this.propEventSubscriptions[c](),delete this.propEventSubscriptions[c]);const d="on"+c,f=i[d];f&&(this.propEventSubscriptions[c]=this.on(c,f))}this.prevMotionValues=b_(this,this.scrapeMotionValuesFromProps(i,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(i){return this.props.variants?this.props.variants[i]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(i){const s=this.getClosestVariantNode();if(s)return s.variantChildren&&s.variantChildren.add(i),()=>s.variantChildren.delete(i)}addValue(i,s){const o=this.values.get(i);s!==o&&(o&&this.removeValue(i),this.bindToMotionValue(i,s),this.values.set(i,s),this.latestValues[i]=s.get())}removeValue(i){this.values.delete(i);const s=this.valueSubscriptions.get(i);s&&(s(),this.valueSubscriptions.delete(i)),delete this.latestValues[i],this.removeValueFromRenderState(i,this.renderState)}hasValue(i){return this.values.has(i)}getValue(i,s){if(this.props.values&&this.props.values[i])return this.props.values[i];let o=this.values.get(i);return o===void 0&&s!==void 0&&(o=Ai(s===null?void 0:s,{owner:this}),this.addValue(i,o)),o}readValue(i,s){let o=this.latestValues[i]!==void 0||!this.current?this.latestValues[i]:this.getBaseTargetFromProps(this.props,i)??this.readValueFromInstance(this.current,i,this.options);return o!=null&&(typeof o=="string"&&(e0(o)||a0(o))?o=parseFloat(o):!D2(o)&&aa.test(s)&&(o=H0(i,s)),this.setBaseTarget(i,re(o)?o.get():o)),re(o)?o.get():o}setBaseTarget(i,s){this.baseTarget[i]=s}getBaseTarget(i){const{initial:s}=this.props;let o;if(typeof s=="string"||typeof s=="object"){const d=Xf(this.props,s,this.presenceContext?.custom);d&&(o=d[i])}if(s&&o!==void 0)return o;const c=this.getBaseTargetFromProps(this.props,i);return c!==void 0&&!re(c)?c:this.initialValues[i]!==void 0&&o===void 0?void 0:this.baseTarget[i]}on(i,s){return this.events[i]||(this.events[i]=new xf),this.events[i].add(s)}notify(i,...s){this.events[i]&&this.events[i].notify(...s)}scheduleRenderMicrotask(){Bf.render(this.render)}}class fv extends T_{constructor(){super(...arguments),this.KeyframeResolver=y2}sortInstanceNodePosition(i,s){return i.compareDocumentPosition(s)&2?1:-1}getBaseTargetFromProps(i,s){return i.style?i.style[s]:void 0}removeValueFromRenderState(i,{vars:s,style:o}){delete s[i],delete o[i]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:i}=this.props;re(i)&&(this.childSubscription=i.on("change",s=>{this.current&&(this.current.textContent=`${s}`)}))}}function dv(n,{style:i,vars:s},o,c){const d=n.style;let f;for(f in i)d[f]=i[f];c?.applyProjectionStyles(d,o);for(f in s)d.setProperty(f,s[f])}function S_(n){return window.getComputedStyle(n)}class x_ extends fv{constructor(){super(...arguments),this.type="html",this.renderInstance=dv}readValueFromInstance(i,s){if(zi.has(s))return this.projection?.isProjecting?Xc(s):LE(i,s);{const o=S_(i),c=(g0(s)?o.getPropertyValue(s):o[s])||0;return typeof c=="string"?c.trim():c}}measureInstanceViewportBox(i,{transformPagePoint:s}){return uv(i,s)}build(i,s,o){Yf(i,s,o.transformTemplate)}scrapeMotionValuesFromProps(i,s,o){return Kf(i,s,o)}}const hv=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function E_(n,i,s,o){dv(n,i,void 0,o);for(const c in i.attrs)n.setAttribute(hv.has(c)?c:Qf(c),i.attrs[c])}class __ extends fv{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1,this.measureInstanceViewportBox=Wt}getBaseTargetFromProps(i,s){return i[s]}readValueFromInstance(i,s){if(zi.has(s)){const o=U0(s);return o&&o.default||0}return s=hv.has(s)?s:Qf(s),i.getAttribute(s)}scrapeMotionValuesFromProps(i,s,o){return nv(i,s,o)}build(i,s,o){W0(i,s,this.isSVGTag,o.transformTemplate,o.style)}renderInstance(i,s,o,c){E_(i,s,o,c)}mount(i){this.isSVGTag=tv(i.tagName),super.mount(i)}}const A_=(n,i)=>Gf(n)?new __(i):new x_(i,{allowProjection:n!==S.Fragment});function _i(n,i,s){const o=n.getProps();return Xf(o,i,s!==void 0?s:o.custom,n)}const ef=n=>Array.isArray(n);function C_(n,i,s){n.hasValue(i)?n.getValue(i).set(s):n.addValue(i,Ai(s))}function R_(n){return ef(n)?n[n.length-1]||0:n}function D_(n,i){const s=_i(n,i);let{transitionEnd:o={},transition:c={},...d}=s||{};d={...d,...o};for(const f in d){const p=R_(d[f]);C_(n,f,p)}}function M_(n){return!!(re(n)&&n.add)}function nf(n,i){const s=n.getValue("willChange");if(M_(s))return s.add(i);if(!s&&Mn.WillChange){const o=new Mn.WillChange("auto");n.addValue("willChange",o),o.add(i)}}function mv(n){return n.props[av]}const O_=n=>n!==null;function N_(n,{repeat:i,repeatType:s="loop"},o){const c=n.filter(O_),d=i&&s!=="loop"&&i%2===1?0:c.length-1;return c[d]}const z_={type:"spring",stiffness:500,damping:25,restSpeed:10},w_=n=>({type:"spring",stiffness:550,damping:n===0?2*Math.sqrt(550):30,restSpeed:10}),j_={type:"keyframes",duration:.8},L_={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},B_=(n,{keyframes:i})=>i.length>2?j_:zi.has(n)?n.startsWith("scale")?w_(i[1]):z_:L_;function V_({when:n,delay:i,delayChildren:s,staggerChildren:o,staggerDirection:c,repeat:d,repeatType:f,repeatDelay:p,from:m,elapsed:y,...g}){return!!Object.keys(g).length}const Zf=(n,i,s,o={},c,d)=>f=>{const p=jf(o,n)||{},m=p.delay||o.delay||0;let{elapsed:y=0}=o;y=y-an(m);const g={keyframes:Array.isArray(s)?s:[null,s],ease:"easeOut",velocity:i.getVelocity(),...p,delay:-y,onUpdate:T=>{i.set(T),p.onUpdate&&p.onUpdate(T)},onComplete:()=>{f(),p.onComplete&&p.onComplete()},name:n,motionValue:i,element:d?void 0:c};V_(p)||Object.assign(g,B_(n,g)),g.duration&&(g.duration=an(g.duration)),g.repeatDelay&&(g.repeatDelay=an(g.repeatDelay)),g.from!==void 0&&(g.keyframes[0]=g.from);let b=!1;if((g.type===!1||g.duration===0&&!g.repeatDelay)&&(Jc(g),g.delay===0&&(b=!0)),(Mn.instantAnimations||Mn.skipAnimations)&&(b=!0,Jc(g),g.delay=0),g.allowFlatten=!p.type&&!p.ease,b&&!d&&i.get()!==void 0){const T=N_(g.keyframes,p);if(T!==void 0){Vt.update(()=>{g.onUpdate(T),g.onComplete()});return}}return p.isSync?new zf(g):new i2(g)};function U_({protectedKeys:n,needsAnimating:i},s){const o=n.hasOwnProperty(s)&&i[s]!==!0;return i[s]=!1,o}function pv(n,i,{delay:s=0,transitionOverride:o,type:c}={}){let{transition:d=n.getDefaultTransition(),transitionEnd:f,...p}=i;o&&(d=o);const m=[],y=c&&n.animationState&&n.animationState.getState()[c];for(const g in p){const b=n.getValue(g,n.latestValues[g]??null),T=p[g];if(T===void 0||y&&U_(y,g))continue;const C={delay:s,...jf(d||{},g)},w=b.get();if(w!==void 0&&!b.isAnimating&&!Array.isArray(T)&&T===w&&!C.velocity)continue;let N=!1;if(window.MotionHandoffAnimation){const R=mv(n);if(R){const D=window.MotionHandoffAnimation(R,g,Vt);D!==null&&(C.startTime=D,N=!0)}}nf(n,g),b.start(Zf(g,b,T,n.shouldReduceMotion&&L0.has(g)?{type:!1}:C,n,N));const M=b.animation;M&&m.push(M)}return f&&Promise.all(m).then(()=>{Vt.update(()=>{f&&D_(n,f)})}),m}function yv(n,i,s,o=0,c=1){const d=Array.from(n).sort((y,g)=>y.sortNodePosition(g)).indexOf(i),f=n.size,p=(f-1)*o;return typeof s=="function"?s(d,f):c===1?d*o:p-d*o}function af(n,i,s={}){const o=_i(n,i,s.type==="exit"?n.presenceContext?.custom:void 0);let{transition:c=n.getDefaultTransition()||{}}=o||{};s.transitionOverride&&(c=s.transitionOverride);const d=o?()=>Promise.all(pv(n,o,s)):()=>Promise.resolve(),f=n.variantChildren&&n.variantChildren.size?(m=0)=>{const{delayChildren:y=0,staggerChildren:g,staggerDirection:b}=c;return H_(n,i,m,y,g,b,s)}:()=>Promise.resolve(),{when:p}=c;if(p){const[m,y]=p==="beforeChildren"?[d,f]:[f,d];return m().then(()=>y())}else return Promise.all([d(),f(s.delay)])}function H_(n,i,s=0,o=0,c=0,d=1,f){const p=[];for(const m of n.variantChildren)m.notify("AnimationStart",i),p.push(af(m,i,{...f,delay:s+(typeof o=="function"?0:o)+yv(n.variantChildren,m,o,c,d)}).then(()=>m.notify("AnimationComplete",i)));return Promise.all(p)}function k_(n,i,s={}){n.notify("AnimationStart",i);let o;if(Array.isArray(i)){const c=i.map(d=>af(n,d,s));o=Promise.all(c)}else if(typeof i=="string")o=af(n,i,s);else{const c=typeof i=="function"?_i(n,i,s.custom):i;o=Promise.all(pv(n,c,s))}return o.then(()=>{n.notify("AnimationComplete",i)})}function gv(n,i){if(!Array.isArray(i))return!1;const s=i.length;if(s!==n.length)return!1;for(let o=0;o<s;o++)if(i[o]!==n[o])return!1;return!0}const Y_=kf.length;function vv(n){if(!n)return;if(!n.isControllingVariants){const s=n.parent?vv(n.parent)||{}:{};return n.props.initial!==void 0&&(s.initial=n.props.initial),s}const i={};for(let s=0;s<Y_;s++){const o=kf[s],c=n.props[o];(kl(c)||c===!1)&&(i[o]=c)}return i}const q_=[...Hf].reverse(),G_=Hf.length;function X_(n){return i=>Promise.all(i.map(({animation:s,options:o})=>k_(n,s,o)))}function K_(n){let i=X_(n),s=Ky(),o=!0;const c=m=>(y,g)=>{const b=_i(n,g,m==="exit"?n.presenceContext?.custom:void 0);if(b){const{transition:T,transitionEnd:C,...w}=b;y={...y,...w,...C}}return y};function d(m){i=m(n)}function f(m){const{props:y}=n,g=vv(n.parent)||{},b=[],T=new Set;let C={},w=1/0;for(let M=0;M<G_;M++){const R=q_[M],D=s[R],O=y[R]!==void 0?y[R]:g[R],q=kl(O),Y=R===m?D.isActive:null;Y===!1&&(w=M);let Q=O===g[R]&&O!==y[R]&&q;if(Q&&o&&n.manuallyAnimateOnMount&&(Q=!1),D.protectedKeys={...C},!D.isActive&&Y===null||!O&&!D.prevProp||qo(O)||typeof O=="boolean")continue;const U=Q_(D.prevProp,O);let Z=U||R===m&&D.isActive&&!Q&&q||M>w&&q,tt=!1;const lt=Array.isArray(O)?O:[O];let St=lt.reduce(c(R),{});Y===!1&&(St={});const{prevResolvedValues:Mt={}}=D,gt={...Mt,...St},jt=P=>{Z=!0,T.has(P)&&(tt=!0,T.delete(P)),D.needsAnimating[P]=!0;const F=n.getValue(P);F&&(F.liveStyle=!1)};for(const P in gt){const F=St[P],ct=Mt[P];if(C.hasOwnProperty(P))continue;let mt=!1;ef(F)&&ef(ct)?mt=!gv(F,ct):mt=F!==ct,mt?F!=null?jt(P):T.add(P):F!==void 0&&T.has(P)?jt(P):D.protectedKeys[P]=!0}D.prevProp=O,D.prevResolvedValues=St,D.isActive&&(C={...C,...St}),o&&n.blockInitialAnimation&&(Z=!1);const Lt=Q&&U;Z&&(!Lt||tt)&&b.push(...lt.map(P=>{const F={type:R};if(typeof P=="string"&&o&&!Lt&&n.manuallyAnimateOnMount&&n.parent){const{parent:ct}=n,mt=_i(ct,P);if(ct.enteringChildren&&mt){const{delayChildren:A}=mt.transition||{};F.delay=yv(ct.enteringChildren,n,A)}}return{animation:P,options:F}}))}if(T.size){const M={};if(typeof y.initial!="boolean"){const R=_i(n,Array.isArray(y.initial)?y.initial[0]:y.initial);R&&R.transition&&(M.transition=R.transition)}T.forEach(R=>{const D=n.getBaseTarget(R),O=n.getValue(R);O&&(O.liveStyle=!0),M[R]=D??null}),b.push({animation:M})}let N=!!b.length;return o&&(y.initial===!1||y.initial===y.animate)&&!n.manuallyAnimateOnMount&&(N=!1),o=!1,N?i(b):Promise.resolve()}function p(m,y){if(s[m].isActive===y)return Promise.resolve();n.variantChildren?.forEach(b=>b.animationState?.setActive(m,y)),s[m].isActive=y;const g=f(m);for(const b in s)s[b].protectedKeys={};return g}return{animateChanges:f,setActive:p,setAnimateFunction:d,getState:()=>s,reset:()=>{s=Ky()}}}function Q_(n,i){return typeof i=="string"?i!==n:Array.isArray(i)?!gv(i,n):!1}function _a(n=!1){return{isActive:n,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function Ky(){return{animate:_a(!0),whileInView:_a(),whileHover:_a(),whileTap:_a(),whileDrag:_a(),whileFocus:_a(),exit:_a()}}class ia{constructor(i){this.isMounted=!1,this.node=i}update(){}}class Z_ extends ia{constructor(i){super(i),i.animationState||(i.animationState=K_(i))}updateAnimationControlsSubscription(){const{animate:i}=this.node.getProps();qo(i)&&(this.unmountControls=i.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:i}=this.node.getProps(),{animate:s}=this.node.prevProps||{};i!==s&&this.updateAnimationControlsSubscription()}unmount(){this.node.animationState.reset(),this.unmountControls?.()}}let P_=0;class J_ extends ia{constructor(){super(...arguments),this.id=P_++}update(){if(!this.node.presenceContext)return;const{isPresent:i,onExitComplete:s}=this.node.presenceContext,{isPresent:o}=this.node.prevPresenceContext||{};if(!this.node.animationState||i===o)return;const c=this.node.animationState.setActive("exit",!i);s&&!i&&c.then(()=>{s(this.id)})}mount(){const{register:i,onExitComplete:s}=this.node.presenceContext||{};s&&s(this.id),i&&(this.unmount=i(this.id))}unmount(){}}const F_={animation:{Feature:Z_},exit:{Feature:J_}};function Yl(n,i,s,o={passive:!0}){return n.addEventListener(i,s,o),()=>n.removeEventListener(i,s)}function Fl(n){return{point:{x:n.pageX,y:n.pageY}}}const $_=n=>i=>Vf(i)&&n(i,Fl(i));function wl(n,i,s,o){return Yl(n,i,$_(s),o)}const bv=1e-4,W_=1-bv,I_=1+bv,Tv=.01,tA=0-Tv,eA=0+Tv;function de(n){return n.max-n.min}function nA(n,i,s){return Math.abs(n-i)<=s}function Qy(n,i,s,o=.5){n.origin=o,n.originPoint=Ut(i.min,i.max,n.origin),n.scale=de(s)/de(i),n.translate=Ut(s.min,s.max,n.origin)-n.originPoint,(n.scale>=W_&&n.scale<=I_||isNaN(n.scale))&&(n.scale=1),(n.translate>=tA&&n.translate<=eA||isNaN(n.translate))&&(n.translate=0)}function jl(n,i,s,o){Qy(n.x,i.x,s.x,o?o.originX:void 0),Qy(n.y,i.y,s.y,o?o.originY:void 0)}function Zy(n,i,s){n.min=s.min+i.min,n.max=n.min+de(i)}function aA(n,i,s){Zy(n.x,i.x,s.x),Zy(n.y,i.y,s.y)}function Py(n,i,s){n.min=i.min-s.min,n.max=n.min+de(i)}function wo(n,i,s){Py(n.x,i.x,s.x),Py(n.y,i.y,s.y)}function Ye(n){return[n("x"),n("y")]}const Sv=({current:n})=>n?n.ownerDocument.defaultView:null,Jy=(n,i)=>Math.abs(n-i);function iA(n,i){const s=Jy(n.x,i.x),o=Jy(n.y,i.y);return Math.sqrt(s**2+o**2)}class xv{constructor(i,s,{transformPagePoint:o,contextWindow:c=window,dragSnapToOrigin:d=!1,distanceThreshold:f=3}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const T=Cc(this.lastMoveEventInfo,this.history),C=this.startEvent!==null,w=iA(T.offset,{x:0,y:0})>=this.distanceThreshold;if(!C&&!w)return;const{point:N}=T,{timestamp:M}=se;this.history.push({...N,timestamp:M});const{onStart:R,onMove:D}=this.handlers;C||(R&&R(this.lastMoveEvent,T),this.startEvent=this.lastMoveEvent),D&&D(this.lastMoveEvent,T)},this.handlePointerMove=(T,C)=>{this.lastMoveEvent=T,this.lastMoveEventInfo=Ac(C,this.transformPagePoint),Vt.update(this.updatePoint,!0)},this.handlePointerUp=(T,C)=>{this.end();const{onEnd:w,onSessionEnd:N,resumeAnimation:M}=this.handlers;if(this.dragSnapToOrigin&&M&&M(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const R=Cc(T.type==="pointercancel"?this.lastMoveEventInfo:Ac(C,this.transformPagePoint),this.history);this.startEvent&&w&&w(T,R),N&&N(T,R)},!Vf(i))return;this.dragSnapToOrigin=d,this.handlers=s,this.transformPagePoint=o,this.distanceThreshold=f,this.contextWindow=c||window;const p=Fl(i),m=Ac(p,this.transformPagePoint),{point:y}=m,{timestamp:g}=se;this.history=[{...y,timestamp:g}];const{onSessionStart:b}=s;b&&b(i,Cc(m,this.history)),this.removeListeners=Zl(wl(this.contextWindow,"pointermove",this.handlePointerMove),wl(this.contextWindow,"pointerup",this.handlePointerUp),wl(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(i){this.handlers=i}end(){this.removeListeners&&this.removeListeners(),na(this.updatePoint)}}function Ac(n,i){return i?{point:i(n.point)}:n}function Fy(n,i){return{x:n.x-i.x,y:n.y-i.y}}function Cc({point:n},i){return{point:n,delta:Fy(n,Ev(i)),offset:Fy(n,lA(i)),velocity:sA(i,.1)}}function lA(n){return n[0]}function Ev(n){return n[n.length-1]}function sA(n,i){if(n.length<2)return{x:0,y:0};let s=n.length-1,o=null;const c=Ev(n);for(;s>=0&&(o=n[s],!(c.timestamp-o.timestamp>an(i)));)s--;if(!o)return{x:0,y:0};const d=qe(c.timestamp-o.timestamp);if(d===0)return{x:0,y:0};const f={x:(c.x-o.x)/d,y:(c.y-o.y)/d};return f.x===1/0&&(f.x=0),f.y===1/0&&(f.y=0),f}function oA(n,{min:i,max:s},o){return i!==void 0&&n<i?n=o?Ut(i,n,o.min):Math.max(n,i):s!==void 0&&n>s&&(n=o?Ut(s,n,o.max):Math.min(n,s)),n}function $y(n,i,s){return{min:i!==void 0?n.min+i:void 0,max:s!==void 0?n.max+s-(n.max-n.min):void 0}}function rA(n,{top:i,left:s,bottom:o,right:c}){return{x:$y(n.x,s,c),y:$y(n.y,i,o)}}function Wy(n,i){let s=i.min-n.min,o=i.max-n.max;return i.max-i.min<n.max-n.min&&([s,o]=[o,s]),{min:s,max:o}}function uA(n,i){return{x:Wy(n.x,i.x),y:Wy(n.y,i.y)}}function cA(n,i){let s=.5;const o=de(n),c=de(i);return c>o?s=Vl(i.min,i.max-o,n.min):o>c&&(s=Vl(n.min,n.max-c,i.min)),Dn(0,1,s)}function fA(n,i){const s={};return i.min!==void 0&&(s.min=i.min-n.min),i.max!==void 0&&(s.max=i.max-n.min),s}const lf=.35;function dA(n=lf){return n===!1?n=0:n===!0&&(n=lf),{x:Iy(n,"left","right"),y:Iy(n,"top","bottom")}}function Iy(n,i,s){return{min:tg(n,i),max:tg(n,s)}}function tg(n,i){return typeof n=="number"?n:n[i]||0}const hA=new WeakMap;class mA{constructor(i){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=Wt(),this.latestPointerEvent=null,this.latestPanInfo=null,this.visualElement=i}start(i,{snapToCursor:s=!1,distanceThreshold:o}={}){const{presenceContext:c}=this.visualElement;if(c&&c.isPresent===!1)return;const d=b=>{const{dragSnapToOrigin:T}=this.getProps();T?this.pauseAnimation():this.stopAnimation(),s&&this.snapToCursor(Fl(b).point)},f=(b,T)=>{const{drag:C,dragPropagation:w,onDragStart:N}=this.getProps();if(C&&!w&&(this.openDragLock&&this.openDragLock(),this.openDragLock=T2(C),!this.openDragLock))return;this.latestPointerEvent=b,this.latestPanInfo=T,this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Ye(R=>{let D=this.getAxisMotionValue(R).get()||0;if(ln.test(D)){const{projection:O}=this.visualElement;if(O&&O.layout){const q=O.layout.layoutBox[R];q&&(D=de(q)*(parseFloat(D)/100))}}this.originPoint[R]=D}),N&&Vt.postRender(()=>N(b,T)),nf(this.visualElement,"transform");const{animationState:M}=this.visualElement;M&&M.setActive("whileDrag",!0)},p=(b,T)=>{this.latestPointerEvent=b,this.latestPanInfo=T;const{dragPropagation:C,dragDirectionLock:w,onDirectionLock:N,onDrag:M}=this.getProps();if(!C&&!this.openDragLock)return;const{offset:R}=T;if(w&&this.currentDirection===null){this.currentDirection=pA(R),this.currentDirection!==null&&N&&N(this.currentDirection);return}this.updateAxis("x",T.point,R),this.updateAxis("y",T.point,R),this.visualElement.render(),M&&M(b,T)},m=(b,T)=>{this.latestPointerEvent=b,this.latestPanInfo=T,this.stop(b,T),this.latestPointerEvent=null,this.latestPanInfo=null},y=()=>Ye(b=>this.getAnimationState(b)==="paused"&&this.getAxisMotionValue(b).animation?.play()),{dragSnapToOrigin:g}=this.getProps();this.panSession=new xv(i,{onSessionStart:d,onStart:f,onMove:p,onSessionEnd:m,resumeAnimation:y},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:g,distanceThreshold:o,contextWindow:Sv(this.visualElement)})}stop(i,s){const o=i||this.latestPointerEvent,c=s||this.latestPanInfo,d=this.isDragging;if(this.cancel(),!d||!c||!o)return;const{velocity:f}=c;this.startAnimation(f);const{onDragEnd:p}=this.getProps();p&&Vt.postRender(()=>p(o,c))}cancel(){this.isDragging=!1;const{projection:i,animationState:s}=this.visualElement;i&&(i.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:o}=this.getProps();!o&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),s&&s.setActive("whileDrag",!1)}updateAxis(i,s,o){const{drag:c}=this.getProps();if(!o||!To(i,c,this.currentDirection))return;const d=this.getAxisMotionValue(i);let f=this.originPoint[i]+o[i];this.constraints&&this.constraints[i]&&(f=oA(f,this.constraints[i],this.elastic[i])),d.set(f)}resolveConstraints(){const{dragConstraints:i,dragElastic:s}=this.getProps(),o=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):this.visualElement.projection?.layout,c=this.constraints;i&&Ti(i)?this.constraints||(this.constraints=this.resolveRefConstraints()):i&&o?this.constraints=rA(o.layoutBox,i):this.constraints=!1,this.elastic=dA(s),c!==this.constraints&&o&&this.constraints&&!this.hasMutatedConstraints&&Ye(d=>{this.constraints!==!1&&this.getAxisMotionValue(d)&&(this.constraints[d]=fA(o.layoutBox[d],this.constraints[d]))})}resolveRefConstraints(){const{dragConstraints:i,onMeasureDragConstraints:s}=this.getProps();if(!i||!Ti(i))return!1;const o=i.current,{projection:c}=this.visualElement;if(!c||!c.layout)return!1;const d=y_(o,c.root,this.visualElement.getTransformPagePoint());let f=uA(c.layout.layoutBox,d);if(s){const p=s(h_(f));this.hasMutatedConstraints=!!p,p&&(f=sv(p))}return f}startAnimation(i){const{drag:s,dragMomentum:o,dragElastic:c,dragTransition:d,dragSnapToOrigin:f,onDragTransitionEnd:p}=this.getProps(),m=this.constraints||{},y=Ye(g=>{if(!To(g,s,this.currentDirection))return;let b=m&&m[g]||{};f&&(b={min:0,max:0});const T=c?200:1e6,C=c?40:1e7,w={type:"inertia",velocity:o?i[g]:0,bounceStiffness:T,bounceDamping:C,timeConstant:750,restDelta:1,restSpeed:10,...d,...b};return this.startAxisValueAnimation(g,w)});return Promise.all(y).then(p)}startAxisValueAnimation(i,s){const o=this.getAxisMotionValue(i);return nf(this.visualElement,i),o.start(Zf(i,o,0,s,this.visualElement,!1))}stopAnimation(){Ye(i=>this.getAxisMotionValue(i).stop())}pauseAnimation(){Ye(i=>this.getAxisMotionValue(i).animation?.pause())}getAnimationState(i){return this.getAxisMotionValue(i).animation?.state}getAxisMotionValue(i){const s=`_drag${i.toUpperCase()}`,o=this.visualElement.getProps(),c=o[s];return c||this.visualElement.getValue(i,(o.initial?o.initial[i]:void 0)||0)}snapToCursor(i){Ye(s=>{const{drag:o}=this.getProps();if(!To(s,o,this.currentDirection))return;const{projection:c}=this.visualElement,d=this.getAxisMotionValue(s);if(c&&c.layout){const{min:f,max:p}=c.layout.layoutBox[s];d.set(i[s]-Ut(f,p,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:i,dragConstraints:s}=this.getProps(),{projection:o}=this.visualElement;if(!Ti(s)||!o||!this.constraints)return;this.stopAnimation();const c={x:0,y:0};Ye(f=>{const p=this.getAxisMotionValue(f);if(p&&this.constraints!==!1){const m=p.get();c[f]=cA({min:m,max:m},this.constraints[f])}});const{transformTemplate:d}=this.visualElement.getProps();this.visualElement.current.style.transform=d?d({},""):"none",o.root&&o.root.updateScroll(),o.updateLayout(),this.resolveConstraints(),Ye(f=>{if(!To(f,i,null))return;const p=this.getAxisMotionValue(f),{min:m,max:y}=this.constraints[f];p.set(Ut(m,y,c[f]))})}addListeners(){if(!this.visualElement.current)return;hA.set(this.visualElement,this);const i=this.visualElement.current,s=wl(i,"pointerdown",m=>{const{drag:y,dragListener:g=!0}=this.getProps();y&&g&&this.start(m)}),o=()=>{const{dragConstraints:m}=this.getProps();Ti(m)&&m.current&&(this.constraints=this.resolveRefConstraints())},{projection:c}=this.visualElement,d=c.addEventListener("measure",o);c&&!c.layout&&(c.root&&c.root.updateScroll(),c.updateLayout()),Vt.read(o);const f=Yl(window,"resize",()=>this.scalePositionWithinConstraints()),p=c.addEventListener("didUpdate",(({delta:m,hasLayoutChanged:y})=>{this.isDragging&&y&&(Ye(g=>{const b=this.getAxisMotionValue(g);b&&(this.originPoint[g]+=m[g].translate,b.set(b.get()+m[g].translate))}),this.visualElement.render())}));return()=>{f(),s(),d(),p&&p()}}getProps(){const i=this.visualElement.getProps(),{drag:s=!1,dragDirectionLock:o=!1,dragPropagation:c=!1,dragConstraints:d=!1,dragElastic:f=lf,dragMomentum:p=!0}=i;return{...i,drag:s,dragDirectionLock:o,dragPropagation:c,dragConstraints:d,dragElastic:f,dragMomentum:p}}}function To(n,i,s){return(i===!0||i===n)&&(s===null||s===n)}function pA(n,i=10){let s=null;return Math.abs(n.y)>i?s="y":Math.abs(n.x)>i&&(s="x"),s}class yA extends ia{constructor(i){super(i),this.removeGroupControls=Ge,this.removeListeners=Ge,this.controls=new mA(i)}mount(){const{dragControls:i}=this.node.getProps();i&&(this.removeGroupControls=i.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||Ge}unmount(){this.removeGroupControls(),this.removeListeners()}}const eg=n=>(i,s)=>{n&&Vt.postRender(()=>n(i,s))};class gA extends ia{constructor(){super(...arguments),this.removePointerDownListener=Ge}onPointerDown(i){this.session=new xv(i,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:Sv(this.node)})}createPanHandlers(){const{onPanSessionStart:i,onPanStart:s,onPan:o,onPanEnd:c}=this.node.getProps();return{onSessionStart:eg(i),onStart:eg(s),onMove:o,onEnd:(d,f)=>{delete this.session,c&&Vt.postRender(()=>c(d,f))}}}mount(){this.removePointerDownListener=wl(this.node.current,"pointerdown",i=>this.onPointerDown(i))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}const Co={hasAnimatedSinceResize:!0,hasEverUpdated:!1};let Rc=!1;class vA extends S.Component{componentDidMount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:o,layoutId:c}=this.props,{projection:d}=i;d&&(s.group&&s.group.add(d),o&&o.register&&c&&o.register(d),Rc&&d.root.didUpdate(),d.addEventListener("animationComplete",()=>{this.safeToRemove()}),d.setOptions({...d.options,onExitComplete:()=>this.safeToRemove()})),Co.hasEverUpdated=!0}getSnapshotBeforeUpdate(i){const{layoutDependency:s,visualElement:o,drag:c,isPresent:d}=this.props,{projection:f}=o;return f&&(f.isPresent=d,Rc=!0,c||i.layoutDependency!==s||s===void 0||i.isPresent!==d?f.willUpdate():this.safeToRemove(),i.isPresent!==d&&(d?f.promote():f.relegate()||Vt.postRender(()=>{const p=f.getStack();(!p||!p.members.length)&&this.safeToRemove()}))),null}componentDidUpdate(){const{projection:i}=this.props.visualElement;i&&(i.root.didUpdate(),Bf.postRender(()=>{!i.currentAnimation&&i.isLead()&&this.safeToRemove()}))}componentWillUnmount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:o}=this.props,{projection:c}=i;Rc=!0,c&&(c.scheduleCheckAfterUnmount(),s&&s.group&&s.group.remove(c),o&&o.deregister&&o.deregister(c))}safeToRemove(){const{safeToRemove:i}=this.props;i&&i()}render(){return null}}function _v(n){const[i,s]=Q0(),o=S.useContext(pf);return E.jsx(vA,{...n,layoutGroup:o,switchLayoutGroup:S.useContext(iv),isPresent:i,safeToRemove:s})}function bA(n,i,s){const o=re(n)?n:Ai(n);return o.start(Zf("",o,i,s)),o.animation}const TA=(n,i)=>n.depth-i.depth;class SA{constructor(){this.children=[],this.isDirty=!1}add(i){vf(this.children,i),this.isDirty=!0}remove(i){bf(this.children,i),this.isDirty=!0}forEach(i){this.isDirty&&this.children.sort(TA),this.isDirty=!1,this.children.forEach(i)}}function xA(n,i){const s=Te.now(),o=({timestamp:c})=>{const d=c-s;d>=i&&(na(o),n(d-i))};return Vt.setup(o,!0),()=>na(o)}const Av=["TopLeft","TopRight","BottomLeft","BottomRight"],EA=Av.length,ng=n=>typeof n=="string"?parseFloat(n):n,ag=n=>typeof n=="number"||at.test(n);function _A(n,i,s,o,c,d){c?(n.opacity=Ut(0,s.opacity??1,AA(o)),n.opacityExit=Ut(i.opacity??1,0,CA(o))):d&&(n.opacity=Ut(i.opacity??1,s.opacity??1,o));for(let f=0;f<EA;f++){const p=`border${Av[f]}Radius`;let m=ig(i,p),y=ig(s,p);if(m===void 0&&y===void 0)continue;m||(m=0),y||(y=0),m===0||y===0||ag(m)===ag(y)?(n[p]=Math.max(Ut(ng(m),ng(y),o),0),(ln.test(y)||ln.test(m))&&(n[p]+="%")):n[p]=y}(i.rotate||s.rotate)&&(n.rotate=Ut(i.rotate||0,s.rotate||0,o))}function ig(n,i){return n[i]!==void 0?n[i]:n.borderRadius}const AA=Cv(0,.5,f0),CA=Cv(.5,.95,Ge);function Cv(n,i,s){return o=>o<n?0:o>i?1:s(Vl(n,i,o))}function lg(n,i){n.min=i.min,n.max=i.max}function Pe(n,i){lg(n.x,i.x),lg(n.y,i.y)}function sg(n,i){n.translate=i.translate,n.scale=i.scale,n.originPoint=i.originPoint,n.origin=i.origin}function og(n,i,s,o,c){return n-=i,n=zo(n,1/s,o),c!==void 0&&(n=zo(n,1/c,o)),n}function RA(n,i=0,s=1,o=.5,c,d=n,f=n){if(ln.test(i)&&(i=parseFloat(i),i=Ut(f.min,f.max,i/100)-f.min),typeof i!="number")return;let p=Ut(d.min,d.max,o);n===d&&(p-=i),n.min=og(n.min,i,s,p,c),n.max=og(n.max,i,s,p,c)}function rg(n,i,[s,o,c],d,f){RA(n,i[s],i[o],i[c],i.scale,d,f)}const DA=["x","scaleX","originX"],MA=["y","scaleY","originY"];function ug(n,i,s,o){rg(n.x,i,DA,s?s.x:void 0,o?o.x:void 0),rg(n.y,i,MA,s?s.y:void 0,o?o.y:void 0)}function cg(n){return n.translate===0&&n.scale===1}function Rv(n){return cg(n.x)&&cg(n.y)}function fg(n,i){return n.min===i.min&&n.max===i.max}function OA(n,i){return fg(n.x,i.x)&&fg(n.y,i.y)}function dg(n,i){return Math.round(n.min)===Math.round(i.min)&&Math.round(n.max)===Math.round(i.max)}function Dv(n,i){return dg(n.x,i.x)&&dg(n.y,i.y)}function hg(n){return de(n.x)/de(n.y)}function mg(n,i){return n.translate===i.translate&&n.scale===i.scale&&n.originPoint===i.originPoint}class NA{constructor(){this.members=[]}add(i){vf(this.members,i),i.scheduleRender()}remove(i){if(bf(this.members,i),i===this.prevLead&&(this.prevLead=void 0),i===this.lead){const s=this.members[this.members.length-1];s&&this.promote(s)}}relegate(i){const s=this.members.findIndex(c=>i===c);if(s===0)return!1;let o;for(let c=s;c>=0;c--){const d=this.members[c];if(d.isPresent!==!1){o=d;break}}return o?(this.promote(o),!0):!1}promote(i,s){const o=this.lead;if(i!==o&&(this.prevLead=o,this.lead=i,i.show(),o)){o.instance&&o.scheduleRender(),i.scheduleRender(),i.resumeFrom=o,s&&(i.resumeFrom.preserveOpacity=!0),o.snapshot&&(i.snapshot=o.snapshot,i.snapshot.latestValues=o.animationValues||o.latestValues),i.root&&i.root.isUpdating&&(i.isLayoutDirty=!0);const{crossfade:c}=i.options;c===!1&&o.hide()}}exitAnimationComplete(){this.members.forEach(i=>{const{options:s,resumingFrom:o}=i;s.onExitComplete&&s.onExitComplete(),o&&o.options.onExitComplete&&o.options.onExitComplete()})}scheduleRender(){this.members.forEach(i=>{i.instance&&i.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function zA(n,i,s){let o="";const c=n.x.translate/i.x,d=n.y.translate/i.y,f=s?.z||0;if((c||d||f)&&(o=`translate3d(${c}px, ${d}px, ${f}px) `),(i.x!==1||i.y!==1)&&(o+=`scale(${1/i.x}, ${1/i.y}) `),s){const{transformPerspective:y,rotate:g,rotateX:b,rotateY:T,skewX:C,skewY:w}=s;y&&(o=`perspective(${y}px) ${o}`),g&&(o+=`rotate(${g}deg) `),b&&(o+=`rotateX(${b}deg) `),T&&(o+=`rotateY(${T}deg) `),C&&(o+=`skewX(${C}deg) `),w&&(o+=`skewY(${w}deg) `)}const p=n.x.scale*i.x,m=n.y.scale*i.y;return(p!==1||m!==1)&&(o+=`scale(${p}, ${m})`),o||"none"}const Dc=["","X","Y","Z"],wA=1e3;let jA=0;function Mc(n,i,s,o){const{latestValues:c}=i;c[n]&&(s[n]=c[n],i.setStaticValue(n,0),o&&(o[n]=0))}function Mv(n){if(n.hasCheckedOptimisedAppear=!0,n.root===n)return;const{visualElement:i}=n.options;if(!i)return;const s=mv(i);if(window.MotionHasOptimisedAnimation(s,"transform")){const{layout:c,layoutId:d}=n.options;window.MotionCancelOptimisedAnimation(s,"transform",Vt,!(c||d))}const{parent:o}=n;o&&!o.hasCheckedOptimisedAppear&&Mv(o)}function Ov({attachResizeListener:n,defaultParent:i,measureScroll:s,checkIsScrollRoot:o,resetTransform:c}){return class{constructor(f={},p=i?.()){this.id=jA++,this.animationId=0,this.animationCommitId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.layoutVersion=0,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,this.nodes.forEach(VA),this.nodes.forEach(YA),this.nodes.forEach(qA),this.nodes.forEach(UA)},this.resolvedRelativeTargetAt=0,this.linkedParentVersion=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=f,this.root=p?p.root||p:this,this.path=p?[...p.path,p]:[],this.parent=p,this.depth=p?p.depth+1:0;for(let m=0;m<this.path.length;m++)this.path[m].shouldResetTransform=!0;this.root===this&&(this.nodes=new SA)}addEventListener(f,p){return this.eventHandlers.has(f)||this.eventHandlers.set(f,new xf),this.eventHandlers.get(f).add(p)}notifyListeners(f,...p){const m=this.eventHandlers.get(f);m&&m.notify(...p)}hasListeners(f){return this.eventHandlers.has(f)}mount(f){if(this.instance)return;this.isSVG=K0(f)&&!C2(f),this.instance=f;const{layoutId:p,layout:m,visualElement:y}=this.options;if(y&&!y.current&&y.mount(f),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(m||p)&&(this.isLayoutDirty=!0),n){let g,b=0;const T=()=>this.root.updateBlockedByResize=!1;Vt.read(()=>{b=window.innerWidth}),n(f,()=>{const C=window.innerWidth;C!==b&&(b=C,this.root.updateBlockedByResize=!0,g&&g(),g=xA(T,250),Co.hasAnimatedSinceResize&&(Co.hasAnimatedSinceResize=!1,this.nodes.forEach(gg)))})}p&&this.root.registerSharedNode(p,this),this.options.animate!==!1&&y&&(p||m)&&this.addEventListener("didUpdate",({delta:g,hasLayoutChanged:b,hasRelativeLayoutChanged:T,layout:C})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}const w=this.options.transition||y.getDefaultTransition()||ZA,{onLayoutAnimationStart:N,onLayoutAnimationComplete:M}=y.getProps(),R=!this.targetLayout||!Dv(this.targetLayout,C),D=!b&&T;if(this.options.layoutRoot||this.resumeFrom||D||b&&(R||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0);const O={...jf(w,"layout"),onPlay:N,onComplete:M};(y.shouldReduceMotion||this.options.layoutRoot)&&(O.delay=0,O.type=!1),this.startAnimation(O),this.setAnimationOrigin(g,D)}else b||gg(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=C})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const f=this.getStack();f&&f.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),na(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(GA),this.animationId++)}getTransformTemplate(){const{visualElement:f}=this.options;return f&&f.getProps().transformTemplate}willUpdate(f=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&Mv(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let g=0;g<this.path.length;g++){const b=this.path[g];b.shouldResetTransform=!0,b.updateScroll("snapshot"),b.options.layoutRoot&&b.willUpdate(!1)}const{layoutId:p,layout:m}=this.options;if(p===void 0&&!m)return;const y=this.getTransformTemplate();this.prevTransformTemplateValue=y?y(this.latestValues,""):void 0,this.updateSnapshot(),f&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(pg);return}if(this.animationId<=this.animationCommitId){this.nodes.forEach(yg);return}this.animationCommitId=this.animationId,this.isUpdating?(this.isUpdating=!1,this.nodes.forEach(kA),this.nodes.forEach(LA),this.nodes.forEach(BA)):this.nodes.forEach(yg),this.clearAllSnapshots();const p=Te.now();se.delta=Dn(0,1e3/60,p-se.timestamp),se.timestamp=p,se.isProcessing=!0,gc.update.process(se),gc.preRender.process(se),gc.render.process(se),se.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,Bf.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(HA),this.sharedNodes.forEach(XA)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Vt.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Vt.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!de(this.snapshot.measuredBox.x)&&!de(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let m=0;m<this.path.length;m++)this.path[m].updateScroll();const f=this.layout;this.layout=this.measure(!1),this.layoutVersion++,this.layoutCorrected=Wt(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:p}=this.options;p&&p.notify("LayoutMeasure",this.layout.layoutBox,f?f.layoutBox:void 0)}updateScroll(f="measure"){let p=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===f&&(p=!1),p&&this.instance){const m=o(this.instance);this.scroll={animationId:this.root.animationId,phase:f,isRoot:m,offset:s(this.instance),wasRoot:this.scroll?this.scroll.isRoot:m}}}resetTransform(){if(!c)return;const f=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,p=this.projectionDelta&&!Rv(this.projectionDelta),m=this.getTransformTemplate(),y=m?m(this.latestValues,""):void 0,g=y!==this.prevTransformTemplateValue;f&&this.instance&&(p||Ca(this.latestValues)||g)&&(c(this.instance,y),this.shouldResetTransform=!1,this.scheduleRender())}measure(f=!0){const p=this.measurePageBox();let m=this.removeElementScroll(p);return f&&(m=this.removeTransform(m)),PA(m),{animationId:this.root.animationId,measuredBox:p,layoutBox:m,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:f}=this.options;if(!f)return Wt();const p=f.measureViewportBox();if(!(this.scroll?.wasRoot||this.path.some(JA))){const{scroll:y}=this.root;y&&(Si(p.x,y.offset.x),Si(p.y,y.offset.y))}return p}removeElementScroll(f){const p=Wt();if(Pe(p,f),this.scroll?.wasRoot)return p;for(let m=0;m<this.path.length;m++){const y=this.path[m],{scroll:g,options:b}=y;y!==this.root&&g&&b.layoutScroll&&(g.wasRoot&&Pe(p,f),Si(p.x,g.offset.x),Si(p.y,g.offset.y))}return p}applyTransform(f,p=!1){const m=Wt();Pe(m,f);for(let y=0;y<this.path.length;y++){const g=this.path[y];!p&&g.options.layoutScroll&&g.scroll&&g!==g.root&&xi(m,{x:-g.scroll.offset.x,y:-g.scroll.offset.y}),Ca(g.latestValues)&&xi(m,g.latestValues)}return Ca(this.latestValues)&&xi(m,this.latestValues),m}removeTransform(f){const p=Wt();Pe(p,f);for(let m=0;m<this.path.length;m++){const y=this.path[m];if(!y.instance||!Ca(y.latestValues))continue;Wc(y.latestValues)&&y.updateSnapshot();const g=Wt(),b=y.measurePageBox();Pe(g,b),ug(p,y.latestValues,y.snapshot?y.snapshot.layoutBox:void 0,g)}return Ca(this.latestValues)&&ug(p,this.latestValues),p}setTargetDelta(f){this.targetDelta=f,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(f){this.options={...this.options,...f,crossfade:f.crossfade!==void 0?f.crossfade:!0}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==se.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(f=!1){const p=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=p.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=p.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=p.isSharedProjectionDirty);const m=!!this.resumingFrom||this!==p;if(!(f||m&&this.isSharedProjectionDirty||this.isProjectionDirty||this.parent?.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;const{layout:g,layoutId:b}=this.options;if(!this.layout||!(g||b))return;this.resolvedRelativeTargetAt=se.timestamp;const T=this.getClosestProjectingParent();T&&this.linkedParentVersion!==T.layoutVersion&&!T.options.layoutRoot&&this.removeRelativeTarget(),!this.targetDelta&&!this.relativeTarget&&(T&&T.layout?this.createRelativeTarget(T,this.layout.layoutBox,T.layout.layoutBox):this.removeRelativeTarget()),!(!this.relativeTarget&&!this.targetDelta)&&(this.target||(this.target=Wt(),this.targetWithTransforms=Wt()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),aA(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Pe(this.target,this.layout.layoutBox),rv(this.target,this.targetDelta)):Pe(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget&&(this.attemptToResolveRelativeTarget=!1,T&&!!T.resumingFrom==!!this.resumingFrom&&!T.options.layoutScroll&&T.target&&this.animationProgress!==1?this.createRelativeTarget(T,this.target,T.target):this.relativeParent=this.relativeTarget=void 0))}getClosestProjectingParent(){if(!(!this.parent||Wc(this.parent.latestValues)||ov(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}createRelativeTarget(f,p,m){this.relativeParent=f,this.linkedParentVersion=f.layoutVersion,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Wt(),this.relativeTargetOrigin=Wt(),wo(this.relativeTargetOrigin,p,m),Pe(this.relativeTarget,this.relativeTargetOrigin)}removeRelativeTarget(){this.relativeParent=this.relativeTarget=void 0}calcProjection(){const f=this.getLead(),p=!!this.resumingFrom||this!==f;let m=!0;if((this.isProjectionDirty||this.parent?.isProjectionDirty)&&(m=!1),p&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(m=!1),this.resolvedRelativeTargetAt===se.timestamp&&(m=!1),m)return;const{layout:y,layoutId:g}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(y||g))return;Pe(this.layoutCorrected,this.layout.layoutBox);const b=this.treeScale.x,T=this.treeScale.y;p_(this.layoutCorrected,this.treeScale,this.path,p),f.layout&&!f.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(f.target=f.layout.layoutBox,f.targetWithTransforms=Wt());const{target:C}=f;if(!C){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(sg(this.prevProjectionDelta.x,this.projectionDelta.x),sg(this.prevProjectionDelta.y,this.projectionDelta.y)),jl(this.projectionDelta,this.layoutCorrected,C,this.latestValues),(this.treeScale.x!==b||this.treeScale.y!==T||!mg(this.projectionDelta.x,this.prevProjectionDelta.x)||!mg(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",C))}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(f=!0){if(this.options.visualElement?.scheduleRender(),f){const p=this.getStack();p&&p.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=Ei(),this.projectionDelta=Ei(),this.projectionDeltaWithTransform=Ei()}setAnimationOrigin(f,p=!1){const m=this.snapshot,y=m?m.latestValues:{},g={...this.latestValues},b=Ei();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!p;const T=Wt(),C=m?m.source:void 0,w=this.layout?this.layout.source:void 0,N=C!==w,M=this.getStack(),R=!M||M.members.length<=1,D=!!(N&&!R&&this.options.crossfade===!0&&!this.path.some(QA));this.animationProgress=0;let O;this.mixTargetDelta=q=>{const Y=q/1e3;vg(b.x,f.x,Y),vg(b.y,f.y,Y),this.setTargetDelta(b),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(wo(T,this.layout.layoutBox,this.relativeParent.layout.layoutBox),KA(this.relativeTarget,this.relativeTargetOrigin,T,Y),O&&OA(this.relativeTarget,O)&&(this.isProjectionDirty=!1),O||(O=Wt()),Pe(O,this.relativeTarget)),N&&(this.animationValues=g,_A(g,y,this.latestValues,Y,D,R)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=Y},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(f){this.notifyListeners("animationStart"),this.currentAnimation?.stop(),this.resumingFrom?.currentAnimation?.stop(),this.pendingAnimation&&(na(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Vt.update(()=>{Co.hasAnimatedSinceResize=!0,this.motionValue||(this.motionValue=Ai(0)),this.currentAnimation=bA(this.motionValue,[0,1e3],{...f,velocity:0,isSync:!0,onUpdate:p=>{this.mixTargetDelta(p),f.onUpdate&&f.onUpdate(p)},onStop:()=>{},onComplete:()=>{f.onComplete&&f.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const f=this.getStack();f&&f.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(wA),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const f=this.getLead();let{targetWithTransforms:p,target:m,layout:y,latestValues:g}=f;if(!(!p||!m||!y)){if(this!==f&&this.layout&&y&&Nv(this.options.animationType,this.layout.layoutBox,y.layoutBox)){m=this.target||Wt();const b=de(this.layout.layoutBox.x);m.x.min=f.target.x.min,m.x.max=m.x.min+b;const T=de(this.layout.layoutBox.y);m.y.min=f.target.y.min,m.y.max=m.y.min+T}Pe(p,m),xi(p,g),jl(this.projectionDeltaWithTransform,this.layoutCorrected,p,g)}}registerSharedNode(f,p){this.sharedNodes.has(f)||this.sharedNodes.set(f,new NA),this.sharedNodes.get(f).add(p);const y=p.options.initialPromotionConfig;p.promote({transition:y?y.transition:void 0,preserveFollowOpacity:y&&y.shouldPreserveFollowOpacity?y.shouldPreserveFollowOpacity(p):void 0})}isLead(){const f=this.getStack();return f?f.lead===this:!0}getLead(){const{layoutId:f}=this.options;return f?this.getStack()?.lead||this:this}getPrevLead(){const{layoutId:f}=this.options;return f?this.getStack()?.prevLead:void 0}getStack(){const{layoutId:f}=this.options;if(f)return this.root.sharedNodes.get(f)}promote({needsReset:f,transition:p,preserveFollowOpacity:m}={}){const y=this.getStack();y&&y.promote(this,m),f&&(this.projectionDelta=void 0,this.needsReset=!0),p&&this.setOptions({transition:p})}relegate(){const f=this.getStack();return f?f.relegate(this):!1}resetSkewAndRotation(){const{visualElement:f}=this.options;if(!f)return;let p=!1;const{latestValues:m}=f;if((m.z||m.rotate||m.rotateX||m.rotateY||m.rotateZ||m.skewX||m.skewY)&&(p=!0),!p)return;const y={};m.z&&Mc("z",f,y,this.animationValues);for(let g=0;g<Dc.length;g++)Mc(`rotate${Dc[g]}`,f,y,this.animationValues),Mc(`skew${Dc[g]}`,f,y,this.animationValues);f.render();for(const g in y)f.setStaticValue(g,y[g]),this.animationValues&&(this.animationValues[g]=y[g]);f.scheduleRender()}applyProjectionStyles(f,p){if(!this.instance||this.isSVG)return;if(!this.isVisible){f.visibility="hidden";return}const m=this.getTransformTemplate();if(this.needsReset){this.needsReset=!1,f.visibility="",f.opacity="",f.pointerEvents=Ao(p?.pointerEvents)||"",f.transform=m?m(this.latestValues,""):"none";return}const y=this.getLead();if(!this.projectionDelta||!this.layout||!y.target){this.options.layoutId&&(f.opacity=this.latestValues.opacity!==void 0?this.latestValues.opacity:1,f.pointerEvents=Ao(p?.pointerEvents)||""),this.hasProjected&&!Ca(this.latestValues)&&(f.transform=m?m({},""):"none",this.hasProjected=!1);return}f.visibility="";const g=y.animationValues||y.latestValues;this.applyTransformsToTarget();let b=zA(this.projectionDeltaWithTransform,this.treeScale,g);m&&(b=m(g,b)),f.transform=b;const{x:T,y:C}=this.projectionDelta;f.transformOrigin=`${T.origin*100}% ${C.origin*100}% 0`,y.animationValues?f.opacity=y===this?g.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:g.opacityExit:f.opacity=y===this?g.opacity!==void 0?g.opacity:"":g.opacityExit!==void 0?g.opacityExit:0;for(const w in $c){if(g[w]===void 0)continue;const{correct:N,applyTo:M,isCSSVariable:R}=$c[w],D=b==="none"?g[w]:N(g[w],y);if(M){const O=M.length;for(let q=0;q<O;q++)f[M[q]]=D}else R?this.options.visualElement.renderState.vars[w]=D:f[w]=D}this.options.layoutId&&(f.pointerEvents=y===this?Ao(p?.pointerEvents)||"":"none")}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(f=>f.currentAnimation?.stop()),this.root.nodes.forEach(pg),this.root.sharedNodes.clear()}}}function LA(n){n.updateLayout()}function BA(n){const i=n.resumeFrom?.snapshot||n.snapshot;if(n.isLead()&&n.layout&&i&&n.hasListeners("didUpdate")){const{layoutBox:s,measuredBox:o}=n.layout,{animationType:c}=n.options,d=i.source!==n.layout.source;c==="size"?Ye(g=>{const b=d?i.measuredBox[g]:i.layoutBox[g],T=de(b);b.min=s[g].min,b.max=b.min+T}):Nv(c,i.layoutBox,s)&&Ye(g=>{const b=d?i.measuredBox[g]:i.layoutBox[g],T=de(s[g]);b.max=b.min+T,n.relativeTarget&&!n.currentAnimation&&(n.isProjectionDirty=!0,n.relativeTarget[g].max=n.relativeTarget[g].min+T)});const f=Ei();jl(f,s,i.layoutBox);const p=Ei();d?jl(p,n.applyTransform(o,!0),i.measuredBox):jl(p,s,i.layoutBox);const m=!Rv(f);let y=!1;if(!n.resumeFrom){const g=n.getClosestProjectingParent();if(g&&!g.resumeFrom){const{snapshot:b,layout:T}=g;if(b&&T){const C=Wt();wo(C,i.layoutBox,b.layoutBox);const w=Wt();wo(w,s,T.layoutBox),Dv(C,w)||(y=!0),g.options.layoutRoot&&(n.relativeTarget=w,n.relativeTargetOrigin=C,n.relativeParent=g)}}}n.notifyListeners("didUpdate",{layout:s,snapshot:i,delta:p,layoutDelta:f,hasLayoutChanged:m,hasRelativeLayoutChanged:y})}else if(n.isLead()){const{onExitComplete:s}=n.options;s&&s()}n.options.transition=void 0}function VA(n){n.parent&&(n.isProjecting()||(n.isProjectionDirty=n.parent.isProjectionDirty),n.isSharedProjectionDirty||(n.isSharedProjectionDirty=!!(n.isProjectionDirty||n.parent.isProjectionDirty||n.parent.isSharedProjectionDirty)),n.isTransformDirty||(n.isTransformDirty=n.parent.isTransformDirty))}function UA(n){n.isProjectionDirty=n.isSharedProjectionDirty=n.isTransformDirty=!1}function HA(n){n.clearSnapshot()}function pg(n){n.clearMeasurements()}function yg(n){n.isLayoutDirty=!1}function kA(n){const{visualElement:i}=n.options;i&&i.getProps().onBeforeLayoutMeasure&&i.notify("BeforeLayoutMeasure"),n.resetTransform()}function gg(n){n.finishAnimation(),n.targetDelta=n.relativeTarget=n.target=void 0,n.isProjectionDirty=!0}function YA(n){n.resolveTargetDelta()}function qA(n){n.calcProjection()}function GA(n){n.resetSkewAndRotation()}function XA(n){n.removeLeadSnapshot()}function vg(n,i,s){n.translate=Ut(i.translate,0,s),n.scale=Ut(i.scale,1,s),n.origin=i.origin,n.originPoint=i.originPoint}function bg(n,i,s,o){n.min=Ut(i.min,s.min,o),n.max=Ut(i.max,s.max,o)}function KA(n,i,s,o){bg(n.x,i.x,s.x,o),bg(n.y,i.y,s.y,o)}function QA(n){return n.animationValues&&n.animationValues.opacityExit!==void 0}const ZA={duration:.45,ease:[.4,0,.1,1]},Tg=n=>typeof navigator<"u"&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(n),Sg=Tg("applewebkit/")&&!Tg("chrome/")?Math.round:Ge;function xg(n){n.min=Sg(n.min),n.max=Sg(n.max)}function PA(n){xg(n.x),xg(n.y)}function Nv(n,i,s){return n==="position"||n==="preserve-aspect"&&!nA(hg(i),hg(s),.2)}function JA(n){return n!==n.root&&n.scroll?.wasRoot}const FA=Ov({attachResizeListener:(n,i)=>Yl(n,"resize",i),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),Oc={current:void 0},zv=Ov({measureScroll:n=>({x:n.scrollLeft,y:n.scrollTop}),defaultParent:()=>{if(!Oc.current){const n=new FA({});n.mount(window),n.setOptions({layoutScroll:!0}),Oc.current=n}return Oc.current},resetTransform:(n,i)=>{n.style.transform=i!==void 0?i:"none"},checkIsScrollRoot:n=>window.getComputedStyle(n).position==="fixed"}),$A={pan:{Feature:gA},drag:{Feature:yA,ProjectionNode:zv,MeasureLayout:_v}};function Eg(n,i,s){const{props:o}=n;n.animationState&&o.whileHover&&n.animationState.setActive("whileHover",s==="Start");const c="onHover"+s,d=o[c];d&&Vt.postRender(()=>d(i,Fl(i)))}class WA extends ia{mount(){const{current:i}=this.node;i&&(this.unmount=S2(i,(s,o)=>(Eg(this.node,o,"Start"),c=>Eg(this.node,c,"End"))))}unmount(){}}class IA extends ia{constructor(){super(...arguments),this.isActive=!1}onFocus(){let i=!1;try{i=this.node.current.matches(":focus-visible")}catch{i=!0}!i||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Zl(Yl(this.node.current,"focus",()=>this.onFocus()),Yl(this.node.current,"blur",()=>this.onBlur()))}unmount(){}}function _g(n,i,s){const{props:o}=n;if(n.current instanceof HTMLButtonElement&&n.current.disabled)return;n.animationState&&o.whileTap&&n.animationState.setActive("whileTap",s==="Start");const c="onTap"+(s==="End"?"":s),d=o[c];d&&Vt.postRender(()=>d(i,Fl(i)))}class t3 extends ia{mount(){const{current:i}=this.node;i&&(this.unmount=A2(i,(s,o)=>(_g(this.node,o,"Start"),(c,{success:d})=>_g(this.node,c,d?"End":"Cancel")),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}}const sf=new WeakMap,Nc=new WeakMap,e3=n=>{const i=sf.get(n.target);i&&i(n)},n3=n=>{n.forEach(e3)};function a3({root:n,...i}){const s=n||document;Nc.has(s)||Nc.set(s,{});const o=Nc.get(s),c=JSON.stringify(i);return o[c]||(o[c]=new IntersectionObserver(n3,{root:n,...i})),o[c]}function i3(n,i,s){const o=a3(i);return sf.set(n,s),o.observe(n),()=>{sf.delete(n),o.unobserve(n)}}const l3={some:0,all:1};class s3 extends ia{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:i={}}=this.node.getProps(),{root:s,margin:o,amount:c="some",once:d}=i,f={root:s?s.current:void 0,rootMargin:o,threshold:typeof c=="number"?c:l3[c]},p=m=>{const{isIntersecting:y}=m;if(this.isInView===y||(this.isInView=y,d&&!y&&this.hasEnteredView))return;y&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",y);const{onViewportEnter:g,onViewportLeave:b}=this.node.getProps(),T=y?g:b;T&&T(m)};return i3(this.node.current,f,p)}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>"u")return;const{props:i,prevProps:s}=this.node;["amount","margin","root"].some(o3(i,s))&&this.startObserver()}unmount(){}}function o3({viewport:n={}},{viewport:i={}}={}){return s=>n[s]!==i[s]}const r3={inView:{Feature:s3},tap:{Feature:t3},focus:{Feature:IA},hover:{Feature:WA}},u3={layout:{ProjectionNode:zv,MeasureLayout:_v}},c3={...F_,...r3,...$A,...u3},_n=d_(c3,A_),nn={Planned:"PLANNED",Reading:"READING",Done:"DONE"};function wv({external_id:n,title:i,description:s,authors:o,cover_i:c,status:d}){const[f,p]=S.useState(""),[m,y]=S.useState(!1),[g,b]=S.useState(!1),[T,C]=S.useState(!1),w=S.useRef(null),N=uf(),{addBook:M,isBookInList:R,removeBook:D,updateBookStatus:O,getBookInList:q}=mf(),Y=R(n);Y&&!d&&(d=q(n).status);const Q=gt=>{if(!w.current)return;y(!0);const Lt=w.current.getBoundingClientRect(),H=gt.clientX-Lt.left,P=gt.clientY-Lt.top,F=Lt.width/2,ct=Lt.height/2,mt=(P-ct)/ct*-10,A=(H-F)/F*10;p(`perspective(1000px) rotateX(${mt}deg) rotateY(${A}deg) translateY(-8px) scale(1.02)`)},U=()=>{y(!1),p("")},Z=async gt=>{if(gt.stopPropagation(),!g)try{b(!0),Y?await D(n)?ut.info(`${i} removed from reading list`):ut.error("Failed to remove book from reading list"):await M({external_id:n,title:i,description:s,authors:o,cover_i:c,status:nn.Planned})?ut.success(`${i} added to reading list!`):ut.error("Failed to add book to reading list")}catch(jt){console.error("Error updating reading list:",jt),ut.error(`Failed to ${Y?"remove":"add"} book ${Y?"from":"to"} reading list`)}finally{b(!1)}},tt=async gt=>{try{if(await O(n,gt)){const Lt=gt==="PLANNED"?"Planned":gt==="READING"?"Reading":"Done";ut.success(`Status updated to ${Lt}`),C(!1)}else ut.error("Failed to update status")}catch(jt){console.error("Error updating status:",jt),ut.error("Failed to update status")}},lt=gt=>{gt.stopPropagation(),C(!T)},St=c?`http://localhost:8000/api/covers/${c}-L.jpg`:"/placeholder-book.png",Mt=()=>{N(`/book/${n}`)};return Nt.useEffect(()=>{const gt=jt=>{w.current&&!w.current.contains(jt.target)&&C(!1)};return T&&document.addEventListener("mousedown",gt),()=>{document.removeEventListener("mousedown",gt)}},[T]),E.jsxs("div",{className:"book-card",ref:w,onMouseMove:Q,onMouseLeave:U,onClick:Mt,style:{transform:f,transition:m?"box-shadow 0.3s ease":"transform 0.4s ease, box-shadow 0.3s ease",cursor:"pointer"},children:[Y&&E.jsxs("div",{className:"book-card-status-ribbon",children:[d==="PLANNED"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned"]}),d==="READING"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-book"})," Reading"]}),d==="DONE"&&E.jsxs(E.Fragment,{children:[E.jsx("i",{className:"bi bi-check-circle"})," Done"]})]}),E.jsx("button",{className:"book-card-star-btn",onClick:Z,disabled:g,children:E.jsx("i",{className:Y?"bi bi-star-fill":"bi bi-star"},Y?"filled":"empty")}),E.jsx("div",{className:"book-card-image",children:E.jsx("img",{src:St,alt:`${i} cover`})}),E.jsxs("div",{className:"book-card-content",children:[E.jsx("h3",{className:"book-card-title",children:i}),o&&o.length>0&&E.jsxs("p",{className:"book-card-authors",children:["by ",o.slice(0,3).join(", ")]})]}),Y&&E.jsxs("div",{className:"book-card-menu-container",children:[E.jsx("button",{className:"book-card-menu-btn",onClick:lt,children:E.jsx("i",{className:"bi bi-three-dots"})}),E.jsx(ko,{children:T&&E.jsxs(_n.div,{className:"status-menu",initial:{opacity:0,scale:.8,y:-10},animate:{opacity:1,scale:1,y:0},exit:{opacity:0,scale:.8,y:-10},transition:{duration:.2,ease:"easeOut"},children:[E.jsxs("button",{className:`status-option ${d===nn.Planned?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Planned)},children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned ",d===nn.Planned&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${d===nn.Reading?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Reading)},children:[E.jsx("i",{className:"bi bi-book"})," Reading ",d===nn.Reading&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${d===nn.Done?"active":""}`,onClick:gt=>{gt.stopPropagation(),tt(nn.Done)},children:[E.jsx("i",{className:"bi bi-check-circle"})," Done ",d===nn.Done&&E.jsx("i",{className:"bi bi-check-lg"})]})]})})]})]})}function Ri({style:n}){const i={...n};return E.jsx("div",{className:"loading-more",style:i,children:E.jsx("div",{className:"spinner"})})}function Ag({title:n,url:i,width:s=280,height:o,limit:c=12}){const[d,f]=S.useState([]),[p,m]=S.useState(!0),[y,g]=S.useState(!1),[b,T]=S.useState(null),[C,w]=S.useState(1),[N,M]=S.useState(!0),R=S.useRef(null),D=q=>{const Y=new URL(i,window.location.origin);return Y.searchParams.set("limit",c.toString()),Y.searchParams.set("page",q.toString()),Y.toString()},O=async(q,Y=!1)=>{try{Y?g(!0):m(!0);const Q=await fetch(D(q));if(!Q.ok)throw new Error("Failed to fetch books");const U=await Q.json(),Z=U.books||U;Z.length<c&&M(!1),f(Y?tt=>[...tt,...Z]:Z)}catch(Q){T(Q instanceof Error?Q.message:"An error occurred")}finally{m(!1),g(!1)}};return S.useEffect(()=>{O(1,!1)},[i]),S.useEffect(()=>{const q=R.current;if(!q)return;const Y=()=>{const{scrollLeft:Q,scrollWidth:U,clientWidth:Z}=q;if(Q+Z>=U-100&&!y&&!p&&N){const lt=C+1;w(lt),O(lt,!0)}};return q.addEventListener("scroll",Y),()=>q.removeEventListener("scroll",Y)},[y,p,N,C]),p?E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsx(Ri,{style:{width:`${s}px`,minWidth:`${s}px`}})]}):b?E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsxs("p",{className:"error-text",children:["Error: ",b]})]}):E.jsxs("section",{className:"horizontal-section",children:[E.jsx("h2",{className:"section-title",children:n}),E.jsx("div",{className:"horizontal-scroll",ref:R,children:E.jsxs("div",{className:"books-container",children:[d.map(q=>E.jsx("div",{className:"book-item",style:{flex:`0 0 ${s}px`,minWidth:`${s}px`,maxWidth:`${s}px`,height:o?`${o}px`:"auto"},children:E.jsx(wv,{...q})},q.external_id)),y&&E.jsx(Ri,{style:{width:`${s}px`,minWidth:`${s}px`}})]})})]})}function f3(){return E.jsxs("div",{className:"popular-page",children:[E.jsx(Ag,{title:"Popular Books This Week",url:"http://localhost:8000/api/popular/books?duration=weekly",width:280,height:320}),E.jsx(Ag,{title:"The Best of Sherlock Holmes🕵️",url:"http://localhost:8000/api/search/books?q=sherlock",width:280,height:480})]})}function d3({value:n,onChange:i,onSearch:s,placeholder:o="There is danger for him who taketh the tiger cub, and danger also for whoso snatches a delusion from a woman."}){const c=f=>{f.key==="Enter"&&s&&s(n)},d=()=>{s&&s(n)};return E.jsxs("div",{className:"search-box-wrapper",children:[E.jsx("i",{className:"bi bi-search search-icon"}),E.jsx("input",{type:"text",className:"search-box",placeholder:o,value:n,onChange:f=>i(f.target.value),onKeyDown:c}),E.jsx("button",{className:"search-button",onClick:d,"aria-label":"Search",children:E.jsx("i",{className:"bi bi-arrow-right"})})]})}function jv({results:n,onScrollEnd:i,isLoadingMore:s=!1,hasMore:o=!0,cardMinWidth:c="250px",cardMaxWidth:d="1fr",cardHeight:f="auto"}){const p=S.useRef(null);return S.useEffect(()=>{const m=new IntersectionObserver(g=>{g[0].isIntersecting&&!s&&o&&i&&i()},{threshold:.1}),y=p.current;return y&&m.observe(y),()=>{y&&m.unobserve(y)}},[i,s,o]),n.length===0&&s?E.jsx(_n.div,{className:"results-placeholder",initial:{opacity:0,y:20},animate:{opacity:1,y:0},transition:{duration:.4,delay:.2},children:E.jsx(Ri,{})}):n.length===0?E.jsx(_n.div,{className:"results-placeholder",initial:{opacity:0,y:20},animate:{opacity:1,y:0},transition:{duration:.4,delay:.2},children:E.jsx("p",{children:"No results found."})}):E.jsxs("div",{children:[E.jsx("div",{className:"results-grid",style:{gridTemplateColumns:`repeat(auto-fill, minmax(${c}, ${d}))`,...f!=="auto"&&{gridAutoRows:f}},children:E.jsx(ko,{mode:"popLayout",children:n.map((m,y)=>E.jsx(_n.div,{initial:{opacity:0,x:-50},animate:{opacity:1,x:0},exit:{opacity:0,scale:1.8,transition:{duration:.3}},transition:{duration:.5,delay:y*.1,ease:[.4,0,.2,1]},layout:!0,children:E.jsx(wv,{...m})},m.external_id))})}),E.jsx("div",{ref:p,className:"scroll-trigger"}),s&&o&&E.jsx("div",{className:"loading-more-container",children:E.jsx(Ri,{})})]})}function h3(){const[n,i]=S.useState(""),[s,o]=S.useState(!1),[c,d]=S.useState([]),[f,p]=S.useState(!1),[m,y]=S.useState(1),[g,b]=S.useState(!0),T=40,C=async(M,R=!1)=>{if(f||!R&&!g)return;p(!0);const D=R?1:m;R&&(o(!0),d([]));try{const O=await fetch(`http://localhost:8000/api/search/books?q=${encodeURIComponent(M)}&limit=${T}&page=${D}`);if(!O.ok)throw new Error(R?"Failed to fetch search results":"Failed to fetch more results");const q=await O.json(),Y=q.books?.map(U=>({external_id:U.external_id,title:U.title,authors:U.authors||[],description:U.first_sentence?.[0]||"",cover_i:U.cover_i?.toString()}))||[],Q=q.total||0;console.log("total found results:",Q),d(U=>R?Y:[...U,...Y]),b(Q>D*T),y(D+1)}catch(O){console.error("Search error:",O),ut.error(R?"Failed to search books. Please try again.":"Failed to load more results. Please try again."),R&&d([])}finally{p(!1)}},w=async M=>{M.trim()&&await C(M,!0)},N=async()=>{await C(n,!1)};return E.jsxs(_n.div,{className:`search-page ${s?"search-active":""}`,initial:{opacity:1},animate:{opacity:1},children:[E.jsxs(_n.div,{className:"search-container",layout:!0,transition:{layout:{duration:.6,ease:[.4,0,.2,1]}},children:[E.jsx(_n.h1,{className:"search-title",layout:!0,transition:{layout:{duration:.6,ease:[.4,0,.2,1]}},children:"Search Books"}),E.jsx(d3,{value:n,onChange:i,onSearch:w})]}),E.jsx(ko,{children:s&&E.jsx(_n.div,{className:"search-results-container",initial:{opacity:0},animate:{opacity:1},exit:{opacity:0},transition:{duration:.4},children:E.jsx("div",{className:"search-results",children:E.jsx(jv,{results:c,onScrollEnd:N,isLoadingMore:f,hasMore:g})})})})]})}function m3(){const{books:n,isLoading:i,error:s}=mf();return E.jsxs("div",{children:[E.jsx("h1",{children:"My Reading List"}),s&&E.jsx("p",{style:{color:"red"},children:s}),E.jsx(jv,{results:n,isLoadingMore:i,hasMore:!1})]})}function p3(){const{id:n}=IT(),i=uf();n||i("/");const[s,o]=S.useState(null),[c,d]=S.useState(!0),[f,p]=S.useState(null),[m,y]=S.useState(!1),{addBook:g,isBookInList:b,removeBook:T,getBookInList:C,updateBookStatus:w}=mf(),N=b(n),M=N?C(n):void 0;M&&!s&&o(M),S.useEffect(()=>{(async()=>{try{d(!0);const U=await fetch(`http://localhost:8000/api/books/${n}`);if(!U.ok)throw new Error("Book not found");const Z=await U.json();o(Z),p(null)}catch(U){p(U instanceof Error?U.message:"Failed to load book"),ut.error("Failed to load book details")}finally{d(!1)}})()},[n]),S.useEffect(()=>{const Q=U=>{U.target.closest(".status-dropdown-container")||y(!1)};return m&&document.addEventListener("mousedown",Q),()=>{document.removeEventListener("mousedown",Q)}},[m]);const R=()=>{s&&(g({external_id:s.external_id,title:s.title,authors:s.authors,cover_i:s.cover_i,description:s.description,status:"PLANNED"}),ut.success(`${s.title} added to reading list!`))},D=()=>{s&&(T(s.external_id),ut.info(`${s.title} removed from reading list`))},O=async Q=>{if(!s)return;if(await w(s.external_id,Q)){const Z=Q==="PLANNED"?"Planned":Q==="READING"?"Reading":"Done";ut.success(`Status updated to ${Z}`),y(!1)}else ut.error("Failed to update status")},q=()=>{y(!m)},Y=Q=>Q?`http://localhost:8000/api/covers/${Q}-L.jpg`:"/placeholder-book.png";return c&&!N?E.jsx("div",{className:"book-page loading",children:E.jsx(Ri,{})}):f||!s?E.jsx("div",{className:"book-page error",children:E.jsxs("div",{className:"error-container",children:[E.jsx("h2",{children:"📚 Book Not Found"}),E.jsx("p",{children:f||"The book you are looking for does not exist."}),E.jsx("button",{onClick:()=>i("/"),className:"btn-primary",children:"Go Home"})]})}):E.jsxs("div",{className:"book-page",children:[E.jsxs("button",{onClick:()=>i(-1),className:"back-button",children:[E.jsx("i",{className:"bi bi-arrow-left"})," Back"]}),E.jsxs("div",{className:"book-details",children:[E.jsx("div",{className:"book-cover-section",children:E.jsx("img",{src:Y(s.cover_i),alt:s.title,className:"book-cover-large",onError:Q=>{Q.currentTarget.src="/placeholder-book.png"}})}),E.jsxs("div",{className:"book-info-section",children:[E.jsx("h1",{className:"book-title",children:s.title}),s.authors&&s.authors.length>0&&E.jsxs("div",{className:"book-authors",children:[E.jsx("i",{className:"bi bi-person"}),E.jsxs("span",{children:["by ",s.authors.join(", ")]})]}),!c&&s.first_publish_year&&E.jsxs("div",{className:"book-year",children:[E.jsx("i",{className:"bi bi-calendar"}),E.jsxs("span",{children:["First published in ",s.first_publish_year]})]}),E.jsx("div",{className:"book-actions",children:N?E.jsxs(E.Fragment,{children:[E.jsxs("button",{onClick:D,className:"btn-secondary",children:[E.jsx("i",{className:"bi bi-dash-circle"})," Remove from Reading List"]}),E.jsxs("div",{className:"status-dropdown-container",children:[E.jsxs("button",{onClick:q,className:"btn-status",children:[E.jsx("i",{className:`bi ${m?"bi-chevron-up":"bi-chevron-down"}`}),M?.status==="PLANNED"?"Planned":M?.status==="READING"?"Reading":M?.status==="DONE"?"Done":"Update Status"]}),E.jsx(ko,{children:m&&E.jsxs(_n.div,{className:"status-dropdown",initial:{opacity:0,scale:.8,y:-10},animate:{opacity:1,scale:1,y:0},exit:{opacity:0,scale:.8,y:-10},transition:{duration:.2,ease:"easeOut"},children:[E.jsxs("button",{className:`status-option ${M?.status==="PLANNED"?"active":""}`,onClick:()=>O("PLANNED"),children:[E.jsx("i",{className:"bi bi-clipboard"})," Planned ",M?.status==="PLANNED"&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${M?.status==="READING"?"active":""}`,onClick:()=>O("READING"),children:[E.jsx("i",{className:"bi bi-book"})," Reading ",M?.status==="READING"&&E.jsx("i",{className:"bi bi-check-lg"})]}),E.jsxs("button",{className:`status-option ${M?.status==="DONE"?"active":""}`,onClick:()=>O("DONE"),children:[E.jsx("i",{className:"bi bi-check-circle"})," Done ",M?.status==="DONE"&&E.jsx("i",{className:"bi bi-check-lg"})]})]})})]})]}):E.jsxs("button",{onClick:R,className:"btn-primary",children:[E.jsx("i",{className:"bi bi-plus-circle"})," Add to Reading List"]})}),s.description&&E.jsxs("div",{className:"book-description",children:[E.jsx("h2",{children:"Description"}),E.jsx("p",{children:s.description})]}),E.jsxs("div",{className:"book-metadata",children:[E.jsx("h2",{children:"Book Details"}),E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Book ID:"}),E.jsx("span",{className:"metadata-value",children:s.external_id})]}),c?E.jsx(Ri,{}):E.jsxs(E.Fragment,{children:[s.number_of_pages&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Pages:"}),E.jsx("span",{className:"metadata-value",children:s.number_of_pages})]}),s.publishers&&s.publishers.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"Publisher(s):"}),E.jsx("span",{className:"metadata-value",children:s.publishers.join(", ")})]}),s.isbn_13&&s.isbn_13.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"ISBN-13:"}),E.jsx("span",{className:"metadata-value",children:s.isbn_13[0]})]}),s.isbn_10&&s.isbn_10.length>0&&E.jsxs("div",{className:"metadata-item",children:[E.jsx("span",{className:"metadata-label",children:"ISBN-10:"}),E.jsx("span",{className:"metadata-value",children:s.isbn_10[0]})]})]})]})]})]})]})}function y3(){return E.jsx(HS,{children:E.jsxs(zx,{children:[E.jsx(pS,{children:E.jsxs(Aa,{path:"/",element:E.jsx(Ox,{}),children:[E.jsx(Aa,{index:!0,element:E.jsx(Nx,{})}),E.jsx(Aa,{path:"popular",element:E.jsx(f3,{})}),E.jsx(Aa,{path:"search",element:E.jsx(h3,{})}),E.jsx(Aa,{path:"reading-list",element:E.jsx(m3,{})}),E.jsx(Aa,{path:"book/:id",element:E.jsx(p3,{})})]})}),E.jsx(Mx,{position:"top-right",autoClose:3e3,hideProgressBar:!1,newestOnTop:!1,closeOnClick:!0,rtl:!1,pauseOnFocusLoss:!0,draggable:!0,pauseOnHover:!0})]})})}mT.createRoot(document.getElementById("root")).render(E.jsx(S.StrictMode,{children:E.jsx(y3,{})}));
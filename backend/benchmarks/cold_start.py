@@ -0,0 +1,71 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import requests
+
+#Measures cold-start time: importing the app, and process spawn -> first healthy response
+#for the dev server (uvicorn) and the production server (gunicorn, migrations + preload + workers)
+#Usage: python benchmarks/cold_start.py --runs 5
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+
+def measure_import(runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import main"], cwd=APP_DIR, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def measure_server(command: list, port: int, runs: int, env: dict, timeout: float = 60) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"Server exited with code {process.returncode}: {' '.join(command)}")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"Server not healthy after {timeout}s: {' '.join(command)}")
+                try:
+                    if requests.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                        break
+                except requests.RequestException:
+                    time.sleep(0.02)
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure BookOn cold-start time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--workers", type=int, default=4, help="Workers for the production server")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+
+    print(f"import main:                  {measure_import(args.runs):8.0f} ms (median of {args.runs})")
+
+    dev = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.port), "--log-level", "warning"]
+    print(f"uvicorn (1 worker):           {measure_server(dev, args.port, args.runs, env):8.0f} ms to healthy")
+
+    prod = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"]
+    prod_env = dict(env, BIND=f"127.0.0.1:{args.port}", WEB_CONCURRENCY=str(args.workers))
+    print(f"gunicorn ({args.workers} workers, preload): {measure_server(prod, args.port, args.runs, prod_env):8.0f} ms to healthy")
+
+
+if __name__ == "__main__":
+    main()
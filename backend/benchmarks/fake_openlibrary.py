@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+#A local stand-in for openlibrary.org and covers.openlibrary.org
+#Replays the recorded trending fixture (app/mockings/book_monthly_mock_info.json) for every endpoint the app uses,
+#with injectable latency and error rate, and counts the calls it receives (GET /__stats)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "..", "app", "mockings", "book_monthly_mock_info.json")
+
+#Not a real picture, just enough bytes to look like one
+FAKE_JPEG = b"\xff\xd8\xff\xe0" + b"\x00" * 4096 + b"\xff\xd9"
+
+
+class FakeOpenLibraryData:
+    def __init__(self, fixture_path: str = FIXTURE_PATH):
+        with open(fixture_path, "r", encoding="utf-8") as f:
+            self.works: List[Dict[str, Any]] = json.load(f)["works"]
+
+        self.works_by_id: Dict[str, Dict[str, Any]] = {}
+        self.authors_by_id: Dict[str, str] = {}
+        for work in self.works:
+            self.works_by_id[work["key"].split("/")[-1]] = work
+            for author_key, author_name in zip(work.get("author_key", []), work.get("author_name", [])):
+                self.authors_by_id[author_key] = author_name
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        terms = query.lower().split()
+        matches = []
+        for work in self.works:
+            text = " ".join([work.get("title", "")] + work.get("author_name", [])).lower()
+            if all(term in text for term in terms):
+                matches.append(work)
+        return matches
+
+    def work_json(self, work_id: str) -> Optional[Dict[str, Any]]:
+        work = self.works_by_id.get(work_id)
+        if work is None:
+            return None
+        return {
+            "key": work["key"],
+            "title": work.get("title"),
+            "description": f"Recorded description of {work.get('title')}.",
+            "first_publish_date": str(work.get("first_publish_year", "")),
+            "covers": [work["cover_i"]] if work.get("cover_i") else [],
+            "authors": [{"author": {"key": f"/authors/{key}"}} for key in work.get("author_key", [])]
+        }
+
+    def editions_json(self, work_id: str) -> Optional[Dict[str, Any]]:
+        work = self.works_by_id.get(work_id)
+        if work is None:
+            return None
+        entries = []
+        for doc in work.get("editions", {}).get("docs", []):
+            entries.append({
+                "key": doc.get("key"),
+                "title": doc.get("title"),
+                "publish_date": str(work.get("first_publish_year", "")),
+                "covers": [doc["cover_i"]] if doc.get("cover_i") else [],
+                "number_of_pages": 320,
+                "publishers": ["Recorded Publisher"],
+                "isbn_13": ["9780000000000"],
+                "isbn_10": ["0000000000"]
+            })
+        return {"entries": entries, "size": len(entries)}
+
+
+class FakeOpenLibraryServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, fixture_path: str = FIXTURE_PATH):
+        self.data = FakeOpenLibraryData(fixture_path)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.calls: Counter = Counter()
+        self._calls_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOpenLibraryServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._calls_lock:
+            return dict(self.calls)
+
+    def reset_stats(self):
+        with self._calls_lock:
+            self.calls.clear()
+
+    def _count(self, endpoint: str):
+        with self._calls_lock:
+            self.calls[endpoint] += 1
+
+    def _simulate_upstream(self) -> bool:
+        #Returns False when this call should fail
+        delay = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return random.random() >= self.error_rate
+
+    def handle(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, str, bytes]:
+        def param(name: str, default: str) -> str:
+            return query.get(name, [default])[0]
+
+        def as_json(status: int, body: Any) -> Tuple[int, str, bytes]:
+            return status, "application/json", json.dumps(body).encode("utf-8")
+
+        if path == "/__stats":
+            return as_json(200, self.stats())
+        if path == "/__reset":
+            self.reset_stats()
+            return as_json(200, {})
+
+        routes = [
+            ("search", r"^/search\.json$"),
+            ("trending", r"^/trending/(\w+)\.json$"),
+            ("editions", r"^/works/(\w+)/editions\.json$"),
+            ("work", r"^/works/(\w+)\.json$"),
+            ("author", r"^/authors/(\w+)\.json$"),
+            ("cover", r"^/b/id/(\d+)-([SML])\.jpg$"),
+        ]
+        for endpoint, pattern in routes:
+            match = re.match(pattern, path)
+            if match:
+                break
+        else:
+            return as_json(404, {"error": "notfound"})
+
+        self._count(endpoint)
+        if not self._simulate_upstream():
+            return as_json(503, {"error": "injected failure"})
+
+        limit = int(param("limit", "20"))
+        page = int(param("page", "1"))
+        start = (page - 1) * limit
+
+        if endpoint == "search":
+            matches = self.data.search(param("q", ""))
+            return as_json(200, {"numFound": len(matches), "docs": matches[start:start + limit]})
+        if endpoint == "trending":
+            return as_json(200, {"query": match.group(1), "works": self.data.works[start:start + limit]})
+        if endpoint == "editions":
+            body = self.data.editions_json(match.group(1))
+            return as_json(200, body) if body else as_json(404, {"error": "notfound"})
+        if endpoint == "work":
+            body = self.data.work_json(match.group(1))
+            return as_json(200, body) if body else as_json(404, {"error": "notfound"})
+        if endpoint == "author":
+            name = self.data.authors_by_id.get(match.group(1))
+            return as_json(200, {"name": name}) if name else as_json(404, {"error": "notfound"})
+        return 200, "image/jpeg", FAKE_JPEG
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            #Headers and body are written separately, without this keep-alive calls stall on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                status, content_type, body = fake.handle(parsed.path, parse_qs(parsed.query))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Open Library stand-in replaying recorded fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added latency per upstream call")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random +/- variation of the latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of calls answered with 503")
+    args = parser.parse_args()
+
+    server = FakeOpenLibraryServer(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f"Fake Open Library listening on {server.url} (point OPENLIBRARY_URL and OPENLIBRARY_COVERS_URL at it)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -43,12 +43,15 @@ fi
 
 echo -e "${GREEN}Running tests...${NC}"
 
-# Run tests
+# Run tests (unit tests first, then the API tests against the running server)
 cd testing
-python test_read_list.py
+FAILED=0
+for test_file in test_*.py; do
+    python "$test_file" || FAILED=1
+done
 
 # Check test results
-if [ $? -eq 0 ]; then
+if [ $FAILED -eq 0 ]; then
     echo -e "${GREEN}All tests passed!${NC}"
 else
     echo -e "${RED}Some tests failed!${NC}"
@@ -0,0 +1,297 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+#Unit tests for the in-memory caches, no server or database needed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from services import cache_service
+from services.cache_service import cached_with_ttl, cached_with_version, set_cache_version, bump_cache_generation, clear_cache
+
+
+#Stands in for datetime inside cache_service, so entries can be expired without sleeping
+class FakeClock:
+    current = datetime(2024, 1, 1)
+
+    @classmethod
+    def now(cls):
+        return cls.current
+
+    @classmethod
+    def advance(cls, seconds: int):
+        cls.current += timedelta(seconds=seconds)
+
+
+def _with_fake_clock(test):
+    def wrapper():
+        clear_cache()
+        real_datetime = cache_service.datetime
+        cache_service.datetime = FakeClock
+        try:
+            test()
+        finally:
+            cache_service.datetime = real_datetime
+            clear_cache()
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@_with_fake_clock
+def test_found_result_is_cached_for_ttl():
+    calls = []
+
+    @cached_with_ttl(ttl_seconds=60, negative_ttl_seconds=5)
+    def lookup(key):
+        calls.append(key)
+        return {"key": key}
+
+    assert lookup("a") == {"key": "a"}
+    FakeClock.advance(59)
+    assert lookup("a") == {"key": "a"}
+    assert len(calls) == 1
+
+    FakeClock.advance(2)
+    lookup("a")
+    assert len(calls) == 2
+    print("✓ test_found_result_is_cached_for_ttl passed")
+
+
+@_with_fake_clock
+def test_not_found_result_uses_negative_ttl():
+    calls = []
+
+    @cached_with_ttl(ttl_seconds=60, negative_ttl_seconds=5)
+    def lookup(key):
+        calls.append(key)
+        return None
+
+    assert lookup("missing") is None
+    FakeClock.advance(4)
+    assert lookup("missing") is None
+    assert len(calls) == 1
+
+    FakeClock.advance(2)
+    lookup("missing")
+    assert len(calls) == 2
+    print("✓ test_not_found_result_uses_negative_ttl passed")
+
+
+@_with_fake_clock
+def test_error_is_cached_for_error_ttl():
+    calls = []
+
+    class LookupFailed(Exception):
+        pass
+
+    @cached_with_ttl(ttl_seconds=60, negative_ttl_seconds=5, error_ttl_seconds=2)
+    def lookup(key):
+        calls.append(key)
+        raise LookupFailed(key)
+
+    raised = []
+    for _ in range(3):
+        try:
+            lookup("flaky")
+        except LookupFailed as e:
+            raised.append(e)
+    assert len(calls) == 1
+    assert [e.args for e in raised] == [("flaky",)] * 3
+    #Every hit raises a fresh exception, the traceback does not grow from hit to hit
+    assert raised[1] is not raised[2]
+    assert _traceback_length(raised[1]) == _traceback_length(raised[2])
+
+    FakeClock.advance(3)
+    try:
+        lookup("flaky")
+    except LookupFailed:
+        pass
+    assert len(calls) == 2
+    print("✓ test_error_is_cached_for_error_ttl passed")
+
+
+@_with_fake_clock
+def test_degraded_result_uses_error_ttl():
+    calls = []
+
+    @cached_with_ttl(ttl_seconds=60, error_ttl_seconds=2, is_degraded=lambda result: result["partial"])
+    def lookup(key):
+        calls.append(key)
+        return {"key": key, "partial": len(calls) == 1}
+
+    assert lookup("a")["partial"]
+    FakeClock.advance(1)
+    lookup("a")
+    assert len(calls) == 1
+
+    #Fetched again once the error TTL is over, the complete result is then kept for the full TTL
+    FakeClock.advance(2)
+    assert not lookup("a")["partial"]
+    FakeClock.advance(30)
+    lookup("a")
+    assert len(calls) == 2
+    print("✓ test_degraded_result_uses_error_ttl passed")
+
+
+@_with_fake_clock
+def test_error_is_not_cached_by_default():
+    calls = []
+
+    @cached_with_ttl(ttl_seconds=60)
+    def lookup(key):
+        calls.append(key)
+        raise ValueError(key)
+
+    for _ in range(2):
+        try:
+            lookup("flaky")
+        except ValueError:
+            pass
+    assert len(calls) == 2
+    print("✓ test_error_is_not_cached_by_default passed")
+
+
+def _counting_versioned_read(namespace: str):
+    calls = []
+
+    @cached_with_version(namespace)
+    def read(key):
+        calls.append(key)
+        return f"{key}-{len(calls)}"
+
+    return read, calls
+
+
+def test_versioned_cache_serves_until_version_changes():
+    clear_cache()
+    read, calls = _counting_versioned_read("test_version")
+    set_cache_version("test_version", 1)
+    assert read("a") == read("a") == "a-1"
+    assert len(calls) == 1
+
+    #What the change listener does on NOTIFY
+    set_cache_version("test_version", 2)
+    assert read("a") == "a-2"
+    assert read("a") == "a-2"
+    assert len(calls) == 2
+    print("✓ test_versioned_cache_serves_until_version_changes passed")
+
+
+def test_versioned_cache_invalidated_by_local_write():
+    clear_cache()
+    read, calls = _counting_versioned_read("test_generation")
+    set_cache_version("test_generation", 1)
+    read("a")
+    #What every write does after committing, before its NOTIFY comes back
+    bump_cache_generation("test_generation")
+    assert read("a") == "a-2"
+    assert len(calls) == 2
+    #Other namespaces are not affected
+    bump_cache_generation("test_other")
+    read("a")
+    assert len(calls) == 2
+    print("✓ test_versioned_cache_invalidated_by_local_write passed")
+
+
+def test_versioned_cache_off_without_version():
+    clear_cache()
+    read, calls = _counting_versioned_read("test_off")
+    #Unknown version (listener not connected yet, or failed): every read goes to the database
+    read("a")
+    read("a")
+    assert len(calls) == 2
+
+    set_cache_version("test_off", 1)
+    read("a")
+    read("a")
+    assert len(calls) == 3
+
+    set_cache_version("test_off", None)
+    read("a")
+    assert len(calls) == 4
+    print("✓ test_versioned_cache_off_without_version passed")
+
+
+def test_add_to_read_list_ignores_stale_cache():
+    from services import read_list_service
+    from services.read_list_service import READ_LIST_CACHE, add_to_read_list, get_read_list_entry
+
+    existing = {"id": 7, "book_external_id": "OL1W", "title": "Book", "author": "Author", "description": None,
+                "cover_i": None, "status": 1, "created_at": None, "updated_at": None}
+    rows = {}
+
+    #The database: another worker already added the book, our cache does not know yet
+    def execute_one(query, params=None, prepare=None):
+        text = query.as_string(None)
+        if "INSERT INTO read_list" in text:
+            return None if params[0] in rows else dict(existing, book_external_id=params[0], status=0)
+        if "r.book_external_id = %s" in text:
+            return dict(rows[params[0]]) if params[0] in rows else None
+        raise AssertionError(f"Unexpected query: {text}")
+
+    clear_cache()
+    real_execute_one = read_list_service.execute_one
+    read_list_service.execute_one = execute_one
+    try:
+        set_cache_version(READ_LIST_CACHE, 1)
+        assert get_read_list_entry("OL1W") is None
+        rows["OL1W"] = existing
+
+        entry = add_to_read_list("OL1W", "Book", None, "Author", None, 0)
+        assert entry["id"] == 7 and entry["status"] == "READING"
+    finally:
+        read_list_service.execute_one = real_execute_one
+        set_cache_version(READ_LIST_CACHE, None)
+        clear_cache()
+    print("✓ test_add_to_read_list_ignores_stale_cache passed")
+
+
+def _traceback_length(error: BaseException) -> int:
+    length = 0
+    tb = error.__traceback__
+    while tb is not None:
+        length += 1
+        tb = tb.tb_next
+    return length
+
+
+def run_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_found_result_is_cached_for_ttl,
+        test_not_found_result_uses_negative_ttl,
+        test_error_is_cached_for_error_ttl,
+        test_degraded_result_uses_error_ttl,
+        test_error_is_not_cached_by_default,
+        test_versioned_cache_serves_until_version_changes,
+        test_versioned_cache_invalidated_by_local_write,
+        test_versioned_cache_off_without_version,
+        test_add_to_read_list_ignores_stale_cache
+    ]
+
+    passed = 0
+    failed = 0
+
+    print("Running BookOn cache tests...")
+    print("=" * 40)
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+            failed += 1
+
+    print("=" * 40)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("All tests passed!")
+        return 0
+    else:
+        print("Some tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(run_tests())
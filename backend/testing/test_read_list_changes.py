@@ -0,0 +1,189 @@
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+
+#Unit tests for the reading list change feed, the database is replaced by an in-memory change log
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from services import read_list_service, read_list_feed_service
+from services.read_list_service import get_read_list_changes_since
+
+
+class FakeChangeLog:
+    def __init__(self, latest_version, changes, entries):
+        self.latest_version = latest_version
+        self.changes = changes  #(version, entry_id, op), what is left after pruning
+        self.entries = entries  #entry id -> read_list row, what exists now
+
+    def execute_one(self, query, params=None, prepare=None):
+        text = query.as_string(None)
+        if "read_list_version()" in text:
+            return {"version": self.latest_version}
+        if "MIN(version)" in text:
+            return {"oldest": min((version for version, _, _ in self.changes), default=None)}
+        raise AssertionError(f"Unexpected query: {text}")
+
+    def execute_query(self, query, params=None, prepare=None):
+        text = query.as_string(None)
+        if "DISTINCT ON (entry_id)" in text:
+            since, latest = params
+            latest_per_entry = {}
+            for version, entry_id, op in sorted(self.changes):
+                if since < version <= latest:
+                    latest_per_entry[entry_id] = {"version": version, "entry_id": entry_id, "op": op}
+            return sorted(latest_per_entry.values(), key=lambda change: change["version"])
+        if "r.id = ANY" in text:
+            return [dict(self.entries[entry_id]) for entry_id in params[0] if entry_id in self.entries]
+        raise AssertionError(f"Unexpected query: {text}")
+
+
+def _entry(entry_id, status=0):
+    return {"id": entry_id, "book_external_id": f"OL{entry_id}W", "title": f"Book {entry_id}", "author": "Author",
+            "description": None, "cover_i": None, "status": status, "created_at": None, "updated_at": None}
+
+
+@contextmanager
+def _change_log(latest_version, changes, entries):
+    change_log = FakeChangeLog(latest_version, changes, entries)
+    real_execute_one, real_execute_query = read_list_service.execute_one, read_list_service.execute_query
+    read_list_service.execute_one = change_log.execute_one
+    read_list_service.execute_query = change_log.execute_query
+    try:
+        yield
+    finally:
+        read_list_service.execute_one, read_list_service.execute_query = real_execute_one, real_execute_query
+
+
+def test_up_to_date_client_gets_no_changes():
+    with _change_log(5, [(4, 1, "insert"), (5, 2, "insert")], {1: _entry(1), 2: _entry(2)}):
+        assert get_read_list_changes_since(5) == {"version": 5, "reset": False, "changes": []}
+    print("✓ test_up_to_date_client_gets_no_changes passed")
+
+
+def test_latest_change_per_entry_oldest_first():
+    changes = [(3, 1, "insert"), (4, 2, "insert"), (5, 1, "update"), (6, 3, "insert"), (7, 3, "delete")]
+    with _change_log(7, changes, {1: _entry(1, status=2), 2: _entry(2)}):
+        delta = get_read_list_changes_since(2)
+    assert delta["version"] == 7 and not delta["reset"]
+    assert [(c["version"], c["id"], c["op"]) for c in delta["changes"]] == [(4, 2, "insert"), (5, 1, "update"), (7, 3, "delete")]
+    assert delta["changes"][1]["entry"]["status"] == "DONE"
+    assert delta["changes"][2]["entry"] is None
+    print("✓ test_latest_change_per_entry_oldest_first passed")
+
+
+def test_entry_deleted_after_its_change_is_sent_as_delete():
+    #The delete of entry 1 is committed but its change is not logged in our snapshot yet
+    with _change_log(3, [(3, 1, "update")], {}):
+        delta = get_read_list_changes_since(2)
+        assert [(c["id"], c["op"], c["entry"]) for c in delta["changes"]] == [(1, "delete", None)]
+    print("✓ test_entry_deleted_after_its_change_is_sent_as_delete passed")
+
+
+def test_pruned_history_resets():
+    with _change_log(10, [(8, 1, "insert"), (10, 1, "update")], {1: _entry(1)}):
+        assert get_read_list_changes_since(6) == {"version": 10, "reset": True, "changes": []}
+        #Right before the oldest kept change is still a delta
+        assert not get_read_list_changes_since(7)["reset"]
+    print("✓ test_pruned_history_resets passed")
+
+
+def test_fully_pruned_log_keeps_its_version():
+    #Pruning emptied the table, the version still comes from the sequence
+    with _change_log(10, [], {1: _entry(1)}):
+        assert get_read_list_changes_since(10) == {"version": 10, "reset": False, "changes": []}
+        assert get_read_list_changes_since(4) == {"version": 10, "reset": True, "changes": []}
+    print("✓ test_fully_pruned_log_keeps_its_version passed")
+
+
+def test_client_ahead_of_server_resets():
+    with _change_log(3, [(3, 1, "insert")], {1: _entry(1)}):
+        assert get_read_list_changes_since(9) == {"version": 3, "reset": True, "changes": []}
+    print("✓ test_client_ahead_of_server_resets passed")
+
+
+def test_stalled_subscriber_gets_reset():
+    async def scenario():
+        queue = read_list_feed_service.subscribe()
+        try:
+            for version in range(1, read_list_feed_service.SUBSCRIBER_QUEUE_SIZE + 2):
+                read_list_feed_service._broadcast({"version": version, "op": "insert", "id": version, "entry": None})
+            assert queue.qsize() == 1
+            return queue.get_nowait()
+        finally:
+            read_list_feed_service.unsubscribe(queue)
+
+    overflow = asyncio.run(scenario())
+    assert overflow["op"] == "reset"
+    assert overflow["version"] == read_list_feed_service.SUBSCRIBER_QUEUE_SIZE + 1
+    print("✓ test_stalled_subscriber_gets_reset passed")
+
+
+def test_change_log_pruned_periodically():
+    calls = []
+
+    def prune_read_list_changes():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("database down")
+        return 0
+
+    async def scenario():
+        pruner = asyncio.create_task(read_list_feed_service.run_change_pruner())
+        while len(calls) < 3:
+            await asyncio.sleep(0)
+        pruner.cancel()
+
+    real_prune, real_interval = read_list_feed_service.prune_read_list_changes, read_list_feed_service.PRUNE_INTERVAL_SECONDS
+    read_list_feed_service.prune_read_list_changes = prune_read_list_changes
+    read_list_feed_service.PRUNE_INTERVAL_SECONDS = 0
+    try:
+        #A failed pruning doesn't stop the next ones
+        asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    finally:
+        read_list_feed_service.prune_read_list_changes = real_prune
+        read_list_feed_service.PRUNE_INTERVAL_SECONDS = real_interval
+    assert len(calls) >= 3
+    print("✓ test_change_log_pruned_periodically passed")
+
+
+def run_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_up_to_date_client_gets_no_changes,
+        test_latest_change_per_entry_oldest_first,
+        test_entry_deleted_after_its_change_is_sent_as_delete,
+        test_pruned_history_resets,
+        test_fully_pruned_log_keeps_its_version,
+        test_client_ahead_of_server_resets,
+        test_stalled_subscriber_gets_reset,
+        test_change_log_pruned_periodically
+    ]
+
+    passed = 0
+    failed = 0
+
+    print("Running BookOn reading list change tests...")
+    print("=" * 40)
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} failed: {e}")
+            failed += 1
+
+    print("=" * 40)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if failed == 0:
+        print("All tests passed!")
+        return 0
+    else:
+        print("Some tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(run_tests())
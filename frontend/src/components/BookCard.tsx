@@ -121,7 +121,7 @@ export default function BookCard({ external_id, title, description, authors, cov
   };
 
   const coverUrl = cover_i 
-    ? `https://covers.openlibrary.org/b/id/${cover_i}-L.jpg`
+    ? `http://localhost:8000/api/covers/${cover_i}-L.jpg`
     : '/placeholder-book.png';
 
   const handleCardClick = () => {
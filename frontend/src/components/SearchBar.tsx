@@ -1,4 +1,5 @@
 import './SearchBar.css';
+import { useState, useEffect } from 'react';
 
 interface SearchBarProps {
   value: string;
@@ -9,6 +10,37 @@ interface SearchBarProps {
 
 //There is danger for him who taketh the tiger cub, and danger also for whoso snatches a delusion from a woman.
 export default function SearchBar({ value, onChange, onSearch, placeholder = 'There is danger for him who taketh the tiger cub, and danger also for whoso snatches a delusion from a woman.' }: SearchBarProps) {
+  const [suggestions, setSuggestions] = useState<string[]>([]);
+
+  //Typeahead from the local catalog, debounced so we don't query on every keystroke
+  useEffect(() => {
+    const prefix = value.trim();
+    if (prefix.length < 2) {
+      setSuggestions([]);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timeout = setTimeout(async () => {
+      try {
+        const response = await fetch(
+          `http://localhost:8000/api/suggest?q=${encodeURIComponent(prefix)}`,
+          { signal: controller.signal }
+        );
+        if (!response.ok) return;
+        const data = await response.json();
+        setSuggestions(data.suggestions?.map((book: any) => book.title) || []);
+      } catch {
+        //Suggestions are optional, the full search still works
+      }
+    }, 150);
+
+    return () => {
+      clearTimeout(timeout);
+      controller.abort();
+    };
+  }, [value]);
+
   const handleKeyDown = (e: React.KeyboardEvent<HTMLInputElement>) => {
     if (e.key === 'Enter' && onSearch) {
       onSearch(value);
@@ -31,7 +63,13 @@ export default function SearchBar({ value, onChange, onSearch, placeholder = 'Th
         value={value}
         onChange={(e) => onChange(e.target.value)}
         onKeyDown={handleKeyDown}
+        list="search-suggestions"
       />
+      <datalist id="search-suggestions">
+        {[...new Set(suggestions)].map(title => (
+          <option key={title} value={title} />
+        ))}
+      </datalist>
       <button 
         className="search-button"
         onClick={handleSearchClick}
@@ -13,6 +13,23 @@ interface ReadListEntry {
   updated_at: string;
 }
 
+interface ReadListChange {
+  version: number;
+  op: 'insert' | 'update' | 'delete' | 'reset';
+  id: number | null;
+  entry: ReadListEntry | null;
+}
+
+const toBookCard = (entry: ReadListEntry): ReadBookCardProps => ({
+  read_list_id: entry.id,
+  external_id: entry.book_external_id,
+  title: entry.title,
+  description: entry.description || '',
+  authors: [entry.author],
+  cover_i: entry.cover_i ? entry.cover_i : undefined,
+  status: entry.status
+});
+
 export interface ReadBookCardProps extends BookCardProps {
   read_list_id: number;
 }
@@ -39,6 +56,7 @@ export function ReadingListProvider({ children }: ReadingListProviderProps) {
   const [books, setBooks] = useState<ReadBookCardProps[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [version, setVersion] = useState<number | null>(null);
 
   const fetchReadingList = async () => {
     try {
@@ -50,18 +68,14 @@ export function ReadingListProvider({ children }: ReadingListProviderProps) {
       }
       
       const data: ReadListEntry[] = await response.json();
-      const bookCards: ReadBookCardProps[] = data.map(entry => ({
-        read_list_id: entry.id,
-        external_id: entry.book_external_id,
-        title: entry.title,
-        description: entry.description || '',
-        authors: [entry.author],
-        cover_i: entry.cover_i ? entry.cover_i : undefined,
-        status: entry.status
-      }));
+      const bookCards: ReadBookCardProps[] = data.map(toBookCard);
       
       setBooks(bookCards);
       setError(null);
+      const listVersion = response.headers.get('X-Reading-List-Version');
+      if (listVersion !== null) {
+        setVersion(Number(listVersion));
+      }
     } catch (err) {
       setError(err instanceof Error ? err.message : 'An error occurred');
     } finally {
@@ -73,6 +87,33 @@ export function ReadingListProvider({ children }: ReadingListProviderProps) {
     fetchReadingList();
   }, []);
 
+  //Live changes from the server, only small diffs instead of refetching the whole list
+  //EventSource reconnects on its own and resends the last version it saw
+  useEffect(() => {
+    if (version === null) return;
+
+    const events = new EventSource(`http://localhost:8000/api/reading-list/events?since=${version}`);
+
+    const applyChange = (event: MessageEvent) => {
+      const change: ReadListChange = JSON.parse(event.data);
+      if (change.op === 'reset') {
+        fetchReadingList();
+        return;
+      }
+      if (change.op === 'delete' || !change.entry) {
+        setBooks(prevBooks => prevBooks.filter(book => book.read_list_id !== change.id));
+        return;
+      }
+      const changedBook = toBookCard(change.entry);
+      setBooks(prevBooks => prevBooks.some(book => book.read_list_id === changedBook.read_list_id)
+        ? prevBooks.map(book => book.read_list_id === changedBook.read_list_id ? changedBook : book)
+        : [changedBook, ...prevBooks]);
+    };
+
+    ['insert', 'update', 'delete', 'reset'].forEach(op => events.addEventListener(op, applyChange));
+    return () => events.close();
+  }, [version]);
+
   const addBook = async (book: BookCardProps): Promise<boolean> => {
     try {
       const response = await fetch('http://localhost:8000/api/reading-list/', {
@@ -94,19 +135,11 @@ export function ReadingListProvider({ children }: ReadingListProviderProps) {
         throw new Error('Failed to add to reading list');
       }
       const data: ReadListEntry = await response.json();
-      const newBook: ReadBookCardProps = {
-        read_list_id: data.id,
-        external_id: data.book_external_id,
-        title: data.title,
-        description: data.description || '',
-        authors: [data.author],
-        cover_i: data.cover_i ? data.cover_i : undefined,
-        status: data.status
-      };
-
-
-      // Add book to local state
-      setBooks(prevBooks => [newBook, ...prevBooks]);
+      const newBook: ReadBookCardProps = toBookCard(data);
+
+
+      // Add book to local state (the change feed may have added it already)
+      setBooks(prevBooks => [newBook, ...prevBooks.filter(book => book.read_list_id !== newBook.read_list_id)]);
       return true;
     } catch (error) {
       console.error('Error adding to reading list:', error);
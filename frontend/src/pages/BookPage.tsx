@@ -117,7 +117,7 @@ export default function BookPage() {
 
   const getCoverUrl = (coverId?: number) => {
     if (!coverId) return '/placeholder-book.png';
-    return `https://covers.openlibrary.org/b/id/${coverId}-L.jpg`;
+    return `http://localhost:8000/api/covers/${coverId}-L.jpg`;
   };
 
   //if book is saved but details are not loaded yet, use basic info